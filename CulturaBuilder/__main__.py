@@ -42,7 +42,7 @@ try:
     )
     from setup.utils.logger import setup_logging, get_logger, LogLevel
     from setup import DEFAULT_INSTALL_DIR
-    from setup.managers.metrics_manager import MetricsManager
+    from setup.core.context import OperationContext
 except ImportError:
     # Provide minimal fallback functions and constants if imports fail
     class Colors:
@@ -55,6 +55,7 @@ except ImportError:
     def display_header(title, subtitle): print(f"{title} - {subtitle}")
     def get_logger(): return None
     def setup_logging(*args, **kwargs): pass
+    OperationContext = None
     class LogLevel:
         ERROR = 40
         INFO = 20
@@ -136,7 +137,9 @@ def get_operation_modules() -> Dict[str, str]:
         "install": "Install CulturaBuilder framework components",
         "update": "Update existing CulturaBuilder installation",
         "uninstall": "Remove CulturaBuilder installation",
-        "backup": "Backup and restore operations"
+        "backup": "Backup and restore operations",
+        "mcp": "Manage MCP server packages",
+        "metrics": "View and manage usage metrics"
     }
 
 
@@ -230,9 +233,12 @@ def main() -> int:
         setup_global_environment(args)
         logger = get_logger()
         
+        # Objects shared by everything this invocation does
+        context = OperationContext.from_args(args) if OperationContext else None
+        
         # Initialize metrics manager if available
         try:
-            metrics_manager = MetricsManager(args.install_dir)
+            metrics_manager = context.metrics_manager
             operation = args.operation
             # Extract flags from args
             flags = []
@@ -252,7 +258,7 @@ def main() -> int:
         if run_func:
             if logger:
                 logger.info(f"Executing operation: {args.operation}")
-            result = run_func(args)
+            result = run_func(args, context)
             
             # Record successful operation
             if metrics_manager and start_time:
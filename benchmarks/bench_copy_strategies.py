@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+Benchmark FileManager copy strategies on a synthetic tree
+
+Builds a tree of small files (10k by default) and copies it once per copy
+strategy, comparing against the plain shutil.copy2 baseline.
+
+Usage:
+    python benchmarks/bench_copy_strategies.py [--files N] [--size BYTES] [--dir PATH]
+"""
+
+import argparse
+import os
+import shutil
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import List, Optional
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from setup.managers.copy_engine import CopyEngine  # noqa: E402
+
+
+def build_tree(root: Path, file_count: int, file_size: int) -> List[Path]:
+    """Create file_count files of file_size bytes spread over 100 directories"""
+    files = []
+    payload = os.urandom(file_size)
+    for index in range(file_count):
+        directory = root / f"dir{index % 100:03d}"
+        directory.mkdir(parents=True, exist_ok=True)
+        path = directory / f"file{index:05d}.md"
+        path.write_bytes(payload)
+        files.append(path)
+    return files
+
+
+def copy_tree(files: List[Path], source_root: Path, target_root: Path,
+              engine: Optional[CopyEngine]) -> float:
+    """Copy every file, returning elapsed seconds"""
+    start = time.perf_counter()
+    for path in files:
+        target = target_root / path.relative_to(source_root)
+        target.parent.mkdir(parents=True, exist_ok=True)
+        if engine is None:
+            shutil.copy2(path, target)
+        else:
+            engine.copy(path, target)
+    return time.perf_counter() - start
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--files", type=int, default=10000, help="Number of files (default: 10000)")
+    parser.add_argument("--size", type=int, default=4096, help="Bytes per file (default: 4096)")
+    parser.add_argument("--dir", type=Path, help="Scratch directory (default: system temp)")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory(dir=args.dir) as scratch:
+        scratch_path = Path(scratch)
+        source_root = scratch_path / "source"
+        files = build_tree(source_root, args.files, args.size)
+        total_mb = args.files * args.size / (1024 * 1024)
+
+        print(f"Copying {args.files} files ({total_mb:.1f} MB) under {scratch_path}")
+        print(f"{'strategy':<18}{'seconds':>10}{'files/s':>12}  used")
+
+        runs = [("shutil.copy2", None)]
+        for strategy in CopyEngine.STRATEGIES:
+            if CopyEngine.is_available(strategy):
+                runs.append((strategy, CopyEngine([strategy])))
+        runs.append(("auto", CopyEngine()))
+
+        for name, engine in runs:
+            target_root = scratch_path / f"target-{name}"
+            elapsed = copy_tree(files, source_root, target_root, engine)
+            used = ""
+            if engine is not None:
+                used = ", ".join(f"{k}={v}" for k, v in engine.get_counts().items() if v)
+            print(f"{name:<18}{elapsed:>10.3f}{args.files / elapsed:>12.0f}  {used}")
+            shutil.rmtree(target_root)
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
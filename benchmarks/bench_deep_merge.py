@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+Benchmark settings deep merge: full deepcopy merge vs copy-on-write merge
+
+Builds a settings document of the requested size (permission rules and hook
+entries, like large real-world settings.json files) and merges a small
+component patch into it, the way update_settings/update_metadata do.
+
+Usage:
+    python benchmarks/bench_deep_merge.py [--size-mb N] [--rounds N]
+"""
+
+import argparse
+import copy
+import json
+import sys
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from setup.managers.settings_manager import SettingsManager  # noqa: E402
+
+
+def build_settings(size_mb: float) -> Dict[str, Any]:
+    """Generate a settings document of roughly size_mb megabytes (as JSON)"""
+    settings: Dict[str, Any] = {
+        "permissions": {"allow": [], "deny": []},
+        "hooks": {"PreToolUse": [], "PostToolUse": []},
+        "env": {},
+    }
+    target = int(size_mb * 1024 * 1024)
+    index = 0
+    while len(json.dumps(settings)) < target:
+        for offset in range(500):
+            n = index + offset
+            settings["permissions"]["allow"].append(f"Bash(npm run script-{n}:*)")
+            settings["permissions"]["deny"].append(f"Read(./secrets/file-{n}.env)")
+            settings["hooks"]["PreToolUse"].append({
+                "matcher": f"Tool{n}",
+                "hooks": [{"type": "command", "command": f"python3 ~/.claude/hooks/check_{n}.py", "timeout": 30}]
+            })
+            settings["env"][f"VAR_{n}"] = f"value-{n}"
+        index += 500
+    return settings
+
+
+def deepcopy_merge(base: Dict[str, Any], overlay: Dict[str, Any]) -> Dict[str, Any]:
+    """The previous _deep_merge: deep-copies base at every level"""
+    result = copy.deepcopy(base)
+    for key, value in overlay.items():
+        if key in result and isinstance(result[key], dict) and isinstance(value, dict):
+            result[key] = deepcopy_merge(result[key], value)
+        else:
+            result[key] = copy.deepcopy(value)
+    return result
+
+
+PATCH = {
+    "components": {"core": {"version": "3.0.0", "category": "core", "files_count": 8}},
+    "framework": {"version": "3.0.0", "name": "CulturaBuilder"},
+    "env": {"CULTURABUILDER_ENABLED": "1"},
+}
+
+
+def run(name: str, merge: Callable[[Dict[str, Any], Dict[str, Any]], Dict[str, Any]],
+        base: Dict[str, Any], rounds: int) -> Dict[str, Any]:
+    start = time.perf_counter()
+    for _ in range(rounds):
+        merged = merge(base, PATCH)
+    elapsed = (time.perf_counter() - start) / rounds
+    print(f"{name:<16}{elapsed * 1000:>12.3f}")
+    return merged
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--size-mb", type=float, default=4.0, help="Settings document size (default: 4)")
+    parser.add_argument("--rounds", type=int, default=10, help="Merges per variant (default: 10)")
+    args = parser.parse_args()
+
+    base = build_settings(args.size_mb)
+    snapshot = json.dumps(base, sort_keys=True)
+    print(f"settings: {len(snapshot) / (1024 * 1024):.1f} MB, patch: {len(json.dumps(PATCH))} bytes")
+    print(f"{'merge':<16}{'ms/merge':>12}")
+
+    before = run("deepcopy", deepcopy_merge, base, args.rounds)
+    after = run("copy-on-write", SettingsManager(Path("."))._deep_merge, base, args.rounds)
+
+    if json.dumps(before, sort_keys=True) != json.dumps(after, sort_keys=True):
+        print("warning: merge results differ")
+    if json.dumps(base, sort_keys=True) != snapshot:
+        print("warning: base document was modified")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+Benchmark copy_directory ignore matching: per-pattern fnmatch vs IgnoreMatcher
+
+Builds a tree (20k files by default) and runs the copytree ignore callable
+for every directory, the way shutil.copytree invokes it, without copying.
+
+Usage:
+    python benchmarks/bench_ignore_matcher.py [--files N] [--patterns N] [--dir PATH]
+"""
+
+import argparse
+import fnmatch
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable, Dict, List
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from setup.utils.ignore import IgnoreMatcher  # noqa: E402
+
+DEFAULT_IGNORES = ['.git', '.gitignore', '__pycache__', '*.pyc', '.DS_Store']
+
+
+def build_tree(root: Path, file_count: int) -> None:
+    """Create a nested tree of empty files with a mix of extensions"""
+    extensions = ['.md', '.py', '.pyc', '.json', '.txt']
+    for index in range(file_count):
+        directory = root / f"pkg{index % 20:02d}" / f"mod{index % 200:03d}"
+        directory.mkdir(parents=True, exist_ok=True)
+        (directory / f"file{index:05d}{extensions[index % len(extensions)]}").touch()
+
+
+def make_patterns(count: int) -> List[str]:
+    """Generate extra ignore patterns that mostly do not match"""
+    return [f"*.tmp{index}" for index in range(count)]
+
+
+def fnmatch_ignore(source: Path, patterns: List[str]) -> Callable[[str, List[str]], List[str]]:
+    """The previous copy_directory ignore function"""
+    def ignore_func(directory: str, contents: List[str]) -> List[str]:
+        ignored = []
+        for item in contents:
+            item_path = Path(directory) / item
+            rel_path = item_path.relative_to(source)
+            for pattern in patterns:
+                if fnmatch.fnmatch(item, pattern) or fnmatch.fnmatch(str(rel_path), pattern):
+                    ignored.append(item)
+                    break
+        return ignored
+    return ignore_func
+
+
+def listing(root: Path) -> Dict[str, List[str]]:
+    """Directory -> names, as copytree would see them"""
+    return {directory: dirs + files for directory, dirs, files in os.walk(root)}
+
+
+def run(name: str, ignore: Callable[[str, List[str]], List[str]],
+        tree: Dict[str, List[str]], entries: int) -> int:
+    start = time.perf_counter()
+    ignored = sum(len(ignore(directory, names)) for directory, names in tree.items())
+    elapsed = time.perf_counter() - start
+    print(f"{name:<16}{elapsed:>10.3f}{entries / elapsed:>14.0f}{ignored:>10}")
+    return ignored
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--files", type=int, default=20000, help="Number of files (default: 20000)")
+    parser.add_argument("--patterns", type=int, default=20, help="Extra patterns (default: 20)")
+    parser.add_argument("--dir", type=Path, help="Scratch directory (default: system temp)")
+    args = parser.parse_args()
+
+    patterns = DEFAULT_IGNORES + make_patterns(args.patterns)
+
+    with tempfile.TemporaryDirectory(dir=args.dir) as scratch:
+        source = Path(scratch) / "source"
+        build_tree(source, args.files)
+        tree = listing(source)
+        entries = sum(len(names) for names in tree.values())
+
+        print(f"{entries} entries in {len(tree)} directories, {len(patterns)} patterns")
+        print(f"{'matcher':<16}{'seconds':>10}{'entries/s':>14}{'ignored':>10}")
+
+        before = run("fnmatch", fnmatch_ignore(source, patterns), tree, entries)
+        after = run("IgnoreMatcher", IgnoreMatcher(patterns).copytree_ignore(source), tree, entries)
+        if before != after:
+            print(f"warning: matchers disagree ({before} vs {after} ignored)")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+Benchmark JSON handling per file type: json with indent=2 vs json_codec
+
+Generates a document shaped like each file the installer reads and writes
+and times parsing and serialization with the previous code (json module,
+indent=2 everywhere) and with json_codec (orjson when installed, compact
+output for machine-owned files).
+
+Usage:
+    python benchmarks/bench_json_codec.py [--scale N] [--rounds N]
+
+Set CULTURABUILDER_JSON_BACKEND=stdlib to measure the fallback backend.
+"""
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Tuple
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from setup.utils import json_codec  # noqa: E402
+
+
+def make_settings(scale: int) -> Dict[str, Any]:
+    return {
+        "permissions": {"allow": [f"Bash(npm run task-{i}:*)" for i in range(200 * scale)],
+                        "deny": [f"Read(./secrets/{i}.env)" for i in range(50 * scale)]},
+        "hooks": {"PreToolUse": [{"matcher": f"Tool{i}", "hooks": [{"type": "command", "command": f"check_{i}.py"}]}
+                                 for i in range(50 * scale)]},
+        "env": {f"VAR_{i}": f"value-{i}" for i in range(50 * scale)},
+    }
+
+
+def make_metadata(scale: int) -> Dict[str, Any]:
+    return {
+        "framework": {"version": "3.0.0", "name": "CulturaBuilder"},
+        "components": {f"component-{i}": {"version": "3.0.0", "category": "core", "files_count": i,
+                                          "installed_at": "2026-01-01T00:00:00", "link_mode": "copy"}
+                       for i in range(10 * scale)},
+    }
+
+
+def make_metrics(scale: int) -> Dict[str, Any]:
+    return {
+        "usage": {"sessions": [{"start": "2026-01-01T00:00:00", "end": "2026-01-01T01:00:00",
+                                "commands": [f"cmd{j}" for j in range(10)]} for _ in range(300 * scale)]},
+        "performance": {"operations": [{"timestamp": "2026-01-01T00:00:00", "operation": f"op{i % 20}",
+                                        "duration": i * 0.001, "success": True} for i in range(2000 * scale)]},
+        "errors": {"recent": [{"timestamp": "2026-01-01T00:00:00", "type": "ValueError",
+                               "message": f"error {i}"} for i in range(100 * scale)]},
+    }
+
+
+def make_manifest(scale: int) -> Dict[str, Any]:
+    return {f"commands/cb/file-{i:05d}.md": f"{i:064x}" for i in range(500 * scale)}
+
+
+# (file type, document factory, written pretty by json_codec)
+FILE_TYPES: List[Tuple[str, Callable[[int], Dict[str, Any]], bool]] = [
+    ("settings.json", make_settings, True),
+    ("metadata", make_metadata, False),
+    ("metrics", make_metrics, False),
+    ("backup manifest", make_manifest, False),
+]
+
+
+def timed(func: Callable[[], Any], rounds: int) -> float:
+    start = time.perf_counter()
+    for _ in range(rounds):
+        func()
+    return (time.perf_counter() - start) / rounds * 1000
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--scale", type=int, default=10, help="Document size multiplier (default: 10)")
+    parser.add_argument("--rounds", type=int, default=20, help="Repetitions per measurement (default: 20)")
+    args = parser.parse_args()
+
+    print(f"json_codec backend: {json_codec.get_backend()}")
+    print(f"{'file type':<18}{'KB old':>9}{'KB new':>9}{'load old':>11}{'load new':>11}"
+          f"{'dump old':>11}{'dump new':>11}")
+
+    for name, factory, pretty in FILE_TYPES:
+        document = factory(args.scale)
+        old_text = json.dumps(document, indent=2, ensure_ascii=False)
+        new_data = json_codec.dumpb(document, pretty=pretty)
+
+        if json_codec.loads(new_data) != json.loads(old_text):
+            print(f"warning: {name} does not round-trip identically")
+
+        load_old = timed(lambda: json.loads(old_text), args.rounds)
+        load_new = timed(lambda: json_codec.loads(new_data), args.rounds)
+        dump_old = timed(lambda: json.dumps(document, indent=2, ensure_ascii=False), args.rounds)
+        dump_new = timed(lambda: json_codec.dumpb(document, pretty=pretty), args.rounds)
+
+        print(f"{name:<18}{len(old_text.encode('utf-8')) / 1024:>9.1f}{len(new_data) / 1024:>9.1f}"
+              f"{load_old:>10.2f}ms{load_new:>9.2f}ms{dump_old:>9.2f}ms{dump_new:>9.2f}ms")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""
+Benchmark MCP server cold start: npx versus node from a managed prefix
+
+Starts one MCP server package the ways CulturaBuilder can register it and
+measures the time from spawn until the server answers an `initialize`
+request (its first line of output). npx runs once with an empty
+npm cache (first session on a fresh machine) and once with a warm one
+(every later session); the local strategy runs the installed entry point
+with plain node.
+
+Usage:
+    python benchmarks/bench_mcp_cold_start.py [--package SPEC] [--from DIR] [--rounds N]
+
+With --from, the package is packed from a local package folder
+(<dir>/<name> or <dir>/@scope/<name>), so the benchmark needs no network.
+"""
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import List, Optional
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from setup.managers.npm_cache import NpmPackageCache  # noqa: E402
+from setup.managers.npm_prefix import NpmPrefix  # noqa: E402
+
+INITIALIZE = json.dumps({
+    "jsonrpc": "2.0",
+    "id": 1,
+    "method": "initialize",
+    "params": {
+        "protocolVersion": "2024-11-05",
+        "capabilities": {},
+        "clientInfo": {"name": "bench_mcp_cold_start", "version": "1.0"}
+    }
+}) + "\n"
+
+
+def time_to_ready(command: List[str], timeout: float) -> Optional[float]:
+    """Seconds until the server's first line of output, or None on timeout or failure"""
+    start = time.perf_counter()
+    process = subprocess.Popen(command, stdin=subprocess.PIPE, stdout=subprocess.PIPE,
+                               stderr=subprocess.DEVNULL, text=True)
+    first_line: List[str] = []
+    reader = threading.Thread(target=lambda: first_line.append(process.stdout.readline()), daemon=True)
+    reader.start()
+    try:
+        process.stdin.write(INITIALIZE)
+        process.stdin.flush()
+    except OSError:
+        pass  # Server exited before reading; its output still counts
+
+    reader.join(timeout)
+    elapsed = time.perf_counter() - start
+    process.kill()
+    process.wait()
+    if reader.is_alive() or not first_line or not first_line[0]:
+        return None
+    return elapsed
+
+
+def measure(name: str, command_for_round, rounds: int, timeout: float) -> None:
+    """Run one variant and print its timings"""
+    timings = []
+    for round_index in range(rounds):
+        elapsed = time_to_ready(command_for_round(round_index), timeout)
+        if elapsed is None:
+            print(f"{name:<28}{'failed':>10}")
+            return
+        timings.append(elapsed)
+    print(f"{name:<28}{statistics.median(timings):>10.3f}{min(timings):>10.3f}{max(timings):>10.3f}")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--package", default="@modelcontextprotocol/server-sequential-thinking",
+                        help="MCP server package (default: @modelcontextprotocol/server-sequential-thinking)")
+    parser.add_argument("--from", dest="source_dir", type=Path,
+                        help="Directory of local package folders to use instead of the registry")
+    parser.add_argument("--rounds", type=int, default=5, help="Starts per variant (default: 5)")
+    parser.add_argument("--timeout", type=float, default=60.0, help="Seconds to wait for a server (default: 60)")
+    parser.add_argument("--dir", type=Path, help="Scratch directory (default: system temp)")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory(dir=args.dir) as scratch:
+        scratch_path = Path(scratch)
+        cache = NpmPackageCache(scratch_path / "cache")
+        prefix = NpmPrefix(scratch_path / "prefix", cache if args.source_dir else None)
+
+        if args.source_dir:
+            entry = cache.prefetch(args.package, args.source_dir)
+            npx_target = ["--package", str(scratch_path / "cache" / "tarballs" / entry["filename"]),
+                          "--", entry["bin"]]
+        else:
+            npx_target = [args.package]
+
+        prefix.install([args.package])
+        local_command = prefix.command(args.package)
+        if local_command is None:
+            print(f"{args.package} declares no executable")
+            return 1
+
+        print(f"Starting {args.package} ({prefix.installed_version(args.package)}), "
+              f"{args.rounds} rounds, seconds until first response")
+        print(f"{'variant':<28}{'median':>10}{'min':>10}{'max':>10}")
+
+        # npx with a fresh npm cache each round, as on a new machine or after eviction
+        measure("npx -y (cold npm cache)",
+                lambda i: ["npx", "-y", "--cache", str(scratch_path / f"npx-cold-{i}")] + npx_target,
+                args.rounds, args.timeout)
+
+        warm_cache = str(scratch_path / "npx-warm")
+        time_to_ready(["npx", "-y", "--cache", warm_cache] + npx_target, args.timeout)
+        measure("npx -y (warm npm cache)",
+                lambda i: ["npx", "-y", "--cache", warm_cache] + npx_target,
+                args.rounds, args.timeout)
+
+        measure("node (local prefix)", lambda i: local_command, args.rounds, args.timeout)
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
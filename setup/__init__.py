@@ -16,4 +16,20 @@ PROFILES_DIR = PROJECT_ROOT / "profiles"
 
 # Installation target
 DEFAULT_INSTALL_DIR = Path.home() / ".claude"
+
+# Machine-owned caches kept inside the installation directory
+CACHE_DIR_NAME = ".culturabuilder-cache"
+
+# Read-only content store used by link-based installs (--link-mode)
+DEFAULT_CONTENT_STORE = Path.home() / ".cache" / "culturabuilder" / "store"
+LINK_MODES = ("copy", "symlink", "hardlink")
+
+# How MCP servers are started (--mcp-strategy): npx from the registry, npx from
+# prefetched packages, or node from packages installed into a managed prefix
+MCP_STRATEGIES = ("npx", "offline", "local")
+DEFAULT_NPM_CACHE_DIR = Path.home() / ".cache" / "culturabuilder" / "npm"
+MCP_PREFIX_DIR_NAME = ".culturabuilder-mcp"
+
+# Content hashes of config/profile files that already passed schema validation
+VALIDATION_CACHE_FILE = Path.home() / ".cache" / "culturabuilder" / "validated-config.json"
 # CulturaBuilder
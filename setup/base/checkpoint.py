@@ -0,0 +1,212 @@
+"""
+Installation checkpoints for resuming interrupted installs
+"""
+
+import os
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from ..utils import json_codec
+
+
+class InstallCheckpoint:
+    """
+    Progress of an installation, persisted after each component step and file batch
+
+    The state file lives in the installation directory and is removed once
+    an installation finishes successfully, so its presence means the last
+    run was interrupted (or failed) and can be resumed.
+    """
+
+    STATE_FILE = ".culturabuilder-install-state.json"
+
+    # Files recorded per state file write
+    FILE_BATCH_SIZE = 25
+
+    RUNNING = "running"
+    DONE = "done"
+
+    def __init__(self, install_dir: Path):
+        """
+        Initialize checkpoint
+
+        Args:
+            install_dir: Installation directory holding the state file
+        """
+        self.install_dir = install_dir
+        self.state_file = install_dir / self.STATE_FILE
+        self.state: Dict[str, Any] = {}
+        self.resuming = False
+
+    @classmethod
+    def load(cls, install_dir: Path) -> Optional["InstallCheckpoint"]:
+        """
+        Load the checkpoint of an unfinished installation
+
+        Args:
+            install_dir: Installation directory
+
+        Returns:
+            InstallCheckpoint or None if there is nothing to resume
+        """
+        checkpoint = cls(install_dir)
+        try:
+            checkpoint.state = json_codec.load_file(checkpoint.state_file)
+        except (OSError, ValueError):
+            return None
+        return checkpoint
+
+    @property
+    def components(self) -> List[str]:
+        """Components selected by the checkpointed installation"""
+        return list(self.state.get("components", []))
+
+    def start(self, components: List[str]) -> None:
+        """
+        Begin checkpointing a new installation
+
+        Args:
+            components: Components being installed, in install order
+        """
+        self.resuming = False
+        self.state = {
+            "started": datetime.now().isoformat(),
+            "components": list(components),
+            "steps": {}
+        }
+        self.save()
+
+    def resume(self, components: List[str]) -> None:
+        """
+        Continue checkpointing an unfinished installation
+
+        Args:
+            components: Components being installed; new ones are added to the state
+        """
+        self.resuming = True
+        self.state.setdefault("steps", {})
+        known = self.state.setdefault("components", [])
+        known.extend(name for name in components if name not in known)
+        self.state["resumed"] = datetime.now().isoformat()
+        self.save()
+
+    def _step(self, component: str) -> Dict[str, Any]:
+        return self.state["steps"].setdefault(component, {"status": self.RUNNING, "files": {}, "steps": []})
+
+    def component_started(self, component: str) -> None:
+        """Record that a component began installing"""
+        self._step(component)
+        self.save()
+
+    def component_done(self, component: str) -> None:
+        """Record that a component finished installing"""
+        self._step(component)["status"] = self.DONE
+        self.save()
+
+    def is_component_done(self, component: str) -> bool:
+        """
+        Check whether a component finished in a previous run
+
+        Args:
+            component: Component name
+
+        Returns:
+            True if the component completed and its files are unchanged
+        """
+        step = self.state.get("steps", {}).get(component)
+        if not step or step.get("status") != self.DONE:
+            return False
+        recorded = step.get("files", {})
+        return len(self.verified_files(component)) == len(recorded)
+
+    def record_files(self, component: str, files: Iterable[Tuple[Path, Path]]) -> None:
+        """
+        Record a batch of installed files
+
+        Args:
+            component: Component name
+            files: (source, target) tuples that were written
+        """
+        recorded = self._step(component)["files"]
+        for source, target in files:
+            try:
+                recorded[str(target)] = {"target": self._signature(target), "source": self._signature(source)}
+            except OSError:
+                recorded.pop(str(target), None)
+        self.save()
+
+    def verified_files(self, component: str) -> Dict[str, Dict[str, Any]]:
+        """
+        Get files written by a previous run that are still intact
+
+        The integrity check is a stat comparison of the target and its source
+        against what was recorded, so it costs no file reads.
+
+        Args:
+            component: Component name
+
+        Returns:
+            Dict of target path -> recorded signatures
+        """
+        verified = {}
+        recorded = self.state.get("steps", {}).get(component, {}).get("files", {})
+        for target, signatures in recorded.items():
+            source = signatures.get("source", {}).get("path")
+            try:
+                if (self._signature(Path(target)) == signatures.get("target")
+                        and source and self._signature(Path(source)) == signatures.get("source")):
+                    verified[target] = signatures
+            except OSError:
+                continue
+        return verified
+
+    def record_step(self, component: str, step: str) -> None:
+        """
+        Record a named step within a component (e.g. one MCP server)
+
+        Args:
+            component: Component name
+            step: Step name
+        """
+        steps = self._step(component)["steps"]
+        if step not in steps:
+            steps.append(step)
+        self.save()
+
+    def is_step_done(self, component: str, step: str) -> bool:
+        """
+        Check whether a named step finished in a previous run
+
+        Args:
+            component: Component name
+            step: Step name
+
+        Returns:
+            True if resuming and the step was recorded
+        """
+        return self.resuming and step in self.state.get("steps", {}).get(component, {}).get("steps", [])
+
+    def save(self) -> None:
+        """Write the state file atomically"""
+        self.install_dir.mkdir(parents=True, exist_ok=True)
+        temp_file = self.state_file.with_name(f"{self.state_file.name}.{os.getpid()}.tmp")
+        with open(temp_file, 'wb') as f:
+            f.write(json_codec.dumpb(self.state, pretty=False))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_file, self.state_file)
+
+    def clear(self) -> None:
+        """Remove the state file after a successful installation"""
+        try:
+            self.state_file.unlink()
+        except FileNotFoundError:
+            pass
+        self.state = {}
+
+    @staticmethod
+    def _signature(path: Path) -> Dict[str, Any]:
+        """Cheap identity of a file: path, size and modification time (links not followed)"""
+        st = os.lstat(path)
+        return {"path": str(path), "size": st.st_size, "mtime_ns": st.st_mtime_ns}
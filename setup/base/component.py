@@ -6,15 +6,23 @@ from abc import ABC, abstractmethod
 from typing import List, Dict, Tuple, Optional, Any
 from pathlib import Path
 import json
+import os
+from ..managers.content_store import ContentStore
 from ..managers.file_manager import FileManager
+from ..managers.hash_cache import HashCache
 from ..managers.settings_manager import SettingsManager
 from ..utils.logger import get_logger
 from ..utils.security import SecurityValidator
+from ..utils.walker import walk_tree
 
 
 class Component(ABC):
     """Base class for all installable components"""
     
+    # False for components whose installation changes state outside the
+    # installation directory; staged installs run them after the swap
+    STAGEABLE = True
+    
     def __init__(self, install_dir: Optional[Path] = None, component_subdir: Path = Path('')):
         """
         Initialize component with installation directory
@@ -22,13 +30,28 @@ class Component(ABC):
         Args:
             install_dir: Target installation directory (defaults to ~/.claude)
         """
-        from .. import DEFAULT_INSTALL_DIR
+        from .. import DEFAULT_INSTALL_DIR, CACHE_DIR_NAME
         self.install_dir = install_dir or DEFAULT_INSTALL_DIR
         self.settings_manager = SettingsManager(self.install_dir)
         self.logger = get_logger()
         self.component_files = self._discover_component_files()
-        self.file_manager = FileManager()
+        self.file_manager = FileManager(
+            hash_cache=HashCache.for_path(self.install_dir / CACHE_DIR_NAME / "file-hashes.json")
+        )
         self.install_component_subdir = self.install_dir / component_subdir
+        self.link_mode = "copy"
+        self.context = None
+    
+    def attach_context(self, context: Any) -> None:
+        """
+        Share the objects of the running operation with this component
+        
+        Args:
+            context: OperationContext of the running operation
+        """
+        self.context = context
+        if context.install_dir == self.install_dir:
+            self.settings_manager = context.settings_manager
     
     @abstractmethod
     def get_metadata(self) -> Dict[str, str]:
@@ -153,16 +176,48 @@ class Component(ABC):
         # Get files to install
         files_to_install = self.get_files_to_install()
 
-        # Copy framework files
+        # Link mode installs point at a shared read-only copy in the content store
+        self.link_mode = config.get("link_mode") or self._get_registered_link_mode()
+        store_files = {}
+        if self.link_mode != "copy":
+            store_files = self._prepare_content_store(files_to_install, config)
+
+        # Files a resumed installation already wrote (and that are unchanged)
+        checkpoint = config.get("checkpoint")
+        component_name = self.get_metadata()["name"]
+        done_files = {}
+        if checkpoint is not None and checkpoint.resuming:
+            done_files = checkpoint.verified_files(component_name)
+
+        # Copy (or link) framework files
         success_count = 0
+        batch = []
         for source, target in files_to_install:
-            self.logger.debug(f"Copying {source.name} to {target}")
+            if str(target) in done_files:
+                self.logger.debug(f"Skipping {source.name} (installed before the interruption)")
+                success_count += 1
+                continue
+
+            if self.link_mode != "copy":
+                self.logger.debug(f"Linking {target} to {store_files[source]} ({self.link_mode})")
+                installed = self.file_manager.link_file(store_files[source], target, self.link_mode)
+            else:
+                self.logger.debug(f"Copying {source.name} to {target}")
+                installed = self.file_manager.copy_file(source, target)
 
-            if self.file_manager.copy_file(source, target):
+            if installed:
                 success_count += 1
-                self.logger.debug(f"Successfully copied {source.name}")
+                self.logger.debug(f"Successfully installed {source.name}")
+                if checkpoint is not None:
+                    batch.append((source, target))
+                    if len(batch) >= checkpoint.FILE_BATCH_SIZE:
+                        checkpoint.record_files(component_name, batch)
+                        batch = []
             else:
-                self.logger.error(f"Failed to copy {source.name}")
+                self.logger.error(f"Failed to install {source.name}")
+
+        if checkpoint is not None and batch:
+            checkpoint.record_files(component_name, batch)
 
         if success_count != len(files_to_install):
             self.logger.error(f"Only {success_count}/{len(files_to_install)} files copied successfully")
@@ -173,6 +228,58 @@ class Component(ABC):
         return self._post_install()
 
     
+    def _prepare_content_store(self, files_to_install: List[Tuple[Path, Path]],
+                               config: Dict[str, Any]) -> Dict[Path, Path]:
+        """
+        Add component files to the content store for a link-based install
+        
+        Falls back to copy mode (updating self.link_mode) when the store cannot
+        be written, and from hardlinks to symlinks across filesystems.
+        
+        Args:
+            files_to_install: List of (source, target) tuples
+            config: Installation configuration
+            
+        Returns:
+            Dict of source path -> store path (empty in copy mode)
+        """
+        from .. import DEFAULT_CONTENT_STORE
+        source_dir = self._get_source_dir()
+        metadata = self.get_metadata()
+        store = ContentStore(Path(config.get("content_store") or DEFAULT_CONTENT_STORE))
+        
+        try:
+            files = [(source, source.relative_to(source_dir).as_posix()) for source, _ in files_to_install]
+            entry = store.ensure_component(metadata["name"], metadata["version"], files)
+        except Exception as e:
+            self.logger.warning(f"Content store unavailable ({e}), copying files instead")
+            self.link_mode = "copy"
+            return {}
+        
+        if self.link_mode == "hardlink":
+            if os.stat(entry).st_dev != os.stat(self.install_component_subdir).st_dev:
+                self.logger.warning("Content store is on another filesystem, using symlinks instead of hardlinks")
+                self.link_mode = "symlink"
+        
+        return {source: entry / name for source, name in files}
+    
+    def _get_registered_link_mode(self) -> str:
+        """Link mode of the existing installation, so updates keep it"""
+        registration = self.settings_manager.get_installed_components().get(self.get_metadata()["name"], {})
+        return registration.get("link_mode", "copy")
+    
+    def get_registration_info(self) -> Dict[str, Any]:
+        """
+        Get install details recorded with the component registration
+        
+        Returns:
+            Dict with link mode and file count
+        """
+        return {
+            "files_count": len(self.component_files),
+            "link_mode": self.link_mode
+        }
+    
     @abstractmethod
     def _post_install(self) -> bool:
         pass
@@ -259,7 +366,9 @@ class Component(ABC):
         
         # Check if all files exist
         for _, target in self.get_files_to_install():
-            if not target.exists():
+            if target.is_symlink() and not target.exists():
+                errors.append(f"Dangling link (content store entry removed?): {target}")
+            elif not target.exists():
                 errors.append(f"Missing file: {target}")
         
         # Check version in settings
@@ -268,6 +377,31 @@ class Component(ABC):
         
         return len(errors) == 0, errors
     
+    def verify_installed_files(self) -> Tuple[bool, List[str]]:
+        """
+        Verify installed files match their sources byte for byte
+        
+        Source and target files are hashed in parallel; missing targets are
+        left to validate_installation.
+        
+        Returns:
+            Tuple of (success: bool, error_messages: List[str])
+        """
+        files = [(source, target) for source, target in self.get_files_to_install()
+                 if source.is_file() and target.exists()]
+        if not files:
+            return True, []
+        
+        source_hashes = dict(self.file_manager.hash_files(source for source, _ in files))
+        expected = {target: source_hashes[source] for source, target in files if source_hashes.get(source)}
+        
+        errors = sorted(
+            f"File differs from source: {target}"
+            for target, matches in self.file_manager.verify_files(expected)
+            if not matches
+        )
+        return len(errors) == 0, errors
+    
     def get_size_estimate(self) -> int:
         """
         Estimate installed size in bytes
@@ -281,7 +415,8 @@ class Component(ABC):
                 if source.is_file():
                     total_size += source.stat().st_size
                 elif source.is_dir():
-                    total_size += sum(f.stat().st_size for f in source.rglob('*') if f.is_file())
+                    total_size += sum(entry.size for entry in walk_tree(source, include_dirs=False)
+                                      if entry.is_file)
         return total_size
 
     def _discover_component_files(self) -> List[str]:
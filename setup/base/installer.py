@@ -3,11 +3,24 @@ Base installer logic for CulturaBuilder installation system fixed some issues
 """
 
 from typing import List, Dict, Optional, Set, Tuple, Any
+from concurrent.futures import Executor
 from pathlib import Path
+import asyncio
+import contextlib
+import functools
 import shutil
 import tempfile
+import threading
 from datetime import datetime
+from .checkpoint import InstallCheckpoint
 from .component import Component
+from .staging import StagedInstall
+from ..managers.file_journal import FileJournal
+from ..managers.settings_manager import SettingsManager
+
+
+class InstallationCancelled(Exception):
+    """Raised inside install_components() when install_components_async() was cancelled"""
 
 
 class Installer:
@@ -33,6 +46,13 @@ class Installer:
         self.failed_components: Set[str] = set()
         self.skipped_components: Set[str] = set()
         self.backup_path: Optional[Path] = None
+        self.generation_path: Optional[Path] = None
+        self.validation_passed = True
+        self.journal: Optional[FileJournal] = None
+        self.checkpoint: Optional[InstallCheckpoint] = None
+        self._journal_mark = 0
+        # Set by install_components_async() when its task is cancelled
+        self._cancel_requested = threading.Event()
 
     def register_component(self, component: Component) -> None:
         """
@@ -203,6 +223,17 @@ class Installer:
         if component_name in self.installed_components:
             return True
 
+        # Skip if an interrupted run finished it and its files are intact
+        checkpoint = self.checkpoint
+        if checkpoint is not None and checkpoint.resuming and checkpoint.is_component_done(component_name):
+            print(f"Skipping {component_name} (completed before the interruption)")
+            # Its registration may have been part of the unfinished metadata transaction
+            if not component.settings_manager.is_component_installed(component_name):
+                component._post_install()
+            self.installed_components.add(component_name)
+            self.skipped_components.add(component_name)
+            return True
+
         # Check prerequisites
         success, errors = component.validate_prerequisites()
         if not success:
@@ -218,9 +249,15 @@ class Installer:
                 print(f"[DRY RUN] Would install {component_name}")
                 success = True
             else:
+                if checkpoint is not None:
+                    checkpoint.component_started(component_name)
                 success = component.install(config)
 
             if success:
+                if checkpoint is not None:
+                    checkpoint.component_done(component_name)
+                    if self.journal is not None:
+                        self._journal_mark = self.journal.mark()
                 self.installed_components.add(component_name)
                 self.updated_components.add(component_name)
             else:
@@ -239,6 +276,9 @@ class Installer:
         """
         Install multiple components in dependency order
         
+        With config["resume"], work recorded by the checkpoint of an interrupted
+        run is skipped, as are the requirement checks and the backup.
+        
         Args:
             component_names: List of component names to install
             config: Installation configuration
@@ -246,7 +286,8 @@ class Installer:
         Returns:
             True if all successful, False if any failed
         """
-        config = config or {}
+        config = dict(config or {})
+        resume = config.get("resume", False) and not self.dry_run
 
         # Resolve dependencies
         try:
@@ -255,32 +296,306 @@ class Installer:
             print(f"Dependency resolution error: {e}")
             return False
 
-        # Validate system requirements
-        success, errors = self.validate_system_requirements()
-        if not success:
-            print("System requirements not met:")
-            for error in errors:
-                print(f"  - {error}")
-            return False
+        # Validate system requirements (already done by the run being resumed)
+        if not resume:
+            success, errors = self.validate_system_requirements()
+            if not success:
+                print("System requirements not met:")
+                for error in errors:
+                    print(f"  - {error}")
+                return False
+
+        # Undo file changes of an installation that was interrupted
+        # (only its unfinished operations when resuming it)
+        if not self.dry_run:
+            self.recover_interrupted(pending_only=resume)
 
-        # Create backup if updating
-        if self.install_dir.exists() and not self.dry_run:
+        # Create backup if updating (the run being resumed already made one)
+        if self.install_dir.exists() and not self.dry_run and not resume and config.get("backup", True):
             print("Creating backup of existing installation...")
             self.create_backup()
 
-        # Install each component
+        if not self.dry_run:
+            self._begin_checkpoint(ordered_names, resume)
+            config["checkpoint"] = self.checkpoint
+            self._begin_journal()
+
+        # Install each component, collecting metadata changes into one write
         all_success = True
-        for name in ordered_names:
-            print(f"\nInstalling {name}...")
-            if not self.install_component(name, config):
-                all_success = False
-                # Continue installing other components even if one fails
+        if self.dry_run:
+            metadata_transaction = contextlib.nullcontext()
+        else:
+            metadata_transaction = SettingsManager(self.install_dir).transaction()
+        try:
+            with metadata_transaction:
+                for name in ordered_names:
+                    if self._cancel_requested.is_set():
+                        raise InstallationCancelled()
+                    print(f"\nInstalling {name}...")
+                    if not self.install_component(name, config):
+                        all_success = False
+                        # Continue installing other components even if one fails
+        except InstallationCancelled:
+            print("Installation cancelled, rolling back unfinished file changes...")
+            self._abort_journal()
+            self.checkpoint = None
+            return False
+        except BaseException:
+            # Interrupted (e.g. Ctrl+C): undo now rather than on the next run
+            self._abort_journal()
+            raise
+        self._end_journal()
 
         if not self.dry_run:
             self._run_post_install_validation()
 
+        if self.checkpoint is not None and all_success:
+            self.checkpoint.clear()
+        self.checkpoint = None
+
         return all_success
 
+    async def install_components_async(self,
+                                       component_names: List[str],
+                                       config: Optional[Dict[str, Any]] = None,
+                                       executor: Optional[Executor] = None) -> bool:
+        """
+        Awaitable install_components() that runs on an executor
+        
+        Cancelling the awaiting task stops the installation at the next
+        component boundary (the component being installed at that moment
+        finishes first). Finished components keep their files and stay
+        recorded in the checkpoint, so the installation can be resumed.
+        
+        Args:
+            component_names: List of component names to install
+            config: Installation configuration
+            executor: Executor to run on (the loop's default executor if None);
+                      pass a bounded executor to limit concurrent installations
+            
+        Returns:
+            True if all successful, False if any failed
+        """
+        loop = asyncio.get_running_loop()
+        self._cancel_requested.clear()
+        future = loop.run_in_executor(
+            executor, functools.partial(self.install_components, component_names, config)
+        )
+        try:
+            return await asyncio.shield(future)
+        except asyncio.CancelledError:
+            self._cancel_requested.set()
+            try:
+                await future
+            except Exception:
+                pass
+            raise
+
+    def install_components_staged(self,
+                                  component_names: List[str],
+                                  config: Optional[Dict[str, Any]] = None) -> bool:
+        """
+        Install components into a staging directory, validate them there and
+        swap them into the installation directory
+        
+        The live installation is only touched once everything installed and
+        validated; the replaced files are kept as a generation for rollback(),
+        so no tar backup is created. Components that are not STAGEABLE (their
+        installation changes state outside the installation directory, e.g.
+        MCP server registrations) are installed into the live directory after
+        the swap; discarding the staging directory or rolling back the
+        generation does not undo them.
+        
+        Args:
+            component_names: List of component names to install
+            config: Installation configuration
+            
+        Returns:
+            True if all components were installed and swapped in
+        """
+        if self.dry_run:
+            return self.install_components(component_names, config)
+        
+        config = dict(config or {})
+        config["backup"] = False
+        
+        try:
+            ordered_names = self.resolve_dependencies(component_names)
+        except ValueError as e:
+            print(f"Dependency resolution error: {e}")
+            return False
+        staged_names = [name for name in ordered_names if self.components[name].STAGEABLE]
+        live_names = [name for name in ordered_names if not self.components[name].STAGEABLE]
+        
+        staging = StagedInstall(self.install_dir)
+        live_dir = self.install_dir
+        live_components = self.components
+        
+        try:
+            staging.prepare()
+            
+            # Build fresh component instances rooted in the staging directory,
+            # sharing the operation's context and one staging settings manager
+            staging_settings = SettingsManager(staging.staging_dir)
+            self.install_dir = staging.staging_dir
+            self.components = {}
+            for name, component in live_components.items():
+                staged = type(component)(staging.staging_dir)
+                if component.context is not None:
+                    staged.attach_context(component.context)
+                staged.settings_manager = staging_settings
+                self.components[name] = staged
+            for name in staged_names:
+                staging.add_component(self.components[name])
+            
+            success = self.install_components(staged_names, config) if staged_names else True
+            if success and staged_names and not self.validation_passed:
+                print("Staged installation failed validation, live installation left untouched")
+                success = False
+        except Exception as e:
+            print(f"Error preparing staged installation: {e}")
+            success = False
+        finally:
+            self.install_dir = live_dir
+            self.components = live_components
+        
+        if not success:
+            staging.discard()
+            return False
+        
+        generation = None
+        if staged_names:
+            try:
+                generation = staging.commit()
+                self.generation_path = generation
+            except Exception as e:
+                print(f"Error swapping staged installation into place (rolled back): {e}")
+                staging.discard()
+                return False
+        else:
+            staging.discard()
+        
+        if live_names:
+            print(f"\nInstalling {', '.join(live_names)} into the live installation "
+                  f"(changes outside the installation directory cannot be staged)...")
+            success = self.install_components(live_names, config)
+            if generation is not None:
+                # Their metadata changes belong to the same installation
+                staging.record_state(generation)
+        
+        return success
+    
+    def get_journal_dir(self) -> Path:
+        """Get directory holding file operation journals"""
+        from .. import CACHE_DIR_NAME
+        return self.install_dir / CACHE_DIR_NAME / "journal"
+
+    def recover_interrupted(self, pending_only: bool = False) -> int:
+        """
+        Roll back file changes recorded by installations that never finished
+        
+        Args:
+            pending_only: Keep completed operations and only undo the unfinished
+                          ones, so the installation can be resumed
+        
+        Returns:
+            Number of interrupted installations rolled back
+        """
+        recovered = 0
+        for journal in FileJournal.find_incomplete(self.get_journal_dir()):
+            if pending_only:
+                print(f"Recovering interrupted installation {journal.txid} "
+                      f"({len(journal.pending())} unfinished file operations)...")
+            else:
+                print(f"Rolling back interrupted installation {journal.txid} "
+                      f"({len(journal.intents)} file operations)...")
+            errors = journal.rollback(pending_only=pending_only)
+            for error in errors:
+                print(f"  - {error}")
+            recovered += 1
+        return recovered
+
+    def _begin_checkpoint(self, ordered_names: List[str], resume: bool) -> None:
+        """Start (or continue, when resuming) checkpointing this installation"""
+        checkpoint = InstallCheckpoint.load(self.install_dir) if resume else None
+        try:
+            if checkpoint is not None:
+                checkpoint.resume(ordered_names)
+            else:
+                if resume:
+                    print("No interrupted installation found, installing from scratch")
+                checkpoint = InstallCheckpoint(self.install_dir)
+                checkpoint.start(ordered_names)
+        except OSError as e:
+            print(f"Warning: Could not write installation checkpoint, resume will not be possible: {e}")
+            checkpoint = None
+        self.checkpoint = checkpoint
+
+    def _begin_journal(self) -> None:
+        """Start a journal and attach it to every component's file manager"""
+        try:
+            self.journal = FileJournal.begin(self.get_journal_dir())
+        except OSError as e:
+            print(f"Warning: Could not create file journal, continuing without it: {e}")
+            self.journal = None
+            return
+        for component in self.components.values():
+            component.file_manager.attach_journal(self.journal)
+        self._journal_mark = 0
+
+    def _abort_journal(self) -> None:
+        """
+        Roll back the journal of a cancelled or interrupted installation
+        
+        Components the checkpoint records as done keep their files, so the
+        installation can be resumed; only the component that was being
+        installed is reverted. Without a checkpoint everything is rolled back.
+        """
+        if self.journal is None or self.checkpoint is None:
+            self._end_journal(commit=False)
+            return
+        for component in self.components.values():
+            component.file_manager.attach_journal(None)
+        for error in self.journal.rollback_after(self._journal_mark):
+            print(f"  - {error}")
+        self.journal = None
+
+    def _end_journal(self, commit: bool = True) -> None:
+        """
+        Detach and close the journal
+        
+        Args:
+            commit: Keep the changes (False rolls them back)
+        """
+        if self.journal is None:
+            return
+        for component in self.components.values():
+            component.file_manager.attach_journal(None)
+        if commit:
+            self.journal.commit()
+        else:
+            for error in self.journal.rollback():
+                print(f"  - {error}")
+        self.journal = None
+
+    def rollback(self) -> Optional[Path]:
+        """
+        Restore the files replaced by the most recent staged installation
+        
+        Returns:
+            Path of the restored generation, or None if there is nothing to roll back
+        """
+        if self.dry_run:
+            return None
+        staging = StagedInstall(self.install_dir)
+        generations = staging.list_generations()
+        if generations:
+            changed = staging.changed_state_files(generations[0])
+            if changed:
+                print(f"Warning: {', '.join(changed)} changed after the staged installation; "
+                      f"rolling back restores the earlier version and discards those changes")
+        return staging.rollback()
+    
     def _run_post_install_validation(self) -> None:
         """Run post-installation validation for all installed components"""
         print("\nRunning post-installation validation...")
@@ -289,6 +604,11 @@ class Installer:
         for name in self.installed_components:
             component = self.components[name]
             success, errors = component.validate_installation()
+            
+            files_valid, file_errors = component.verify_installed_files()
+            if not files_valid:
+                success = False
+                errors = errors + file_errors
 
             if success:
                 print(f"  ✓ {name}: Valid")
@@ -298,6 +618,7 @@ class Installer:
                     print(f"    - {error}")
                 all_valid = False
 
+        self.validation_passed = all_valid
         if all_valid:
             print("\nAll components validated successfully!")
         else:
@@ -319,6 +640,7 @@ class Installer:
             'failed': list(self.failed_components),
             'skipped': list(self.skipped_components),
             'backup_path': str(self.backup_path) if self.backup_path else None,
+            'generation_path': str(self.generation_path) if self.generation_path else None,
             'install_dir': str(self.install_dir),
             'dry_run': self.dry_run
         }
@@ -0,0 +1,263 @@
+"""
+Staged installation with rename-swap commits and generation rollback
+"""
+
+import hashlib
+import json
+import os
+import shutil
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from .component import Component
+from ..managers.copy_engine import CopyEngine
+from ..utils.walker import walk_tree
+
+
+class StagedInstall:
+    """
+    Builds components in a staging tree next to the installation directory
+    and swaps them in unit by unit with os.rename.
+
+    A unit is a component subdirectory (e.g. commands/cb) or, for components
+    installed at the top level, a single file. The units being replaced are
+    moved into a generation directory, so rollback is a rename as well.
+    """
+
+    # Shared state files rewritten by every component's _post_install
+    STATE_FILES = [".culturabuilder-metadata.json", "settings.json"]
+
+    GENERATION_RECORD = "generation.json"
+    KEEP_GENERATIONS = 3
+
+    def __init__(self, install_dir: Path):
+        """
+        Initialize staged install
+
+        Args:
+            install_dir: Live installation directory
+        """
+        self.install_dir = install_dir
+        base = install_dir.parent
+        # Renames only work within one filesystem; if the installation
+        # directory is a mount point, keep staging inside it instead
+        if install_dir.exists() and os.stat(install_dir).st_dev != os.stat(base).st_dev:
+            base = install_dir / ".culturabuilder-staging"
+        hidden_name = install_dir.name if install_dir.name.startswith('.') else f".{install_dir.name}"
+        self.staging_dir = base / f"{hidden_name}.staging"
+        self.generations_dir = base / f"{hidden_name}.generations"
+        self.units: List[str] = []
+        self.copy_engine = CopyEngine()
+
+    def prepare(self) -> Path:
+        """
+        Create an empty staging directory, discarding leftovers from an interrupted run
+
+        Returns:
+            Path of the staging directory
+        """
+        if self.staging_dir.exists():
+            shutil.rmtree(self.staging_dir)
+        self.staging_dir.mkdir(parents=True)
+        self.units = []
+        return self.staging_dir
+
+    def add_component(self, component: Component) -> None:
+        """
+        Register the units of a component built in the staging directory and
+        seed them with the live files so untouched content survives the swap.
+        Seeding copies (reflinks where supported) rather than hardlinks, since
+        components may rewrite files in place.
+
+        Args:
+            component: Component instance whose install_dir is the staging directory
+        """
+        subdir = component.install_component_subdir.relative_to(self.staging_dir)
+        if subdir.parts:
+            units = [subdir.as_posix()]
+        else:
+            units = [target.relative_to(self.staging_dir).as_posix()
+                     for _, target in component.get_files_to_install()]
+
+        for unit in units + self.STATE_FILES:
+            if unit in self.units:
+                continue
+            self.units.append(unit)
+            self._seed(unit)
+
+    def commit(self) -> Path:
+        """
+        Swap staged units into the installation directory
+
+        If any rename fails, the units already swapped are put back before the
+        error is raised.
+
+        Returns:
+            Path of the generation directory holding the replaced units
+        """
+        generation = self.generations_dir / datetime.now().strftime("%Y%m%d_%H%M%S_%f")
+        generation.mkdir(parents=True)
+
+        record: Dict[str, Any] = {"created": datetime.now().isoformat(), "units": []}
+        swapped: List[Dict[str, Any]] = []
+        try:
+            for unit in self.units:
+                staged = self.staging_dir / unit
+                if not os.path.lexists(staged):
+                    continue
+
+                live = self.install_dir / unit
+                existed = os.path.lexists(live)
+                if existed:
+                    (generation / unit).parent.mkdir(parents=True, exist_ok=True)
+                    os.rename(live, generation / unit)
+                entry = {"path": unit, "existed": existed}
+                swapped.append(entry)
+
+                live.parent.mkdir(parents=True, exist_ok=True)
+                os.rename(staged, live)
+        except Exception:
+            self._restore(generation, swapped)
+            shutil.rmtree(generation, ignore_errors=True)
+            raise
+
+        record["units"] = swapped
+        with open(generation / self.GENERATION_RECORD, 'w', encoding='utf-8') as f:
+            json.dump(record, f, indent=2)
+        self.record_state(generation)
+
+        # Directories created outside the units (e.g. backups/, logs/)
+        for entry in walk_tree(self.staging_dir):
+            if not entry.is_dir:
+                continue
+            live_dir = self.install_dir / entry.rel_path
+            if not os.path.lexists(live_dir):
+                live_dir.mkdir(parents=True, exist_ok=True)
+
+        self.discard()
+        self._prune_generations()
+        return generation
+
+    def discard(self) -> None:
+        """Remove the staging directory"""
+        shutil.rmtree(self.staging_dir, ignore_errors=True)
+
+    def list_generations(self) -> List[Path]:
+        """
+        List recorded generations, newest first
+
+        Returns:
+            List of generation directories
+        """
+        if not self.generations_dir.exists():
+            return []
+        return sorted(
+            (p for p in self.generations_dir.iterdir() if (p / self.GENERATION_RECORD).is_file()),
+            reverse=True
+        )
+
+    def record_state(self, generation: Path) -> None:
+        """
+        Remember the content of the live state files as this installation left them
+
+        Args:
+            generation: Generation directory of the installation
+        """
+        record_file = generation / self.GENERATION_RECORD
+        with open(record_file, 'r', encoding='utf-8') as f:
+            record = json.load(f)
+        record["state"] = {name: self._file_digest(self.install_dir / name) for name in self.STATE_FILES}
+        with open(record_file, 'w', encoding='utf-8') as f:
+            json.dump(record, f, indent=2)
+
+    def changed_state_files(self, generation: Path) -> List[str]:
+        """
+        Get state files changed since the installation that made a generation
+
+        Rollback restores STATE_FILES wholesale, so settings and metadata
+        written after that installation (by an update, another install or
+        the user) are lost.
+
+        Args:
+            generation: Generation directory
+
+        Returns:
+            Names of changed state files
+        """
+        try:
+            with open(generation / self.GENERATION_RECORD, 'r', encoding='utf-8') as f:
+                state = json.load(f).get("state", {})
+        except (OSError, ValueError):
+            return []
+        return [name for name, digest in state.items()
+                if self._file_digest(self.install_dir / name) != digest]
+
+    def rollback(self) -> Optional[Path]:
+        """
+        Restore the most recent generation
+
+        State files (settings and metadata) are restored as a whole, see
+        changed_state_files().
+
+        Returns:
+            Path of the restored generation, or None if there is none
+        """
+        generations = self.list_generations()
+        if not generations:
+            return None
+
+        generation = generations[0]
+        with open(generation / self.GENERATION_RECORD, 'r', encoding='utf-8') as f:
+            record = json.load(f)
+
+        self._restore(generation, record.get("units", []))
+        shutil.rmtree(generation, ignore_errors=True)
+        return generation
+
+    def _restore(self, generation: Path, units: List[Dict[str, Any]]) -> None:
+        """Put units from a generation back in place, newest swap first"""
+        trash = generation / ".replaced"
+        for entry in reversed(units):
+            unit = entry["path"]
+            live = self.install_dir / unit
+            if os.path.lexists(live):
+                (trash / unit).parent.mkdir(parents=True, exist_ok=True)
+                os.rename(live, trash / unit)
+            if entry["existed"] and os.path.lexists(generation / unit):
+                live.parent.mkdir(parents=True, exist_ok=True)
+                os.rename(generation / unit, live)
+
+    @staticmethod
+    def _file_digest(path: Path) -> Optional[str]:
+        """SHA-256 of a file, or None if it does not exist"""
+        try:
+            with open(path, 'rb') as f:
+                return hashlib.sha256(f.read()).hexdigest()
+        except OSError:
+            return None
+
+    def _seed(self, unit: str) -> None:
+        """Populate a staged unit from the live tree"""
+        live = self.install_dir / unit
+        staged = self.staging_dir / unit
+        if not os.path.lexists(live):
+            return
+
+        staged.parent.mkdir(parents=True, exist_ok=True)
+        if live.is_symlink():
+            os.symlink(os.readlink(live), staged)
+        elif live.is_dir():
+            shutil.copytree(live, staged, symlinks=True, copy_function=self._copy_file)
+        else:
+            self._copy_file(str(live), str(staged))
+
+    def _copy_file(self, source: str, target: str) -> str:
+        """copytree copy_function routed through the copy engine"""
+        self.copy_engine.copy(Path(source), Path(target))
+        return target
+
+    def _prune_generations(self) -> None:
+        """Keep only the newest KEEP_GENERATIONS generations"""
+        for generation in self.list_generations()[self.KEEP_GENERATIONS:]:
+            shutil.rmtree(generation, ignore_errors=True)
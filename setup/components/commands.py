@@ -60,7 +60,7 @@ class CommandsComponent(Component):
             self.settings_manager.add_component_registration("commands", {
                 "version": "3.0.0",
                 "category": "commands",
-                "files_count": len(self.component_files)
+                **self.get_registration_info()
             })
             self.logger.info("Updated metadata with commands component registration")
         except Exception as e:
@@ -216,7 +216,9 @@ class CommandsComponent(Component):
         # Check if all command files exist
         for filename in self.component_files:
             file_path = commands_dir / filename
-            if not file_path.exists():
+            if file_path.is_symlink() and not file_path.exists():
+                errors.append(f"Dangling link for command file: {filename} (content store entry missing)")
+            elif not file_path.exists():
                 errors.append(f"Missing command file: {filename}")
             elif not file_path.is_file():
                 errors.append(f"Command file is not a regular file: {filename}")
@@ -59,7 +59,7 @@ class CoreComponent(Component):
             self.settings_manager.add_component_registration("core", {
                 "version": "3.0.0",
                 "category": "core",
-                "files_count": len(self.component_files)
+                **self.get_registration_info()
             })
 
             self.logger.info("Updated metadata with core component registration")
@@ -183,7 +183,9 @@ class CoreComponent(Component):
         # Check if all framework files exist
         for filename in self.component_files:
             file_path = self.install_dir / filename
-            if not file_path.exists():
+            if file_path.is_symlink() and not file_path.exists():
+                errors.append(f"Dangling link for framework file: {filename} (content store entry missing)")
+            elif not file_path.exists():
                 errors.append(f"Missing framework file: {filename}")
             elif not file_path.is_file():
                 errors.append(f"Framework file is not a regular file: {filename}")
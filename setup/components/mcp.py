@@ -2,18 +2,42 @@
 MCP component for MCP server integration
 """
 
+import os
+import shutil
+import signal
 import subprocess
 import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import Dict, List, Tuple, Optional, Any
 from pathlib import Path
 
 from ..base.component import Component
+from ..core.preflight import Preflight
+from ..managers.mcp_snapshot import MCPSnapshot
+from ..managers.npm_cache import NpmPackageCache, package_name
+from ..managers.npm_prefix import NpmPrefix
+from ..managers.tool_cache import ToolProbeCache
 from ..utils.ui import display_info, display_warning
 
 
 class MCPComponent(Component):
     """MCP servers integration component"""
     
+    # Servers are registered in the user's Claude configuration
+    STAGEABLE = False
+    
+    # Seconds one `claude mcp add` may take
+    ADD_TIMEOUT = 120
+    # Defaults for concurrent installation (overridable via --mcp-jobs,
+    # --mcp-retries and --mcp-budget)
+    DEFAULT_JOBS = 4
+    DEFAULT_RETRIES = 2
+    DEFAULT_BUDGET = 300.0
+    RETRY_BACKOFF = 2.0
+    MAX_RETRY_BACKOFF = 16.0
+    
     def __init__(self, install_dir: Optional[Path] = None):
         """Initialize MCP component"""
         super().__init__(install_dir)
@@ -47,6 +71,17 @@ class MCPComponent(Component):
                 "required": False
             }
         }
+        
+        self._mcp_snapshot: Optional[MCPSnapshot] = None
+    
+    @property
+    def mcp_snapshot(self) -> MCPSnapshot:
+        """Configured MCP servers, shared with the running operation when there is one"""
+        if self.context is not None:
+            return self.context.mcp_snapshot
+        if self._mcp_snapshot is None:
+            self._mcp_snapshot = MCPSnapshot()
+        return self._mcp_snapshot
     
     def get_metadata(self) -> Dict[str, str]:
         """Get component metadata"""
@@ -61,15 +96,18 @@ class MCPComponent(Component):
         """Check prerequisites"""
         errors = []
         
+        # Probe all tools at once rather than one after another
+        from .. import CACHE_DIR_NAME
+        tool_cache = ToolProbeCache.for_path(self.install_dir / CACHE_DIR_NAME / "tool-probes.json")
+        probes = Preflight(cache=tool_cache).run({
+            "node": ["node", "--version"],
+            "claude": ["claude", "--version"],
+            "npm": ["npm", "--version"]
+        })
+        
         # Check if Node.js is available
         try:
-            result = subprocess.run(
-                ["node", "--version"], 
-                capture_output=True, 
-                text=True, 
-                timeout=10,
-                shell=(sys.platform == "win32")
-            )
+            result = probes["node"].to_completed_process()
             if result.returncode != 0:
                 errors.append("Node.js not found - required for MCP servers")
             else:
@@ -88,13 +126,7 @@ class MCPComponent(Component):
         
         # Check if Claude CLI is available
         try:
-            result = subprocess.run(
-                ["claude", "--version"], 
-                capture_output=True, 
-                text=True, 
-                timeout=10,
-                shell=(sys.platform == "win32")
-            )
+            result = probes["claude"].to_completed_process()
             if result.returncode != 0:
                 errors.append("Claude CLI not found - required for MCP server management")
             else:
@@ -105,13 +137,7 @@ class MCPComponent(Component):
         
         # Check if npm is available
         try:
-            result = subprocess.run(
-                ["npm", "--version"], 
-                capture_output=True, 
-                text=True, 
-                timeout=10,
-                shell=(sys.platform == "win32")
-            )
+            result = probes["npm"].to_completed_process()
             if result.returncode != 0:
                 errors.append("npm not found - required for MCP server installation")
             else:
@@ -145,33 +171,16 @@ class MCPComponent(Component):
     
     def _check_mcp_server_installed(self, server_name: str) -> bool:
         """Check if MCP server is already installed"""
-        try:
-            result = subprocess.run(
-                ["claude", "mcp", "list"], 
-                capture_output=True, 
-                text=True, 
-                timeout=15,
-                shell=(sys.platform == "win32")
-            )
-            
-            if result.returncode != 0:
-                self.logger.warning(f"Could not list MCP servers: {result.stderr}")
-                return False
-            
-            # Parse output to check if server is installed
-            output = result.stdout.lower()
-            return server_name.lower() in output
-            
-        except (subprocess.TimeoutExpired, subprocess.SubprocessError) as e:
-            self.logger.warning(f"Error checking MCP server status: {e}")
+        snapshot = self.mcp_snapshot
+        if not snapshot.ensure_loaded():
+            self.logger.warning(f"Could not list MCP servers: {snapshot.error}")
             return False
+        
+        return snapshot.is_installed(server_name)
     
     def _install_mcp_server(self, server_info: Dict[str, Any], config: Dict[str, Any]) -> bool:
         """Install a single MCP server"""
         server_name = server_info["name"]
-        npm_package = server_info["npm_package"]
-        
-        command = "npx"
         
         try:
             self.logger.info(f"Installing MCP server: {server_name}")
@@ -181,51 +190,330 @@ class MCPComponent(Component):
                 self.logger.info(f"MCP server {server_name} already installed")
                 return True
             
-            # Handle API key requirements
-            if "api_key_env" in server_info:
-                api_key_env = server_info["api_key_env"]
-                api_key_desc = server_info.get("api_key_description", f"API key for {server_name}")
+            self._notify_api_key(server_info, config)
+            
+            success, error = self._add_mcp_server(server_info, config)
+            if not success:
+                self.logger.error(f"Failed to install MCP server {server_name}: {error}")
+            return success
                 
-                if not config.get("dry_run", False):
-                    display_info(f"MCP server '{server_name}' requires an API key")
-                    display_info(f"Environment variable: {api_key_env}")
-                    display_info(f"Description: {api_key_desc}")
-                    
-                    # Check if API key is already set
-                    import os
-                    if not os.getenv(api_key_env):
-                        display_warning(f"API key {api_key_env} not found in environment")
-                        self.logger.warning(f"Proceeding without {api_key_env} - server may not function properly")
+        except Exception as e:
+            self.logger.error(f"Error installing MCP server {server_name}: {e}")
+            return False
+    
+    def _notify_api_key(self, server_info: Dict[str, Any], config: Dict[str, Any]) -> None:
+        """Tell the user about the API key a server needs"""
+        if "api_key_env" not in server_info or config.get("dry_run", False):
+            return
+        
+        server_name = server_info["name"]
+        api_key_env = server_info["api_key_env"]
+        api_key_desc = server_info.get("api_key_description", f"API key for {server_name}")
+        
+        display_info(f"MCP server '{server_name}' requires an API key")
+        display_info(f"Environment variable: {api_key_env}")
+        display_info(f"Description: {api_key_desc}")
+        
+        # Check if API key is already set
+        if not os.getenv(api_key_env):
+            display_warning(f"API key {api_key_env} not found in environment")
+            self.logger.warning(f"Proceeding without {api_key_env} - server may not function properly")
+    
+    def _add_mcp_server(self, server_info: Dict[str, Any], config: Dict[str, Any],
+                        timeout: float = ADD_TIMEOUT,
+                        cancel_event: Optional[threading.Event] = None) -> Tuple[bool, Optional[str]]:
+        """
+        Register a server with `claude mcp add` (one attempt)
+        
+        Args:
+            server_info: Server definition from mcp_servers
+            config: Installation configuration
+            timeout: Seconds the command may take
+            cancel_event: Event that aborts the command when set
             
-            # Install using Claude CLI
-            if config.get("dry_run"):
-                self.logger.info(f"Would install MCP server (user scope): claude mcp add -s user {server_name} {command} -y {npm_package}")
-                return True
+        Returns:
+            Tuple of (success, error message)
+        """
+        server_name = server_info["name"]
+        server_command, error = self._server_command(server_info, config)
+        if server_command is None:
+            return False, error
+        
+        # Install using Claude CLI
+        if config.get("dry_run"):
+            self.logger.info(f"Would install MCP server (user scope): claude mcp add -s user {server_name} {' '.join(server_command)}")
+            return True, None
+        
+        self.logger.debug(f"Running: claude mcp add -s user {server_name} {' '.join(server_command)}")
+        
+        try:
+            result = self._run_claude(
+                ["mcp", "add", "-s", "user", "--", server_name] + server_command,
+                timeout,
+                cancel_event
+            )
+        except subprocess.TimeoutExpired:
+            return False, f"timed out after {timeout:.0f}s"
+        except OSError as e:
+            return False, str(e)
+        
+        if result is None:
+            return False, "cancelled"
+        if result.returncode != 0:
+            return False, result.stderr.strip() if result.stderr else "Unknown error"
+        
+        self.mcp_snapshot.record_added(server_name, "user", server_command)
+        self.logger.success(f"Successfully installed MCP server (user scope): {server_name}")
+        return True, None
+    
+    def get_server_command(self, server_name: str, config: Dict[str, Any]) -> Tuple[Optional[List[str]], Optional[str]]:
+        """
+        Get the command Claude runs to start a server
+        
+        Args:
+            server_name: Server name from mcp_servers
+            config: Strategy options (mcp_strategy, npm_cache, mcp_prefix)
             
-            self.logger.debug(f"Running: claude mcp add -s user {server_name} {command} -y {npm_package}")
+        Returns:
+            Tuple of (command, error message); command is None on error
+        """
+        return self._server_command(self.mcp_servers[server_name], config)
+    
+    def _server_command(self, server_info: Dict[str, Any], config: Dict[str, Any]) -> Tuple[Optional[List[str]], Optional[str]]:
+        """
+        Build the command Claude runs to start a server
+        
+        Args:
+            server_info: Server definition from mcp_servers
+            config: Installation configuration (mcp_strategy, npm_cache and
+                mcp_prefix are used)
             
-            result = subprocess.run(
-                ["claude", "mcp", "add", "-s", "user", "--", server_name, command, "-y", npm_package],
-                capture_output=True,
-                text=True,
-                timeout=120,  # 2 minutes timeout for installation
-                shell=(sys.platform == "win32")
-            )
+        Returns:
+            Tuple of (command, error message); command is None on error
+        """
+        strategy = config.get("mcp_strategy") or "npx"
+        npm_package = server_info["npm_package"]
+        
+        if strategy == "offline":
+            command = self._package_cache(config).offline_command(npm_package)
+            if command is None:
+                return None, f"{npm_package} is not prefetched (run: CulturaBuilder mcp --prefetch)"
+            return command, None
+        
+        if strategy == "local":
+            prefix = self._npm_prefix(config)
+            command = prefix.command(npm_package)
+            if command is None:
+                if config.get("dry_run"):
+                    return ["node", str(prefix.prefix_dir / "node_modules" / package_name(npm_package))], None
+                return None, f"{npm_package} is not installed in {prefix.prefix_dir}"
+            return command, None
+        
+        return ["npx", "-y", npm_package], None
+    
+    def _package_cache(self, config: Dict[str, Any]) -> NpmPackageCache:
+        """Prefetched package cache selected by the installation configuration"""
+        from .. import DEFAULT_NPM_CACHE_DIR
+        return NpmPackageCache(config.get("npm_cache") or DEFAULT_NPM_CACHE_DIR)
+    
+    def _npm_prefix(self, config: Dict[str, Any]) -> NpmPrefix:
+        """Managed node_modules prefix selected by the installation configuration"""
+        from .. import MCP_PREFIX_DIR_NAME
+        prefix_dir = config.get("mcp_prefix") or self.install_dir / MCP_PREFIX_DIR_NAME
+        return NpmPrefix(prefix_dir, self._package_cache(config))
+    
+    def _install_local_packages(self, servers: Dict[str, Dict[str, Any]], config: Dict[str, Any]) -> None:
+        """
+        Install the packages of servers into the managed prefix (local strategy)
+        
+        Failures are logged; the affected servers then fail when their
+        command is built.
+        
+        Args:
+            servers: Dict of server name -> server definition
+            config: Installation configuration
+        """
+        prefix = self._npm_prefix(config)
+        specs = [info["npm_package"] for info in servers.values() if prefix.entry_point(info["npm_package"]) is None]
+        if not specs:
+            return
+        
+        if config.get("dry_run"):
+            self.logger.info(f"Would install into {prefix.prefix_dir}: {' '.join(specs)}")
+            return
+        
+        self.logger.info(f"Installing {len(specs)} MCP server packages into {prefix.prefix_dir}")
+        start = time.monotonic()
+        try:
+            prefix.install(specs)
+        except RuntimeError as e:
+            self.logger.error(f"Could not install MCP server packages: {e}")
+            return
+        for spec in specs:
+            self.logger.debug(f"Installed {package_name(spec)}@{prefix.installed_version(spec)}")
+        self.logger.info(f"MCP server packages installed in {time.monotonic() - start:.1f}s")
+    
+    @staticmethod
+    def _run_claude(args: List[str], timeout: float,
+                    cancel_event: Optional[threading.Event] = None) -> Optional[subprocess.CompletedProcess]:
+        """
+        Run a Claude CLI command that can be cancelled while it runs
+        
+        Args:
+            args: Arguments after `claude`
+            timeout: Seconds the command may take
+            cancel_event: Event that kills the command when set
             
-            if result.returncode == 0:
-                self.logger.success(f"Successfully installed MCP server (user scope): {server_name}")
-                return True
+        Returns:
+            CompletedProcess, or None if the command was cancelled
+            
+        Raises:
+            subprocess.TimeoutExpired: If the command outlived the timeout
+        """
+        command = ["claude"] + args
+        process = subprocess.Popen(
+            command,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True,
+            shell=(sys.platform == "win32"),
+            # Own process group, so killing it also stops the CLI's children
+            start_new_session=(sys.platform != "win32")
+        )
+        end = time.monotonic() + timeout
+        while True:
+            try:
+                stdout, stderr = process.communicate(timeout=min(0.2, max(0.0, end - time.monotonic())))
+                return subprocess.CompletedProcess(command, process.returncode, stdout, stderr)
+            except subprocess.TimeoutExpired:
+                cancelled = cancel_event is not None and cancel_event.is_set()
+                if cancelled or time.monotonic() >= end:
+                    if sys.platform == "win32":
+                        process.kill()
+                    else:
+                        try:
+                            os.killpg(process.pid, signal.SIGKILL)
+                        except OSError:
+                            pass
+                    process.communicate()
+                    if cancelled:
+                        return None
+                    raise subprocess.TimeoutExpired(command, timeout)
+    
+    def _install_servers(self, servers: Dict[str, Dict[str, Any]], config: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
+        """
+        Install MCP servers concurrently
+        
+        Servers are added by a bounded pool of workers. A failed attempt is
+        retried with exponential backoff; all attempts share one time budget.
+        When a required server fails for good, servers still queued or
+        running are cancelled.
+        
+        Args:
+            servers: Dict of server name -> server definition
+            config: Installation configuration (mcp_jobs, mcp_retries and
+                mcp_budget are used when present)
+            
+        Returns:
+            Dict of server name -> {"status", "attempts", "duration", "error"},
+            where status is installed, already_installed, failed or cancelled
+        """
+        jobs = max(1, int(config.get("mcp_jobs", self.DEFAULT_JOBS)))
+        retries = max(0, int(config.get("mcp_retries", self.DEFAULT_RETRIES)))
+        budget = float(config.get("mcp_budget", self.DEFAULT_BUDGET))
+        checkpoint = config.get("checkpoint")
+        
+        results: Dict[str, Dict[str, Any]] = {}
+        to_add = {}
+        for server_name, server_info in servers.items():
+            # Checks and notices run here, so the workers only spawn `claude mcp add`
+            if self._check_mcp_server_installed(server_name):
+                self.logger.info(f"MCP server {server_name} already installed")
+                results[server_name] = {"status": "already_installed", "attempts": 0, "duration": 0.0, "error": None}
             else:
-                error_msg = result.stderr.strip() if result.stderr else "Unknown error"
-                self.logger.error(f"Failed to install MCP server {server_name}: {error_msg}")
-                return False
+                self._notify_api_key(server_info, config)
+                to_add[server_name] = server_info
+        
+        if to_add and config.get("mcp_strategy") == "local":
+            self._install_local_packages(to_add, config)
+        
+        if to_add:
+            self.logger.info(f"Installing {len(to_add)} MCP servers ({min(jobs, len(to_add))} at a time, {budget:.0f}s budget)")
+        
+        deadline = time.monotonic() + budget
+        cancel_event = threading.Event()
+        executor = ThreadPoolExecutor(max_workers=min(jobs, len(to_add)) or 1, thread_name_prefix="mcp-install")
+        try:
+            futures = {
+                executor.submit(self._install_with_retries, server_info, config, retries, deadline, cancel_event): server_name
+                for server_name, server_info in to_add.items()
+            }
+            for future in as_completed(futures):
+                server_name = futures[future]
+                if future.cancelled():
+                    continue
+                result = future.result()
+                results[server_name] = result
                 
-        except subprocess.TimeoutExpired:
-            self.logger.error(f"Timeout installing MCP server {server_name}")
-            return False
-        except Exception as e:
-            self.logger.error(f"Error installing MCP server {server_name}: {e}")
-            return False
+                if result["status"] == "installed":
+                    if checkpoint is not None and not config.get("dry_run", False):
+                        checkpoint.record_step("mcp", server_name)
+                elif result["status"] == "failed":
+                    self.logger.error(f"Failed to install MCP server {server_name}: {result['error']}")
+                    if to_add[server_name].get("required", False) and not cancel_event.is_set():
+                        self.logger.error(f"Required MCP server {server_name} failed, cancelling remaining MCP servers")
+                        cancel_event.set()
+                        for pending in futures:
+                            pending.cancel()
+        finally:
+            executor.shutdown(wait=True)
+        
+        for server_name in to_add:
+            results.setdefault(server_name, {"status": "cancelled", "attempts": 0, "duration": 0.0, "error": "cancelled"})
+        return results
+    
+    def _install_with_retries(self, server_info: Dict[str, Any], config: Dict[str, Any], retries: int,
+                              deadline: float, cancel_event: threading.Event) -> Dict[str, Any]:
+        """Add one server, retrying failed attempts with backoff until the deadline (worker thread)"""
+        start = time.monotonic()
+        result: Dict[str, Any] = {"status": "failed", "attempts": 0, "duration": 0.0, "error": None}
+
+        # A command that cannot be built (e.g. package not prefetched) will not improve on retry
+        _, error = self._server_command(server_info, config)
+        if error is not None:
+            result["error"] = error
+            return result
+
+        for attempt in range(retries + 1):
+            if attempt > 0:
+                delay = min(self.RETRY_BACKOFF * 2 ** (attempt - 1), self.MAX_RETRY_BACKOFF)
+                if delay >= deadline - time.monotonic():
+                    break
+                self.logger.warning(f"Retrying MCP server {server_info['name']} in {delay:.0f}s ({result['error']})")
+                if cancel_event.wait(delay):
+                    result["status"] = "cancelled"
+                    break
+            
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                result["error"] = "MCP installation time budget exhausted"
+                break
+            if cancel_event.is_set():
+                result["status"] = "cancelled"
+                break
+            
+            result["attempts"] += 1
+            success, error = self._add_mcp_server(server_info, config, min(self.ADD_TIMEOUT, remaining), cancel_event)
+            result["error"] = error
+            if success:
+                result["status"] = "installed"
+                break
+            if cancel_event.is_set():
+                result["status"] = "cancelled"
+                break
+        
+        result["duration"] = time.monotonic() - start
+        return result
     
     def _uninstall_mcp_server(self, server_name: str) -> bool:
         """Uninstall a single MCP server"""
@@ -248,6 +536,7 @@ class MCPComponent(Component):
             )
             
             if result.returncode == 0:
+                self.mcp_snapshot.record_removed(server_name)
                 self.logger.success(f"Successfully uninstalled MCP server: {server_name}")
                 return True
             else:
@@ -273,43 +562,44 @@ class MCPComponent(Component):
                 self.logger.error(error)
             return False
 
-        # Install each MCP server
+        # Install MCP servers
         installed_count = 0
         failed_servers = []
+        checkpoint = config.get("checkpoint")
+        servers = {}
 
         for server_name, server_info in self.mcp_servers.items():
-            if self._install_mcp_server(server_info, config):
+            if checkpoint is not None and checkpoint.is_step_done("mcp", server_name):
+                self.logger.info(f"MCP server {server_name} installed before the interruption, skipping")
+                installed_count += 1
+            else:
+                servers[server_name] = server_info
+
+        results = self._install_servers(servers, config)
+        self._log_server_results(results)
+
+        for server_name, result in results.items():
+            if result["status"] in ("installed", "already_installed"):
                 installed_count += 1
             else:
                 failed_servers.append(server_name)
-                
-                # Check if this is a required server
-                if server_info.get("required", False):
-                    self.logger.error(f"Required MCP server {server_name} failed to install")
-                    return False
 
-        # Verify installation
+        required_failed = [name for name in failed_servers if self.mcp_servers[name].get("required", False)]
+        if required_failed:
+            self.logger.error(f"Required MCP servers failed to install: {required_failed}")
+            return False
+
+        # Verify installation against the snapshot kept current by each add
         if not config.get("dry_run", False):
             self.logger.info("Verifying MCP server installation...")
-            try:
-                result = subprocess.run(
-                    ["claude", "mcp", "list"],
-                    capture_output=True,
-                    text=True,
-                    timeout=15,
-                    shell=(sys.platform == "win32")
-                )
-                
-                if result.returncode == 0:
-                    self.logger.debug("MCP servers list:")
-                    for line in result.stdout.strip().split('\n'):
-                        if line.strip():
-                            self.logger.debug(f"  {line.strip()}")
-                else:
-                    self.logger.warning("Could not verify MCP server installation")
-                    
-            except Exception as e:
-                self.logger.warning(f"Could not verify MCP installation: {e}")
+            snapshot = self.mcp_snapshot
+            if snapshot.ensure_loaded():
+                self.logger.debug("MCP servers list:")
+                for server in snapshot.list_servers():
+                    scope = server.get("scope") or "unknown scope"
+                    self.logger.debug(f"  {server['name']} ({scope}): {server['command']}")
+            else:
+                self.logger.warning(f"Could not verify MCP server installation: {snapshot.error}")
 
         if failed_servers:
             self.logger.warning(f"Some MCP servers failed to install: {failed_servers}")
@@ -319,6 +609,20 @@ class MCPComponent(Component):
 
         return self._post_install()
 
+    def _log_server_results(self, results: Dict[str, Dict[str, Any]]) -> None:
+        """Log outcome and timing of each server installation"""
+        if not results:
+            return
+        self.logger.info("MCP server installation summary:")
+        for server_name, result in results.items():
+            attempts = result["attempts"]
+            line = f"  {server_name}: {result['status'].replace('_', ' ')}"
+            if attempts:
+                line += f" in {result['duration']:.1f}s ({attempts} attempt{'s' if attempts != 1 else ''})"
+            if result["status"] in ("failed", "cancelled") and result["error"]:
+                line += f" - {result['error']}"
+            self.logger.info(line)
+
     def _post_install(self) -> bool:
         # Update metadata
         try:
@@ -352,6 +656,13 @@ class MCPComponent(Component):
                 if self._uninstall_mcp_server(server_name):
                     uninstalled_count += 1
             
+            # Remove packages installed by the local strategy
+            from .. import MCP_PREFIX_DIR_NAME
+            prefix_dir = self.install_dir / MCP_PREFIX_DIR_NAME
+            if prefix_dir.exists():
+                shutil.rmtree(prefix_dir, ignore_errors=True)
+                self.logger.info(f"Removed MCP server packages from {prefix_dir}")
+            
             # Update metadata to remove MCP component
             try:
                 if self.settings_manager.is_component_installed("mcp"):
@@ -450,28 +761,14 @@ class MCPComponent(Component):
         if installed_version != expected_version:
             errors.append(f"Version mismatch: installed {installed_version}, expected {expected_version}")
         
-        # Check if Claude CLI is available
-        try:
-            result = subprocess.run(
-                ["claude", "mcp", "list"],
-                capture_output=True,
-                text=True,
-                timeout=15,
-                shell=(sys.platform == "win32")
-            )
-            
-            if result.returncode != 0:
-                errors.append("Could not communicate with Claude CLI for MCP server verification")
-            else:
-                # Check if required servers are installed
-                output = result.stdout.lower()
-                for server_name, server_info in self.mcp_servers.items():
-                    if server_info.get("required", False):
-                        if server_name.lower() not in output:
-                            errors.append(f"Required MCP server not found: {server_name}")
-                            
-        except Exception as e:
-            errors.append(f"Could not verify MCP server installation: {e}")
+        # Check if required servers are configured
+        snapshot = self.mcp_snapshot
+        if not snapshot.ensure_loaded():
+            errors.append("Could not communicate with Claude CLI for MCP server verification")
+        else:
+            for server_name, server_info in self.mcp_servers.items():
+                if server_info.get("required", False) and not snapshot.is_installed(server_name):
+                    errors.append(f"Required MCP server not found: {server_name}")
         
         return len(errors) == 0, errors
     
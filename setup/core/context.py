@@ -0,0 +1,199 @@
+"""
+Shared state of a single CulturaBuilder operation
+"""
+
+import argparse
+from pathlib import Path
+from typing import Any, Dict, List, Optional, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from ..base.component import Component
+    from ..base.installer import Installer
+    from ..managers.config_manager import ConfigManager
+    from ..managers.file_manager import FileManager
+    from ..managers.mcp_snapshot import MCPSnapshot
+    from ..managers.metrics_manager import MetricsManager
+    from ..managers.settings_manager import SettingsManager
+    from .registry import ComponentRegistry
+    from .validator import Validator
+
+
+class OperationContext:
+    """
+    Objects shared by everything one CLI invocation does
+
+    Created once per invocation and handed to the operation, which passes it
+    on to helpers and components. Every member is built on first use, so an
+    operation only pays for what it touches, and nothing (component
+    discovery, config parsing, metadata reads) is done twice.
+    """
+
+    def __init__(self, install_dir: Optional[Path] = None, dry_run: bool = False):
+        """
+        Initialize operation context
+
+        Args:
+            install_dir: Target installation directory (defaults to ~/.claude)
+            dry_run: Whether the operation only simulates changes
+        """
+        from .. import DEFAULT_INSTALL_DIR
+        self.install_dir = install_dir or DEFAULT_INSTALL_DIR
+        self.dry_run = dry_run
+        self._registry: Optional["ComponentRegistry"] = None
+        self._config_manager: Optional["ConfigManager"] = None
+        self._validator: Optional["Validator"] = None
+        self._settings_manager: Optional["SettingsManager"] = None
+        self._file_manager: Optional["FileManager"] = None
+        self._metrics_manager: Optional["MetricsManager"] = None
+        self._installer: Optional["Installer"] = None
+        self._mcp_snapshot: Optional["MCPSnapshot"] = None
+        self._components: Dict[str, "Component"] = {}
+        self._installed_components: Optional[Dict[str, Dict[str, Any]]] = None
+
+    @classmethod
+    def from_args(cls, args: argparse.Namespace) -> "OperationContext":
+        """
+        Create context from parsed command line arguments
+
+        Args:
+            args: Parsed arguments (install_dir and dry_run are used)
+
+        Returns:
+            OperationContext
+        """
+        return cls(getattr(args, "install_dir", None), dry_run=getattr(args, "dry_run", False))
+
+    @property
+    def registry(self) -> "ComponentRegistry":
+        """Component registry, discovered once"""
+        if self._registry is None:
+            from .registry import ComponentRegistry
+            from .. import PROJECT_ROOT
+            self._registry = ComponentRegistry(PROJECT_ROOT / "setup" / "components")
+            self._registry.discover_components()
+        return self._registry
+
+    @property
+    def config_manager(self) -> "ConfigManager":
+        """Configuration manager (caches parsed features and requirements)"""
+        if self._config_manager is None:
+            from ..managers.config_manager import ConfigManager
+            from .. import PROJECT_ROOT
+            self._config_manager = ConfigManager(PROJECT_ROOT / "config")
+        return self._config_manager
+
+    @property
+    def validator(self) -> "Validator":
+        """System requirements validator sharing the configuration manager and tool cache"""
+        if self._validator is None:
+            from .validator import Validator
+            from ..managers.tool_cache import ToolProbeCache
+            from .. import CACHE_DIR_NAME
+            tool_cache = ToolProbeCache.for_path(self.install_dir / CACHE_DIR_NAME / "tool-probes.json")
+            self._validator = Validator(config_manager=self.config_manager, tool_cache=tool_cache)
+        return self._validator
+
+    @property
+    def settings_manager(self) -> "SettingsManager":
+        """Settings manager of the installation directory"""
+        if self._settings_manager is None:
+            from ..managers.settings_manager import SettingsManager
+            self._settings_manager = SettingsManager(self.install_dir)
+        return self._settings_manager
+
+    @property
+    def file_manager(self) -> "FileManager":
+        """File manager sharing the digest cache of the installation directory"""
+        if self._file_manager is None:
+            from ..managers.file_manager import FileManager
+            from ..managers.hash_cache import HashCache
+            from .. import CACHE_DIR_NAME
+            hash_cache = HashCache.for_path(self.install_dir / CACHE_DIR_NAME / "file-hashes.json")
+            self._file_manager = FileManager(dry_run=self.dry_run, hash_cache=hash_cache)
+        return self._file_manager
+
+    @property
+    def metrics_manager(self) -> "MetricsManager":
+        """Metrics manager of the installation directory"""
+        if self._metrics_manager is None:
+            from ..managers.metrics_manager import MetricsManager
+            self._metrics_manager = MetricsManager(self.install_dir)
+        return self._metrics_manager
+
+    @property
+    def installer(self) -> "Installer":
+        """Installer for the installation directory"""
+        if self._installer is None:
+            from ..base.installer import Installer
+            self._installer = Installer(self.install_dir, dry_run=self.dry_run)
+        return self._installer
+
+    @property
+    def mcp_snapshot(self) -> "MCPSnapshot":
+        """Configured MCP servers, listed once and kept current by the MCP component"""
+        if self._mcp_snapshot is None:
+            from ..managers.mcp_snapshot import MCPSnapshot
+            self._mcp_snapshot = MCPSnapshot()
+        return self._mcp_snapshot
+
+    def get_component(self, component_name: str) -> Optional["Component"]:
+        """
+        Get the component instance for the installation directory
+
+        Args:
+            component_name: Name of component
+
+        Returns:
+            Shared component instance or None if the component is unknown
+        """
+        component = self._components.get(component_name)
+        if component is None:
+            # Discovery already created an instance for the default directory
+            component = self.registry.get_component_instance(component_name)
+            if component is None or component.install_dir != self.install_dir:
+                component = self.registry.get_component_instance(component_name, self.install_dir)
+            if component is None:
+                return None
+            component.attach_context(self)
+            self._components[component_name] = component
+        return component
+
+    def get_components(self, component_names: List[str]) -> Dict[str, "Component"]:
+        """
+        Get component instances for several components
+
+        Args:
+            component_names: Names of components
+
+        Returns:
+            Dict mapping component names to shared instances (unknown names omitted)
+        """
+        components = {}
+        for name in component_names:
+            component = self.get_component(name)
+            if component is not None:
+                components[name] = component
+            else:
+                print(f"Warning: Could not create instance for component {name}")
+        return components
+
+    def get_installed_components(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Get components registered in the installation metadata
+
+        Read once per operation; call invalidate() after changing the
+        registrations to see the new state.
+
+        Returns:
+            Dict of component_name -> component_info (do not modify)
+        """
+        if self._installed_components is None:
+            try:
+                self._installed_components = self.settings_manager.get_installed_components()
+            except Exception:
+                self._installed_components = {}
+        return self._installed_components
+
+    def invalidate(self) -> None:
+        """Drop state read from the installation directory"""
+        self._installed_components = None
@@ -0,0 +1,221 @@
+"""
+Concurrent external tool probes for CulturaBuilder installation system
+"""
+
+import os
+import signal
+import subprocess
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional
+
+from ..utils.path_resolver import resolve_commands
+
+
+class ProbeResult:
+    """Outcome of running one probe command"""
+
+    OK = "ok"
+    FAILED = "failed"
+    NOT_FOUND = "not_found"
+    TIMEOUT = "timeout"
+    ERROR = "error"
+
+    def __init__(self, name: str, command: List[str]):
+        """
+        Initialize probe result
+
+        Args:
+            name: Probe name
+            command: Command that was run
+        """
+        self.name = name
+        self.command = command
+        self.status = self.TIMEOUT
+        self.returncode: Optional[int] = None
+        self.stdout = ""
+        self.stderr = ""
+        self.duration = 0.0
+        self.error: Optional[str] = None
+        # Executable the command resolved to on PATH
+        self.binary: Optional[str] = None
+        # True when the result came from a ToolProbeCache instead of running the command
+        self.cached = False
+
+    @property
+    def ok(self) -> bool:
+        """True if the command ran and exited with status 0"""
+        return self.status == self.OK
+
+    def to_completed_process(self) -> subprocess.CompletedProcess:
+        """
+        Replay the result as subprocess.run() would have returned it
+
+        Returns:
+            CompletedProcess with the captured output
+
+        Raises:
+            subprocess.TimeoutExpired: If the probe hit the deadline
+            FileNotFoundError: If the command does not exist
+            OSError: If the command could not be started
+        """
+        if self.status == self.TIMEOUT:
+            raise subprocess.TimeoutExpired(self.command, self.duration)
+        if self.status == self.NOT_FOUND:
+            raise FileNotFoundError(self.error or f"{self.command[0]} not found")
+        if self.status == self.ERROR:
+            raise OSError(self.error)
+        return subprocess.CompletedProcess(self.command, self.returncode, self.stdout, self.stderr)
+
+    def to_dict(self) -> Dict[str, object]:
+        """Structured form of the result"""
+        return {
+            "name": self.name,
+            "command": self.command,
+            "status": self.status,
+            "returncode": self.returncode,
+            "stdout": self.stdout,
+            "stderr": self.stderr,
+            "duration": self.duration,
+            "error": self.error,
+            "binary": self.binary,
+            "cached": self.cached
+        }
+
+
+class Preflight:
+    """
+    Runs external tool probes (e.g. version queries) concurrently
+
+    All probes start at once and share one overall deadline, so a batch
+    takes as long as its slowest probe rather than the sum of all of them.
+    Commands are first resolved on PATH in-process: missing tools are
+    reported without spawning anything, and with a ToolProbeCache neither
+    are unchanged binaries.
+    """
+
+    DEFAULT_DEADLINE = 15.0
+
+    def __init__(self, deadline: float = DEFAULT_DEADLINE, max_workers: int = 8, cache: Any = None):
+        """
+        Initialize preflight engine
+
+        Args:
+            deadline: Seconds the whole batch may take
+            max_workers: Maximum number of probes running at the same time
+            cache: ToolProbeCache remembering results across runs (optional)
+        """
+        self.deadline = deadline
+        self.max_workers = max_workers
+        self.cache = cache
+
+    def run(self, probes: Dict[str, List[str]], deadline: Optional[float] = None) -> Dict[str, ProbeResult]:
+        """
+        Run probes concurrently
+
+        Args:
+            probes: Dict of probe name -> command
+            deadline: Seconds the batch may take (defaults to the engine's deadline)
+
+        Returns:
+            Dict of probe name -> ProbeResult (probes still running at the
+            deadline are killed with their child processes and reported as
+            timed out; every probe has finished when this returns)
+        """
+        results = {name: ProbeResult(name, list(command)) for name, command in probes.items()}
+
+        pending = []
+        for result in results.values():
+            cached = self.cache.get(result.command) if self._is_cacheable(result.command) else None
+            if cached is None or cached.get("status") != ProbeResult.OK:
+                pending.append(result)  # Failures cached by older versions are probed again
+                continue
+            result.status = ProbeResult.OK
+            result.returncode = cached.get("returncode")
+            result.stdout = cached.get("stdout", "")
+            result.stderr = cached.get("stderr", "")
+            result.cached = True
+
+        # Tools that are not on PATH need no process to find that out
+        resolved = resolve_commands(result.command[0] for result in pending if result.command)
+        for result in list(pending):
+            result.binary = resolved.get(result.command[0]) if result.command else None
+            if result.binary is None:
+                result.status = ProbeResult.NOT_FOUND
+                result.error = f"{result.command[0] if result.command else 'command'} not found in PATH"
+                pending.remove(result)
+
+        if not pending:
+            return results
+
+        end = time.monotonic() + (self.deadline if deadline is None else deadline)
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(pending)),
+                                thread_name_prefix="preflight") as executor:
+            for result in pending:
+                executor.submit(self._probe, result, end)
+
+        for result in pending:
+            # Only successes are kept: a failure may be caused by this run's
+            # environment (auth, config, a broken shim) rather than the binary
+            if result.ok and self._is_cacheable(result.command):
+                self.cache.put(result.command, {
+                    "status": result.status,
+                    "returncode": result.returncode,
+                    "stdout": result.stdout,
+                    "stderr": result.stderr
+                })
+        return results
+
+    def _is_cacheable(self, command: List[str]) -> bool:
+        """Whether a command's result can be kept in the cache"""
+        return self.cache is not None and bool(command)
+
+    def _probe(self, result: ProbeResult, end: float) -> None:
+        """Run one probe command, filling in its result"""
+        start = time.monotonic()
+        remaining = end - start
+        if remaining <= 0:
+            return  # Deadline passed while queued; stays reported as timed out
+
+        try:
+            process = subprocess.Popen(
+                result.command,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                text=True,
+                shell=(sys.platform == "win32"),
+                # Own process group, so the kill at the deadline reaches its children too
+                start_new_session=(sys.platform != "win32")
+            )
+            try:
+                stdout, stderr = process.communicate(timeout=remaining)
+            except subprocess.TimeoutExpired:
+                self._kill(process)
+                result.status = ProbeResult.TIMEOUT
+                return
+            result.returncode = process.returncode
+            result.stdout = stdout
+            result.stderr = stderr
+            result.status = ProbeResult.OK if process.returncode == 0 else ProbeResult.FAILED
+        except FileNotFoundError as e:
+            result.status = ProbeResult.NOT_FOUND
+            result.error = str(e)
+        except Exception as e:
+            result.status = ProbeResult.ERROR
+            result.error = str(e)
+        finally:
+            result.duration = time.monotonic() - start
+
+    @staticmethod
+    def _kill(process: subprocess.Popen) -> None:
+        """Kill a probe and everything it started, without waiting on its pipes"""
+        if sys.platform == "win32":
+            process.kill()
+        else:
+            try:
+                os.killpg(process.pid, signal.SIGKILL)
+            except OSError:
+                pass
+        # Not communicate(): a surviving grandchild could hold the pipes open
+        process.wait()
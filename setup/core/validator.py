@@ -9,6 +9,9 @@ from typing import Tuple, List, Dict, Any, Optional
 from pathlib import Path
 import re
 
+from .preflight import Preflight, ProbeResult
+from ..utils.path_resolver import resolve_commands
+
 # Handle packaging import - if not available, use a simple version comparison
 try:
     from packaging import version
@@ -53,9 +56,61 @@ except ImportError:
 class Validator:
     """System requirements validator"""
     
-    def __init__(self):
-        """Initialize validator"""
+    def __init__(self, config_manager: Optional[Any] = None, tool_cache: Optional[Any] = None):
+        """
+        Initialize validator
+        
+        Args:
+            config_manager: ConfigManager to read requirements from (created on demand if None)
+            tool_cache: ToolProbeCache keeping tool versions across runs (optional)
+        """
         self.validation_cache: Dict[str, Any] = {}
+        self.config_manager = config_manager
+        self.preflight = Preflight(cache=tool_cache)
+        # Outputs of probes already run by run_preflight(), keyed by command line
+        self.probe_results: Dict[str, ProbeResult] = {}
+    
+    def run_preflight(self, commands: List[List[str]]) -> Dict[str, ProbeResult]:
+        """
+        Run tool probes concurrently ahead of the checks that need them
+        
+        The checks then read the captured output instead of spawning the
+        commands one after another.
+        
+        Args:
+            commands: Commands to probe (already probed ones are skipped)
+            
+        Returns:
+            Dict of command line -> ProbeResult for all requested commands
+        """
+        pending = {}
+        for command in commands:
+            key = " ".join(command)
+            if key not in self.probe_results:
+                pending[key] = command
+        
+        self.probe_results.update(self.preflight.run(pending))
+        return {" ".join(command): self.probe_results[" ".join(command)] for command in commands}
+    
+    def _run_command(self, command: List[str], timeout: float = 10) -> subprocess.CompletedProcess:
+        """
+        Run a probe command, or replay its result if run_preflight() already ran it
+        
+        Args:
+            command: Command to run
+            timeout: Timeout in seconds when the command has to be run now
+            
+        Returns:
+            CompletedProcess with captured text output
+            
+        Raises:
+            subprocess.TimeoutExpired: If the command timed out
+            FileNotFoundError: If the command does not exist
+        """
+        key = " ".join(command)
+        if key not in self.probe_results:
+            self.probe_results.update(self.preflight.run({key: command}, deadline=timeout))
+        return self.probe_results[key].to_completed_process()
     
     def check_python(self, min_version: str = "3.8", max_version: Optional[str] = None) -> Tuple[bool, str]:
         """
@@ -114,14 +169,8 @@ class Validator:
             return self.validation_cache[cache_key]
         
         try:
-            # Check if node is installed - use shell=True on Windows for better PATH resolution
-            result = subprocess.run(
-                ['node', '--version'],
-                capture_output=True,
-                text=True,
-                timeout=10,
-                shell=(sys.platform == "win32")
-            )
+            # Check if node is installed
+            result = self._run_command(['node', '--version'])
             
             if result.returncode != 0:
                 help_msg = self.get_installation_help("node")
@@ -182,14 +231,8 @@ class Validator:
             return self.validation_cache[cache_key]
         
         try:
-            # Check if claude is installed - use shell=True on Windows for better PATH resolution
-            result = subprocess.run(
-                ['claude', '--version'],
-                capture_output=True,
-                text=True,
-                timeout=10,
-                shell=(sys.platform == "win32")
-            )
+            # Check if claude is installed
+            result = self._run_command(['claude', '--version'])
             
             if result.returncode != 0:
                 help_msg = self.get_installation_help("claude_cli")
@@ -252,13 +295,7 @@ class Validator:
             # Split command into parts
             cmd_parts = command.split()
             
-            result = subprocess.run(
-                cmd_parts,
-                capture_output=True,
-                text=True,
-                timeout=10,
-                shell=(sys.platform == "win32")
-            )
+            result = self._run_command(cmd_parts)
             
             if result.returncode != 0:
                 result_tuple = (False, f"{tool_name} not found or command failed")
@@ -384,6 +421,14 @@ class Validator:
         """
         errors = []
         
+        # Start all tool probes at once; the checks below read their output
+        probes = []
+        if "node" in requirements:
+            probes.append(['node', '--version'])
+        for tool_req in requirements.get("external_tools", {}).values():
+            probes.append(tool_req["command"].split())
+        self.run_preflight(probes)
+        
         # Check Python requirements
         if "python" in requirements:
             python_req = requirements["python"]
@@ -490,6 +535,8 @@ class Validator:
             "python_executable": sys.executable
         }
         
+        self.run_preflight([['node', '--version'], ['claude', '--version']])
+        
         # Add Node.js info if available
         node_success, node_msg = self.check_node()
         info["node_available"] = node_success
@@ -533,11 +580,12 @@ class Validator:
             Installation commands dict
         """
         try:
-            from ..managers.config_manager import ConfigManager
-            from .. import PROJECT_ROOT
+            if self.config_manager is None:
+                from ..managers.config_manager import ConfigManager
+                from .. import PROJECT_ROOT
+                self.config_manager = ConfigManager(PROJECT_ROOT / "config")
             
-            config_manager = ConfigManager(PROJECT_ROOT / "config")
-            requirements = config_manager.load_requirements()
+            requirements = self.config_manager.load_requirements()
             return requirements.get("installation_commands", {})
         except Exception:
             return {}
@@ -586,9 +634,15 @@ class Validator:
             "platform": self.get_platform(),
             "checks": {},
             "issues": [],
-            "recommendations": []
+            "recommendations": [],
+            "probes": {}
         }
         
+        # Start every external probe at once so diagnostics take as long as the slowest one
+        probes = [['node', '--version'], ['claude', '--version']]
+        for key, probe in self.run_preflight(probes).items():
+            diagnostics["probes"][key] = probe.to_dict()
+        
         # Check Python
         python_success, python_msg = self.check_python()
         diagnostics["checks"]["python"] = {
@@ -633,35 +687,25 @@ class Validator:
         
         return diagnostics
     
+    # Tools whose PATH presence is diagnosed, with alternatives for some tools
+    PATH_TOOL_CHECKS = [
+        # For Python, check if either python3 OR python is available
+        (["python3", "python"], "Python (python3 or python)"),
+        (["node"], "Node.js"),
+        (["npm"], "npm"),
+        (["claude"], "Claude CLI")
+    ]
+    
     def _diagnose_path_issues(self, diagnostics: Dict[str, Any]) -> None:
         """Add PATH-related diagnostics"""
         path_issues = []
         
-        # Check if tools are in PATH, with alternatives for some tools
-        tool_checks = [
-            # For Python, check if either python3 OR python is available
-            (["python3", "python"], "Python (python3 or python)"),
-            (["node"], "Node.js"),
-            (["npm"], "npm"),
-            (["claude"], "Claude CLI")
-        ]
-        
-        for tool_alternatives, display_name in tool_checks:
-            tool_found = False
-            for tool in tool_alternatives:
-                try:
-                    result = subprocess.run(
-                        ["which" if sys.platform != "win32" else "where", tool],
-                        capture_output=True,
-                        text=True,
-                        timeout=5,
-                        shell=(sys.platform == "win32")
-                    )
-                    if result.returncode == 0:
-                        tool_found = True
-                        break
-                except Exception:
-                    continue
+        # Locate every tool in one pass over PATH, without spawning which/where
+        located = resolve_commands(tool for tools, _ in self.PATH_TOOL_CHECKS for tool in tools)
+        diagnostics["tool_paths"] = located
+        
+        for tool_alternatives, display_name in self.PATH_TOOL_CHECKS:
+            tool_found = any(located.get(tool) for tool in tool_alternatives)
             
             if not tool_found:
                 # Only report as missing if none of the alternatives were found
@@ -683,3 +727,4 @@ class Validator:
     def clear_cache(self) -> None:
         """Clear validation cache"""
         self.validation_cache.clear()
+        self.probe_results.clear()
@@ -0,0 +1,171 @@
+"""
+Asyncio facade over FileManager for CulturaBuilder installation system
+Runs blocking file operations on a bounded thread pool so an event loop never stalls
+"""
+
+import asyncio
+import functools
+import os
+from concurrent.futures import Executor, ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, TypeVar
+
+from .file_manager import FileManager
+
+T = TypeVar("T")
+
+
+class AsyncFileManager:
+    """
+    Awaitable FileManager operations with a concurrency limit
+
+    Every call runs the matching FileManager method on an executor. At most
+    max_concurrency calls are in flight per instance; further calls wait
+    (cancellably) for a slot. Cancelling a call that is already running on a
+    worker thread cannot interrupt the file operation itself: the awaiting
+    task is cancelled at once and the operation completes in the background.
+    Batch helpers such as copy_files() cancel the operations that have not
+    started yet.
+    """
+
+    def __init__(self, file_manager: Optional[FileManager] = None,
+                 executor: Optional[Executor] = None,
+                 max_workers: Optional[int] = None,
+                 max_concurrency: Optional[int] = None):
+        """
+        Initialize async file manager
+
+        Args:
+            file_manager: FileManager to wrap (a new one by default)
+            executor: Executor to run operations on (shared executors are not
+                      shut down by close()); a private thread pool by default
+            max_workers: Size of the private thread pool (defaults to CPU count + 4, max 32)
+            max_concurrency: Operations in flight at once (defaults to the pool size)
+        """
+        self.file_manager = file_manager or FileManager()
+        max_workers = max_workers or min(32, (os.cpu_count() or 1) + 4)
+        self._owns_executor = executor is None
+        self.executor = executor or ThreadPoolExecutor(max_workers=max_workers,
+                                                       thread_name_prefix="culturabuilder-async")
+        self.max_concurrency = max_concurrency or max_workers
+        # Semaphores are bound to the running loop, so one is created per loop
+        self._semaphores: Dict[int, asyncio.Semaphore] = {}
+
+    def _semaphore(self) -> asyncio.Semaphore:
+        loop = asyncio.get_running_loop()
+        semaphore = self._semaphores.get(id(loop))
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(self.max_concurrency)
+            self._semaphores[id(loop)] = semaphore
+        return semaphore
+
+    async def run(self, func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """
+        Run a blocking callable on the executor within the concurrency limit
+
+        Args:
+            func: Callable to run
+            *args: Positional arguments
+            **kwargs: Keyword arguments
+
+        Returns:
+            Result of func
+        """
+        async with self._semaphore():
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self.executor, functools.partial(func, *args, **kwargs))
+
+    async def copy_file(self, source: Path, target: Path, preserve_permissions: bool = True) -> bool:
+        """Async FileManager.copy_file"""
+        return await self.run(self.file_manager.copy_file, source, target, preserve_permissions)
+
+    async def link_file(self, source: Path, target: Path, link_mode: str = 'symlink') -> bool:
+        """Async FileManager.link_file"""
+        return await self.run(self.file_manager.link_file, source, target, link_mode)
+
+    async def copy_directory(self, source: Path, target: Path,
+                             ignore_patterns: Optional[List[str]] = None) -> bool:
+        """Async FileManager.copy_directory"""
+        return await self.run(self.file_manager.copy_directory, source, target, ignore_patterns)
+
+    async def ensure_directory(self, directory: Path, mode: int = 0o755) -> bool:
+        """Async FileManager.ensure_directory"""
+        return await self.run(self.file_manager.ensure_directory, directory, mode)
+
+    async def remove_file(self, file_path: Path) -> bool:
+        """Async FileManager.remove_file"""
+        return await self.run(self.file_manager.remove_file, file_path)
+
+    async def remove_directory(self, directory: Path, recursive: bool = False) -> bool:
+        """Async FileManager.remove_directory"""
+        return await self.run(self.file_manager.remove_directory, directory, recursive)
+
+    async def get_file_hash(self, file_path: Path, algorithm: str = 'sha256') -> Optional[str]:
+        """Async FileManager.get_file_hash"""
+        return await self.run(self.file_manager.get_file_hash, file_path, algorithm)
+
+    async def verify_file_integrity(self, file_path: Path, expected_hash: str,
+                                    algorithm: str = 'sha256') -> bool:
+        """Async FileManager.verify_file_integrity"""
+        return await self.run(self.file_manager.verify_file_integrity, file_path, expected_hash, algorithm)
+
+    async def get_directory_size(self, directory: Path) -> int:
+        """Async FileManager.get_directory_size"""
+        return await self.run(self.file_manager.get_directory_size, directory)
+
+    async def find_files(self, directory: Path, pattern: str = '*', recursive: bool = True) -> List[Path]:
+        """Async FileManager.find_files"""
+        return await self.run(self.file_manager.find_files, directory, pattern, recursive)
+
+    async def copy_files(self, files: Iterable[Tuple[Path, Path]]) -> List[bool]:
+        """
+        Copy many files concurrently
+
+        If the call is cancelled, or a copy raises, copies that have not
+        started are cancelled too.
+
+        Args:
+            files: (source, target) tuples
+
+        Returns:
+            List of per-file results, in input order
+        """
+        return await self._gather(self.copy_file(source, target) for source, target in files)
+
+    async def hash_files(self, file_paths: Iterable[Path], algorithm: str = 'sha256') -> Dict[Path, Optional[str]]:
+        """
+        Hash many files concurrently
+
+        Args:
+            file_paths: Files to hash
+            algorithm: Hash algorithm (md5, sha1, sha256, etc.)
+
+        Returns:
+            Dict of file_path -> hex hash (None if error)
+        """
+        file_paths = list(file_paths)
+        digests = await self._gather(self.get_file_hash(file_path, algorithm) for file_path in file_paths)
+        return dict(zip(file_paths, digests))
+
+    @staticmethod
+    async def _gather(coroutines: Iterable[Any]) -> List[Any]:
+        """gather() that cancels the remaining tasks on cancellation or error"""
+        tasks = [asyncio.ensure_future(coroutine) for coroutine in coroutines]
+        try:
+            return await asyncio.gather(*tasks)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            raise
+
+    async def close(self) -> None:
+        """Shut down the private executor after running operations finish"""
+        if self._owns_executor:
+            loop = asyncio.get_running_loop()
+            await loop.run_in_executor(None, functools.partial(self.executor.shutdown, wait=True))
+
+    async def __aenter__(self) -> "AsyncFileManager":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.close()
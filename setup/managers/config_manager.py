@@ -2,10 +2,15 @@
 Configuration management for CulturaBuilder installation system
 """
 
+import hashlib
 import json
+import threading
 from typing import Dict, Any, List, Optional
 from pathlib import Path
 
+from .persistent_cache import read_cache_file, write_cache_file
+from ..utils import json_codec
+
 # Handle jsonschema import - if not available, use basic validation
 try:
     import jsonschema
@@ -36,15 +41,146 @@ except ImportError:
         # Skip detailed validation if jsonschema not available
 
 
+# Validators compiled once per process, keyed by schema fingerprint
+_validators: Dict[str, Any] = {}
+_validators_lock = threading.Lock()
+
+# Sentinel for "use the default validation cache file"
+_DEFAULT = object()
+
+
+def schema_fingerprint(schema: Dict[str, Any]) -> str:
+    """
+    Hash of a schema's canonical JSON form
+
+    Args:
+        schema: JSON schema
+
+    Returns:
+        Hex SHA-256 digest
+    """
+    canonical = json.dumps(schema, sort_keys=True, separators=(',', ':'))
+    return hashlib.sha256(canonical.encode('utf-8')).hexdigest()
+
+
+def get_validator(schema: Dict[str, Any], fingerprint: Optional[str] = None) -> Any:
+    """
+    Get the compiled validator for a schema
+
+    With jsonschema installed the validator class is selected and the
+    schema compiled on first use only; without it the basic fallback
+    validation is used.
+
+    Args:
+        schema: JSON schema
+        fingerprint: Precomputed schema_fingerprint() of the schema
+
+    Returns:
+        Object with a validate(instance) method raising ValidationError
+    """
+    key = fingerprint or schema_fingerprint(schema)
+    with _validators_lock:
+        validator = _validators.get(key)
+        if validator is None:
+            if JSONSCHEMA_AVAILABLE:
+                validator_class = jsonschema.validators.validator_for(schema)
+                validator = validator_class(schema)
+            else:
+                validator = _BasicValidator(schema)
+            _validators[key] = validator
+        return validator
+
+
+class _BasicValidator:
+    """Validator interface over the fallback validate() function"""
+
+    def __init__(self, schema: Dict[str, Any]):
+        self.schema = schema
+
+    def validate(self, instance: Any) -> None:
+        validate(instance=instance, schema=self.schema)
+
+
+class ValidationCache:
+    """
+    Persistent set of config file contents known to be valid
+
+    Keys combine the SHA-256 of the file bytes with the fingerprint of the
+    schema (and validator kind) they were checked against, so editing a
+    file, changing a schema or installing jsonschema all force a fresh
+    validation.
+    """
+
+    # Bump when the on-disk layout changes; older files are ignored
+    FORMAT_VERSION = 1
+
+    def __init__(self, cache_file: Optional[Path], max_entries: int = 256):
+        """
+        Initialize validation cache
+
+        Args:
+            cache_file: JSON file backing the cache (None keeps it in memory only)
+            max_entries: Maximum number of keys kept, oldest dropped first
+        """
+        self.cache_file = cache_file
+        self.max_entries = max_entries
+        self._entries: Optional[List[str]] = None
+
+    @staticmethod
+    def make_key(content: bytes, fingerprint: str) -> str:
+        """
+        Build cache key for file content validated against a schema
+
+        Args:
+            content: Raw file bytes
+            fingerprint: Schema fingerprint
+
+        Returns:
+            Key string
+        """
+        kind = "jsonschema" if JSONSCHEMA_AVAILABLE else "basic"
+        return f"{hashlib.sha256(content).hexdigest()}:{fingerprint[:16]}:{kind}"
+
+    def contains(self, key: str) -> bool:
+        """Check whether content with this key already passed validation"""
+        return key in self._load()
+
+    def add(self, key: str) -> None:
+        """
+        Mark content as valid and persist the cache
+
+        Args:
+            key: Key from make_key()
+        """
+        entries = self._load()
+        if key in entries:
+            return
+        entries.append(key)
+        del entries[:-self.max_entries]
+
+        if self.cache_file is not None:
+            write_cache_file(self.cache_file, self.FORMAT_VERSION, entries)
+
+    def _load(self) -> List[str]:
+        """Read keys from disk on first use"""
+        if self._entries is not None:
+            return self._entries
+        entries = read_cache_file(self.cache_file, self.FORMAT_VERSION)
+        self._entries = [key for key in entries if isinstance(key, str)] if isinstance(entries, list) else []
+        return self._entries
+
+
 class ConfigManager:
     """Manages configuration files and validation"""
     
-    def __init__(self, config_dir: Path):
+    def __init__(self, config_dir: Path, validation_cache_file: Any = _DEFAULT):
         """
         Initialize config manager
         
         Args:
             config_dir: Directory containing configuration files
+            validation_cache_file: File remembering already-validated file
+                contents (defaults to VALIDATION_CACHE_FILE, None disables it)
         """
         self.config_dir = config_dir
         self.features_file = config_dir / "features.json"
@@ -52,6 +188,11 @@ class ConfigManager:
         self._features_cache = None
         self._requirements_cache = None
         
+        if validation_cache_file is _DEFAULT:
+            from .. import VALIDATION_CACHE_FILE
+            validation_cache_file = VALIDATION_CACHE_FILE
+        self.validation_cache = ValidationCache(validation_cache_file)
+        
         # Schema for features.json
         self.features_schema = {
             "type": "object",
@@ -169,16 +310,12 @@ class ConfigManager:
             raise FileNotFoundError(f"Features config not found: {self.features_file}")
         
         try:
-            with open(self.features_file, 'r') as f:
-                features = json.load(f)
-                
-            # Validate schema
-            validate(instance=features, schema=self.features_schema)
+            features = self._load_validated(self.features_file, self.features_schema)
             
             self._features_cache = features
             return features
             
-        except json.JSONDecodeError as e:
+        except json_codec.JSONDecodeError as e:
             raise ValidationError(f"Invalid JSON in {self.features_file}: {e}")
         except ValidationError as e:
             raise ValidationError(f"Invalid features schema: {e.message}")
@@ -201,16 +338,12 @@ class ConfigManager:
             raise FileNotFoundError(f"Requirements config not found: {self.requirements_file}")
         
         try:
-            with open(self.requirements_file, 'r') as f:
-                requirements = json.load(f)
-                
-            # Validate schema
-            validate(instance=requirements, schema=self.requirements_schema)
+            requirements = self._load_validated(self.requirements_file, self.requirements_schema)
             
             self._requirements_cache = requirements
             return requirements
             
-        except json.JSONDecodeError as e:
+        except json_codec.JSONDecodeError as e:
             raise ValidationError(f"Invalid JSON in {self.requirements_file}: {e}")
         except ValidationError as e:
             raise ValidationError(f"Invalid requirements schema: {e.message}")
@@ -296,27 +429,34 @@ class ConfigManager:
             raise FileNotFoundError(f"Profile not found: {profile_path}")
         
         try:
-            with open(profile_path, 'r') as f:
-                profile = json.load(f)
-                
+            with open(profile_path, 'rb') as f:
+                content = f.read()
+            profile = json_codec.loads(content)
+            
+            # Profiles are only valid relative to the available components
+            features = self.load_features()
+            available_components = set(features.get("components", {}).keys())
+            fingerprint = schema_fingerprint({"profile": sorted(available_components)})
+            cache_key = self.validation_cache.make_key(content, fingerprint)
+            if self.validation_cache.contains(cache_key):
+                return profile
+            
             # Basic validation
-            if "components" not in profile:
+            if not isinstance(profile, dict) or "components" not in profile:
                 raise ValidationError("Profile must contain 'components' field")
                 
             if not isinstance(profile["components"], list):
                 raise ValidationError("Profile 'components' must be a list")
             
             # Validate that all components exist
-            features = self.load_features()
-            available_components = set(features.get("components", {}).keys())
-            
             for component in profile["components"]:
                 if component not in available_components:
                     raise ValidationError(f"Unknown component in profile: {component}")
             
+            self.validation_cache.add(cache_key)
             return profile
             
-        except json.JSONDecodeError as e:
+        except json_codec.JSONDecodeError as e:
             raise ValidationError(f"Invalid JSON in {profile_path}: {e}")
     
     def get_system_requirements(self) -> Dict[str, Any]:
@@ -393,6 +533,32 @@ class ConfigManager:
         
         return errors
     
+    def _load_validated(self, path: Path, schema: Dict[str, Any]) -> Any:
+        """
+        Load a JSON file and validate it unless this exact content already passed
+        
+        Args:
+            path: JSON file
+            schema: Schema to validate against
+            
+        Returns:
+            Parsed file content
+            
+        Raises:
+            JSONDecodeError: If the file is not valid JSON
+            ValidationError: If the content does not match the schema
+        """
+        with open(path, 'rb') as f:
+            content = f.read()
+        data = json_codec.loads(content)
+        
+        fingerprint = schema_fingerprint(schema)
+        cache_key = self.validation_cache.make_key(content, fingerprint)
+        if not self.validation_cache.contains(cache_key):
+            get_validator(schema, fingerprint).validate(data)
+            self.validation_cache.add(cache_key)
+        return data
+    
     def clear_cache(self) -> None:
         """Clear cached configuration data"""
         self._features_cache = None
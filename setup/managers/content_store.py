@@ -0,0 +1,178 @@
+"""
+Versioned read-only content store for CulturaBuilder installation system
+Holds one immutable copy of each component's files for link-based installs
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import stat
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from .copy_engine import CopyEngine
+from ..utils.walker import walk_tree
+
+
+class ContentStore:
+    """Shared store of component files, laid out as <root>/<version>/<component>-<digest>/"""
+
+    # Written last; a store entry without it is incomplete and ignored
+    MANIFEST_NAME = ".culturabuilder-store.json"
+
+    READ_ONLY_FILE_MODE = 0o444
+    READ_ONLY_DIR_MODE = 0o555
+
+    def __init__(self, root: Path, copy_engine: Optional[CopyEngine] = None):
+        """
+        Initialize content store
+
+        Args:
+            root: Store root directory (may be shared between users)
+            copy_engine: Copy engine used to populate entries
+        """
+        self.root = root
+        self.copy_engine = copy_engine or CopyEngine()
+
+    @staticmethod
+    def content_digest(files: List[Tuple[Path, str]]) -> Tuple[str, Dict[str, str]]:
+        """
+        Compute digest identifying a set of files
+
+        Args:
+            files: List of (source_path, relative_name) tuples
+
+        Returns:
+            Tuple of (short digest of the whole set, relative_name -> sha256)
+        """
+        hashes = {}
+        for source, name in files:
+            hasher = hashlib.sha256()
+            with open(source, 'rb') as f:
+                for chunk in iter(lambda: f.read(1024 * 1024), b''):
+                    hasher.update(chunk)
+            hashes[name] = hasher.hexdigest()
+
+        combined = hashlib.sha256()
+        for name in sorted(hashes):
+            combined.update(f"{name}\0{hashes[name]}\n".encode('utf-8'))
+        return combined.hexdigest()[:16], hashes
+
+    def entry_dir(self, component: str, version: str, digest: str) -> Path:
+        """
+        Get directory of a store entry
+
+        Args:
+            component: Component name
+            version: Component version
+            digest: Content digest from content_digest()
+
+        Returns:
+            Path of the entry directory
+        """
+        return self.root / version / f"{component}-{digest}"
+
+    def is_complete(self, entry: Path) -> bool:
+        """
+        Check whether a store entry was fully written
+
+        Args:
+            entry: Entry directory
+
+        Returns:
+            True if the entry manifest exists
+        """
+        return (entry / self.MANIFEST_NAME).is_file()
+
+    def ensure_component(self, component: str, version: str,
+                         files: List[Tuple[Path, str]]) -> Path:
+        """
+        Make sure the store holds a component's files, adding them if needed
+
+        Entries are built in a temporary directory and renamed into place, so
+        concurrent installers either see a complete entry or none at all.
+
+        Args:
+            component: Component name
+            version: Component version
+            files: List of (source_path, relative_name) tuples
+
+        Returns:
+            Path of the entry directory
+
+        Raises:
+            OSError: If the store cannot be written
+        """
+        digest, hashes = self.content_digest(files)
+        entry = self.entry_dir(component, version, digest)
+        if self.is_complete(entry):
+            return entry
+
+        entry.parent.mkdir(parents=True, exist_ok=True)
+        staging = entry.with_name(f".{entry.name}.{os.getpid()}.tmp")
+        if staging.exists():
+            self._remove_tree(staging)
+
+        try:
+            for source, name in files:
+                target = staging / name
+                target.parent.mkdir(parents=True, exist_ok=True)
+                self.copy_engine.copy(source, target)
+                os.chmod(target, self.READ_ONLY_FILE_MODE)
+
+            manifest = {
+                "component": component,
+                "version": version,
+                "digest": digest,
+                "files": hashes
+            }
+            with open(staging / self.MANIFEST_NAME, 'w', encoding='utf-8') as f:
+                json.dump(manifest, f, indent=2, sort_keys=True)
+            os.chmod(staging / self.MANIFEST_NAME, self.READ_ONLY_FILE_MODE)
+
+            for item in reversed(list(walk_tree(staging))):
+                if item.is_dir:
+                    os.chmod(item.path, self.READ_ONLY_DIR_MODE)
+            os.chmod(staging, self.READ_ONLY_DIR_MODE)
+
+            try:
+                os.rename(staging, entry)
+            except OSError:
+                # Another installer finished the same entry first
+                if not self.is_complete(entry):
+                    raise
+                self._remove_tree(staging)
+        except Exception:
+            if staging.exists():
+                self._remove_tree(staging)
+            raise
+
+        return entry
+
+    def list_entries(self) -> List[Path]:
+        """
+        List complete store entries
+
+        Returns:
+            Sorted list of entry directories
+        """
+        if not self.root.exists():
+            return []
+        return sorted(
+            entry for version_dir in self.root.iterdir() if version_dir.is_dir()
+            for entry in version_dir.iterdir()
+            if entry.is_dir() and self.is_complete(entry)
+        )
+
+    @classmethod
+    def _remove_tree(cls, directory: Path) -> None:
+        """Remove a (possibly read-only) store directory"""
+        def make_writable(func, path, _exc_info):
+            parent = os.path.dirname(path)
+            os.chmod(parent, os.stat(parent).st_mode | stat.S_IWUSR)
+            os.chmod(path, os.lstat(path).st_mode | stat.S_IWUSR)
+            func(path)
+
+        os.chmod(directory, os.stat(directory).st_mode | stat.S_IWUSR)
+        shutil.rmtree(directory, onerror=make_writable)
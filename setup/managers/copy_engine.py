@@ -0,0 +1,191 @@
+"""
+Zero-copy file copying for CulturaBuilder installation system
+Tries reflink, copy_file_range and sendfile before falling back to userspace buffers
+"""
+
+import errno
+import os
+import shutil
+import sys
+import threading
+from pathlib import Path
+from typing import Dict, List, Optional, Set, Tuple
+
+try:
+    import fcntl
+    FCNTL_AVAILABLE = True
+except ImportError:
+    FCNTL_AVAILABLE = False
+
+
+# ioctl request number for FICLONE (_IOW(0x94, 9, int)) on Linux
+FICLONE = 0x40049409
+
+# Errors meaning "this strategy is not possible here", never "the copy failed"
+_UNSUPPORTED_ERRNOS = {
+    errno.EXDEV, errno.EINVAL, errno.ENOSYS, errno.ENOTTY,
+    errno.EOPNOTSUPP, errno.EBADF, errno.EPERM,
+    getattr(errno, 'ENOTSUP', errno.EOPNOTSUPP),
+}
+
+
+class CopyEngine:
+    """Copies file contents using the fastest strategy the platform supports"""
+
+    REFLINK = "reflink"
+    COPY_FILE_RANGE = "copy_file_range"
+    SENDFILE = "sendfile"
+    USERSPACE = "userspace"
+
+    # Strategies in order of preference
+    STRATEGIES = (REFLINK, COPY_FILE_RANGE, SENDFILE, USERSPACE)
+
+    # Chunk size for copy_file_range/sendfile loops
+    CHUNK_SIZE = 64 * 1024 * 1024
+
+    def __init__(self, strategies: Optional[List[str]] = None):
+        """
+        Initialize copy engine
+
+        Args:
+            strategies: Strategies to try in order (defaults to all available);
+                        the userspace fallback is always appended
+        """
+        strategies = list(strategies) if strategies else list(self.STRATEGIES)
+        unknown = [name for name in strategies if name not in self.STRATEGIES]
+        if unknown:
+            raise ValueError(f"Unknown copy strategies: {unknown}")
+        if self.USERSPACE not in strategies:
+            strategies.append(self.USERSPACE)
+
+        self.strategies = [name for name in strategies if self.is_available(name)]
+        self.counts: Dict[str, int] = {name: 0 for name in self.STRATEGIES}
+        # (source device, target device, strategy) combinations known not to work
+        self._unsupported: Set[Tuple[int, int, str]] = set()
+        self._lock = threading.Lock()
+
+    @classmethod
+    def is_available(cls, strategy: str) -> bool:
+        """
+        Check whether a strategy can work on this platform at all
+
+        Args:
+            strategy: Strategy name
+
+        Returns:
+            True if the strategy may be attempted
+        """
+        if strategy == cls.REFLINK:
+            return FCNTL_AVAILABLE and sys.platform.startswith("linux")
+        if strategy == cls.COPY_FILE_RANGE:
+            return hasattr(os, "copy_file_range")
+        if strategy == cls.SENDFILE:
+            # macOS/BSD sendfile only writes to sockets
+            return hasattr(os, "sendfile") and sys.platform.startswith("linux")
+        return strategy == cls.USERSPACE
+
+    def copy(self, source: Path, target: Path, preserve_metadata: bool = True) -> str:
+        """
+        Copy a file's contents and metadata
+
+        Args:
+            source: Source file path
+            target: Target file path (overwritten if present)
+            preserve_metadata: Copy timestamps and flags like shutil.copy2;
+                               otherwise only permission bits like shutil.copy
+
+        Returns:
+            Name of the strategy that copied the data
+
+        Raises:
+            OSError: If the copy fails with every strategy
+        """
+        strategy = self.copy_contents(source, target)
+
+        if preserve_metadata:
+            shutil.copystat(source, target)
+        else:
+            shutil.copymode(source, target)
+
+        return strategy
+
+    def copy_contents(self, source: Path, target: Path) -> str:
+        """
+        Copy file contents only
+
+        Args:
+            source: Source file path
+            target: Target file path (overwritten if present)
+
+        Returns:
+            Name of the strategy that copied the data
+        """
+        with open(source, 'rb') as fsrc:
+            source_stat = os.fstat(fsrc.fileno())
+            with open(target, 'wb') as fdst:
+                target_dev = os.fstat(fdst.fileno()).st_dev
+
+                for strategy in self.strategies:
+                    key = (source_stat.st_dev, target_dev, strategy)
+                    if key in self._unsupported:
+                        continue
+
+                    try:
+                        if self._copy_with(strategy, fsrc, fdst, source_stat.st_size):
+                            with self._lock:
+                                self.counts[strategy] += 1
+                            return strategy
+                    except OSError as e:
+                        if e.errno not in _UNSUPPORTED_ERRNOS:
+                            raise
+                        with self._lock:
+                            self._unsupported.add(key)
+
+                    # Rewind both ends before trying the next strategy
+                    fsrc.seek(0)
+                    fdst.seek(0)
+                    fdst.truncate()
+
+        raise OSError(f"No copy strategy succeeded for {source}")
+
+    def _copy_with(self, strategy: str, fsrc, fdst, size: int) -> bool:
+        """Run a single strategy; False means it could not copy this file"""
+        if strategy == self.REFLINK:
+            fcntl.ioctl(fdst.fileno(), FICLONE, fsrc.fileno())
+            return True
+
+        if strategy == self.COPY_FILE_RANGE:
+            return self._copy_loop(os.copy_file_range, fsrc.fileno(), fdst.fileno(), size)
+
+        if strategy == self.SENDFILE:
+            return self._copy_loop(self._sendfile, fsrc.fileno(), fdst.fileno(), size)
+
+        shutil.copyfileobj(fsrc, fdst, 1024 * 1024)
+        return True
+
+    def _copy_loop(self, copy_func, src_fd: int, dst_fd: int, size: int) -> bool:
+        """Drive a kernel copy call until the whole file is transferred"""
+        copied = 0
+        while True:
+            sent = copy_func(src_fd, dst_fd, self.CHUNK_SIZE)
+            if sent == 0:
+                break
+            copied += sent
+
+        # Some filesystems (procfs, some FUSE) report a size but copy nothing
+        return copied > 0 or size == 0
+
+    @staticmethod
+    def _sendfile(src_fd: int, dst_fd: int, count: int) -> int:
+        """sendfile with copy_file_range's argument order"""
+        return os.sendfile(dst_fd, src_fd, None, count)
+
+    def get_counts(self) -> Dict[str, int]:
+        """
+        Get number of files copied per strategy
+
+        Returns:
+            Dict of strategy name -> file count
+        """
+        with self._lock:
+            return dict(self.counts)
@@ -0,0 +1,411 @@
+"""
+Write-ahead file operation journal for CulturaBuilder installation system
+Lets a later process roll back (or inspect) an install that was interrupted
+"""
+
+import json
+import os
+import shutil
+import threading
+import uuid
+from collections import OrderedDict
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Set
+
+
+class FileJournal:
+    """
+    Append-only JSON-lines journal of file operations
+
+    Every operation is recorded as an intent *before* it touches the file
+    system, together with a pre-image of what it will replace (a hardlink of
+    the old file, the old symlink target, or the renamed-away directory).
+    A matching "done" record follows once the operation succeeded. A journal
+    without a final "commit" or "rollback" record belongs to an interrupted
+    run and can be rolled back by any later process.
+    """
+
+    JOURNAL_SUFFIX = ".journal"
+    UNDO_SUFFIX = ".undo"
+
+    OPEN = "open"
+    COMMITTED = "committed"
+    ROLLED_BACK = "rolled_back"
+
+    def __init__(self, journal_file: Path, sync: bool = True):
+        """
+        Initialize journal (use begin() or load() instead of calling directly)
+
+        Args:
+            journal_file: JSON-lines journal file
+            sync: fsync each intent record before the operation runs
+        """
+        self.journal_file = journal_file
+        self.undo_dir = journal_file.with_suffix(self.UNDO_SUFFIX)
+        self.txid = journal_file.stem
+        self.sync = sync
+        self.pid: Optional[int] = None
+        self.state = self.OPEN
+        self.intents: "OrderedDict[int, Dict[str, Any]]" = OrderedDict()
+        self.done: Set[int] = set()
+        self._seq = 0
+        self._lock = threading.Lock()
+        self._file = None
+
+    @classmethod
+    def begin(cls, journal_dir: Path, sync: bool = True) -> "FileJournal":
+        """
+        Start a new journal
+
+        Args:
+            journal_dir: Directory holding journals
+            sync: fsync each intent record before the operation runs
+
+        Returns:
+            Open FileJournal
+        """
+        journal_dir.mkdir(parents=True, exist_ok=True)
+        txid = f"{datetime.now().strftime('%Y%m%d_%H%M%S')}_{os.getpid()}_{uuid.uuid4().hex[:8]}"
+        journal = cls(journal_dir / f"{txid}{cls.JOURNAL_SUFFIX}", sync)
+        journal.pid = os.getpid()
+        journal._append({"op": "begin", "txid": txid, "pid": journal.pid,
+                         "time": datetime.now().isoformat()}, force_sync=True)
+        return journal
+
+    @classmethod
+    def load(cls, journal_file: Path) -> "FileJournal":
+        """
+        Read an existing journal
+
+        A torn final line (from a crash mid-write) is ignored.
+
+        Args:
+            journal_file: Journal file to read
+
+        Returns:
+            FileJournal reflecting the recorded state
+        """
+        journal = cls(journal_file)
+        with open(journal_file, 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    break
+
+                op = record.get("op")
+                if op == "begin":
+                    journal.pid = record.get("pid")
+                elif op == "intent":
+                    journal.intents[record["seq"]] = record
+                    journal._seq = max(journal._seq, record["seq"])
+                elif op == "done":
+                    journal.done.add(record["seq"])
+                elif op == "commit":
+                    journal.state = cls.COMMITTED
+                elif op == "rollback":
+                    journal.state = cls.ROLLED_BACK
+        return journal
+
+    @classmethod
+    def find_incomplete(cls, journal_dir: Path) -> List["FileJournal"]:
+        """
+        Find journals left open by processes that are no longer running
+
+        Args:
+            journal_dir: Directory holding journals
+
+        Returns:
+            List of open journals, oldest first
+        """
+        if not journal_dir.is_dir():
+            return []
+
+        incomplete = []
+        for journal_file in sorted(journal_dir.glob(f"*{cls.JOURNAL_SUFFIX}")):
+            try:
+                journal = cls.load(journal_file)
+            except (OSError, KeyError):
+                continue
+            if journal.state == cls.OPEN and not cls._pid_alive(journal.pid):
+                incomplete.append(journal)
+        return incomplete
+
+    def record_intent(self, action: str, path: Path, **details: Any) -> int:
+        """
+        Record an operation before performing it and save what it replaces
+
+        Actions: "write" (file created or overwritten), "mkdir" (with
+        tree=True, directories created below it are removed on rollback too),
+        "remove" (single file or link), "rmdir" (empty directory) and "rmtree"
+        (directory tree, which is moved into the journal's undo area, so the
+        caller finds it already gone).
+
+        Args:
+            action: Operation about to run
+            path: Path the operation changes
+            **details: Extra JSON-serializable fields stored with the record
+
+        Returns:
+            Sequence number to pass to record_done()
+        """
+        with self._lock:
+            self._seq += 1
+            seq = self._seq
+            record: Dict[str, Any] = {"op": "intent", "seq": seq, "action": action,
+                                      "path": str(path), "existed": os.path.lexists(path)}
+            record.update(details)
+
+            if record["existed"] and action in ("write", "remove", "rmtree"):
+                if os.path.islink(path):
+                    record["link_target"] = os.readlink(path)
+                else:
+                    record["undo"] = str(seq)
+
+            self.intents[seq] = record
+            self._append(record)
+
+            if "undo" in record:
+                self._save_pre_image(path, self.undo_dir / record["undo"], action == "rmtree")
+
+            return seq
+
+    def record_done(self, seq: int) -> None:
+        """
+        Record that an operation completed
+
+        Args:
+            seq: Sequence number from record_intent()
+        """
+        with self._lock:
+            self.done.add(seq)
+            self._append({"op": "done", "seq": seq})
+
+    def completed(self) -> "OrderedDict[Path, str]":
+        """
+        Get paths whose recorded operations completed, in order
+
+        Returns:
+            Ordered dict of path -> action
+        """
+        return OrderedDict(
+            (Path(record["path"]), record["action"])
+            for seq, record in self.intents.items() if seq in self.done
+        )
+
+    def pending(self) -> List[Dict[str, Any]]:
+        """
+        Get intents that never completed
+
+        Returns:
+            List of intent records
+        """
+        return [record for seq, record in self.intents.items() if seq not in self.done]
+
+    def commit(self) -> None:
+        """Mark the journal complete and discard its undo data"""
+        with self._lock:
+            self._append({"op": "commit"}, force_sync=True)
+            self.state = self.COMMITTED
+            self._close()
+            self._discard()
+
+    def rollback(self, pending_only: bool = False) -> List[str]:
+        """
+        Undo every recorded operation, newest first, then discard the journal
+
+        Intents without a "done" record are undone too, since the operation
+        may have been cut off half way.
+
+        Args:
+            pending_only: Only undo operations that never completed (used when
+                          an interrupted installation is resumed rather than reverted)
+
+        Returns:
+            List of error messages for operations that could not be undone
+        """
+        with self._lock:
+            records = self.pending() if pending_only else list(self.intents.values())
+            errors = self._undo_all(records)
+
+            self._append({"op": "rollback", "errors": len(errors)}, force_sync=True)
+            self.state = self.ROLLED_BACK
+            self._close()
+            if not errors:
+                self._discard()
+        return errors
+
+    def mark(self) -> int:
+        """
+        Get the sequence number of the latest recorded operation
+
+        Returns:
+            Sequence number to pass to rollback_after()
+        """
+        with self._lock:
+            return self._seq
+
+    def rollback_after(self, seq: int) -> List[str]:
+        """
+        Undo the operations recorded after a mark and commit the earlier ones
+
+        Used when an installation is cancelled: components that finished keep
+        their files, only the unfinished one is reverted.
+
+        Args:
+            seq: Sequence number from mark()
+
+        Returns:
+            List of error messages for operations that could not be undone
+        """
+        with self._lock:
+            errors = self._undo_all([record for record_seq, record in self.intents.items() if record_seq > seq])
+
+            self._append({"op": "commit", "rolled_back_after": seq, "errors": len(errors)}, force_sync=True)
+            self.state = self.COMMITTED
+            self._close()
+            if not errors:
+                self._discard()
+        return errors
+
+    def _undo_all(self, records: List[Dict[str, Any]]) -> List[str]:
+        """Undo records newest first, collecting errors (caller holds the lock)"""
+        errors = []
+        for record in reversed(records):
+            try:
+                self._undo(record)
+            except OSError as e:
+                errors.append(f"Could not undo {record['action']} of {record['path']}: {e}")
+        return errors
+
+    def _undo(self, record: Dict[str, Any]) -> None:
+        """Reverse a single intent"""
+        path = Path(record["path"])
+        action = record["action"]
+
+        if action == "mkdir":
+            if not record["existed"] and path.is_dir():
+                if record.get("tree"):
+                    # Remove directories copytree created below it, deepest first
+                    for directory, _, _ in sorted(os.walk(path), key=lambda item: len(item[0]), reverse=True):
+                        if directory != str(path):
+                            self._rmdir_if_empty(Path(directory))
+                self._rmdir_if_empty(path)
+            return
+
+        if action == "rmdir":
+            if record["existed"] and not os.path.lexists(path):
+                path.mkdir(parents=True, exist_ok=True)
+            return
+
+        if action == "rmtree" and "undo" not in record and "link_target" not in record:
+            return
+
+        undo = self.undo_dir / record["undo"] if "undo" in record else None
+        if undo is not None and not os.path.lexists(undo):
+            # The pre-image was never saved, so the operation never started
+            return
+
+        if action == "write" and os.path.lexists(path) and not path.is_dir():
+            path.unlink()
+
+        if undo is not None:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            os.replace(undo, path)
+        elif "link_target" in record:
+            if os.path.lexists(path):
+                path.unlink()
+            os.symlink(record["link_target"], path)
+
+    @staticmethod
+    def _rmdir_if_empty(directory: Path) -> None:
+        try:
+            directory.rmdir()
+        except OSError:
+            pass  # Not empty (holds files we did not create) or already gone
+
+    def _save_pre_image(self, path: Path, undo: Path, move: bool) -> None:
+        """Preserve the current content of path under the undo directory"""
+        self.undo_dir.mkdir(parents=True, exist_ok=True)
+        if move:
+            os.rename(path, undo)
+            return
+        try:
+            # A second link makes FileManager write a new inode instead of in place
+            os.link(path, undo)
+        except OSError:
+            shutil.copy2(path, undo)
+
+    def _append(self, record: Dict[str, Any], force_sync: bool = False) -> None:
+        """Append one record (caller holds the lock)"""
+        if self._file is None:
+            self._file = open(self.journal_file, 'a', encoding='utf-8')
+        self._file.write(json.dumps(record, separators=(',', ':')) + '\n')
+        self._file.flush()
+        if force_sync or (self.sync and record.get("op") == "intent"):
+            os.fsync(self._file.fileno())
+
+    def _close(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def _discard(self) -> None:
+        """Delete the journal file and its undo data"""
+        shutil.rmtree(self.undo_dir, ignore_errors=True)
+        try:
+            self.journal_file.unlink()
+        except OSError:
+            pass
+
+    @staticmethod
+    def _pid_alive(pid: Optional[int]) -> bool:
+        """Check whether the process that wrote a journal is still running"""
+        if not pid or pid == os.getpid():
+            return False
+        if os.name == 'nt':
+            return FileJournal._windows_pid_alive(pid)
+        try:
+            os.kill(pid, 0)
+        except ProcessLookupError:
+            return False
+        except PermissionError:
+            return True
+        return True
+
+    @staticmethod
+    def _windows_pid_alive(pid: int) -> bool:
+        """
+        Check whether a process is running on Windows
+
+        When liveness cannot be determined the process is assumed alive, so a
+        journal that might still be written to is never rolled back.
+        """
+        try:
+            import ctypes
+            from ctypes import wintypes
+        except ImportError:
+            return True
+
+        PROCESS_QUERY_LIMITED_INFORMATION = 0x1000
+        STILL_ACTIVE = 259
+        ERROR_INVALID_PARAMETER = 87
+
+        kernel32 = ctypes.WinDLL("kernel32", use_last_error=True)
+        kernel32.OpenProcess.restype = wintypes.HANDLE
+        kernel32.OpenProcess.argtypes = (wintypes.DWORD, wintypes.BOOL, wintypes.DWORD)
+        kernel32.GetExitCodeProcess.argtypes = (wintypes.HANDLE, ctypes.POINTER(wintypes.DWORD))
+        kernel32.CloseHandle.argtypes = (wintypes.HANDLE,)
+
+        handle = kernel32.OpenProcess(PROCESS_QUERY_LIMITED_INFORMATION, False, pid)
+        if not handle:
+            # No such process; any other failure (e.g. access denied) means it exists
+            return ctypes.get_last_error() != ERROR_INVALID_PARAMETER
+        try:
+            exit_code = wintypes.DWORD()
+            if not kernel32.GetExitCodeProcess(handle, ctypes.byref(exit_code)):
+                return True
+            return exit_code.value == STILL_ACTIVE
+        finally:
+            kernel32.CloseHandle(handle)
@@ -2,27 +2,50 @@
 Cross-platform file management for CulturaBuilder installation system
 """
 
+import os
+import mmap
 import shutil
 import stat
-from typing import List, Optional, Callable, Dict, Any
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import List, Optional, Dict, Any, Iterable, Iterator, Tuple
 from pathlib import Path
-import fnmatch
 import hashlib
 
+from .copy_engine import CopyEngine
+from .file_journal import FileJournal
+from .hash_cache import HashCache
+from ..utils.ignore import IgnoreMatcher
+from ..utils.walker import TreeSnapshot, WalkEntry, pattern_parts, walk_tree
+
 
 class FileManager:
     """Cross-platform file operations manager"""
     
-    def __init__(self, dry_run: bool = False):
+    # Read buffer for hashing; files at least MMAP_THRESHOLD bytes are mapped instead
+    HASH_BUFFER_SIZE = 1024 * 1024
+    MMAP_THRESHOLD = 8 * 1024 * 1024
+    
+    def __init__(self, dry_run: bool = False, hash_cache: Optional[HashCache] = None,
+                 copy_engine: Optional[CopyEngine] = None, journal: Optional[FileJournal] = None):
         """
         Initialize file manager
         
         Args:
             dry_run: If True, only simulate file operations
+            hash_cache: Digest cache to use (defaults to an in-memory cache; pass
+                        HashCache.for_path() of the installation directory to persist it)
+            copy_engine: Copy engine to use (defaults to trying every strategy)
+            journal: Write-ahead journal recording every change (see attach_journal)
         """
         self.dry_run = dry_run
-        self.copied_files: List[Path] = []
-        self.created_dirs: List[Path] = []
+        self.copy_engine = copy_engine or CopyEngine()
+        self.journal = journal
+        # Ordered for reverse-order cleanup, keyed for O(1) removal
+        self.copied_files: "OrderedDict[Path, None]" = OrderedDict()
+        self.created_dirs: "OrderedDict[Path, None]" = OrderedDict()
+        
+        self.hash_cache = hash_cache if hash_cache is not None else HashCache()
         
     def copy_file(self, source: Path, target: Path, preserve_permissions: bool = True) -> bool:
         """
@@ -48,21 +71,93 @@ class FileManager:
         
         try:
             # Ensure target directory exists
-            target.parent.mkdir(parents=True, exist_ok=True)
+            self._make_directory(target.parent)
+            seq = self._journal_intent("write", target)
+            self._detach_target(target)
             
-            # Copy file
-            if preserve_permissions:
-                shutil.copy2(source, target)
-            else:
-                shutil.copy(source, target)
+            # Copy file (reflink/kernel copy when possible, metadata as copy2/copy)
+            self.copy_engine.copy(source, target, preserve_metadata=preserve_permissions)
+            TreeSnapshot.invalidate(target)
+            self._journal_done(seq)
             
-            self.copied_files.append(target)
+            self.copied_files[target] = None
             return True
             
         except Exception as e:
             print(f"Error copying {source} to {target}: {e}")
             return False
     
+    def link_file(self, source: Path, target: Path, link_mode: str = 'symlink') -> bool:
+        """
+        Install a file as a link to a content store file
+        
+        Args:
+            source: Store file to link to
+            target: Target file path
+            link_mode: 'symlink' or 'hardlink'
+            
+        Returns:
+            True if successful, False otherwise
+        """
+        if link_mode not in ('symlink', 'hardlink'):
+            raise ValueError(f"Unknown link mode: {link_mode}")
+        
+        if not source.is_file():
+            raise FileNotFoundError(f"Source file not found: {source}")
+        
+        if self.dry_run:
+            print(f"[DRY RUN] Would {link_mode} {target} -> {source}")
+            return True
+        
+        # Link under a temporary name, then rename over the old file
+        temp_target = target.with_name(f".{target.name}.{os.getpid()}.link")
+        try:
+            self._make_directory(target.parent)
+            
+            if not self._is_linked_to(target, source, link_mode):
+                if temp_target.is_symlink() or temp_target.exists():
+                    temp_target.unlink()
+                if link_mode == 'symlink':
+                    os.symlink(source.resolve(), temp_target)
+                else:
+                    os.link(source, temp_target)
+                seq = self._journal_intent("write", target)
+                os.replace(temp_target, target)
+                TreeSnapshot.invalidate(target)
+                self._journal_done(seq)
+            
+            self.copied_files[target] = None
+            return True
+            
+        except Exception as e:
+            print(f"Error linking {target} to {source}: {e}")
+            try:
+                temp_target.unlink()
+            except OSError:
+                pass
+            return False
+    
+    @staticmethod
+    def _is_linked_to(target: Path, source: Path, link_mode: str) -> bool:
+        """Check whether target already is the requested link to source"""
+        try:
+            if link_mode == 'symlink':
+                return target.is_symlink() and Path(os.readlink(target)) == source.resolve()
+            # rename() between two hardlinks of one inode is a no-op, so skip it
+            return not target.is_symlink() and os.path.samefile(target, source)
+        except OSError:
+            return False
+    
+    @staticmethod
+    def _detach_target(target: Path) -> None:
+        """Unlink a symlinked or hardlinked target so writes never reach a shared file"""
+        try:
+            target_stat = os.lstat(target)
+        except FileNotFoundError:
+            return
+        if stat.S_ISLNK(target_stat.st_mode) or (stat.S_ISREG(target_stat.st_mode) and target_stat.st_nlink > 1):
+            os.unlink(target)
+    
     def copy_directory(self, source: Path, target: Path, ignore_patterns: Optional[List[str]] = None) -> bool:
         """
         Recursively copy directory with gitignore-style patterns
@@ -70,7 +165,8 @@ class FileManager:
         Args:
             source: Source directory path
             target: Target directory path
-            ignore_patterns: List of patterns to ignore (gitignore style)
+            ignore_patterns: List of patterns to ignore (gitignore syntax, including
+                             negation, trailing '/' and '**')
             
         Returns:
             True if successful, False otherwise
@@ -83,37 +179,33 @@ class FileManager:
         
         ignore_patterns = ignore_patterns or []
         default_ignores = ['.git', '.gitignore', '__pycache__', '*.pyc', '.DS_Store']
-        all_ignores = ignore_patterns + default_ignores
+        # Defaults first so caller patterns (including '!' negations) take precedence
+        all_ignores = default_ignores + ignore_patterns
         
         if self.dry_run:
             print(f"[DRY RUN] Would copy directory {source} -> {target}")
             return True
         
         try:
-            # Create ignore function
-            def ignore_func(directory: str, contents: List[str]) -> List[str]:
-                ignored = []
-                for item in contents:
-                    item_path = Path(directory) / item
-                    rel_path = item_path.relative_to(source)
-                    
-                    # Check against ignore patterns
-                    for pattern in all_ignores:
-                        if fnmatch.fnmatch(item, pattern) or fnmatch.fnmatch(str(rel_path), pattern):
-                            ignored.append(item)
-                            break
-                
-                return ignored
-            
-            # Copy tree
-            shutil.copytree(source, target, ignore=ignore_func, dirs_exist_ok=True)
+            # Compiled gitignore-style matcher shared by every directory copytree visits
+            ignore_func = IgnoreMatcher(all_ignores).copytree_ignore(source)
+            
+            # Copy tree (a new target is journaled as a whole tree of directories)
+            seq = None
+            if not target.exists():
+                seq = self._journal_intent("mkdir", target, tree=True)
+            shutil.copytree(source, target, ignore=ignore_func, dirs_exist_ok=True,
+                            copy_function=self._copy_tree_file)
+            self._journal_done(seq)
+            
+            TreeSnapshot.invalidate(target)
             
             # Track created directories and files
-            for item in target.rglob('*'):
-                if item.is_dir():
-                    self.created_dirs.append(item)
+            for entry in walk_tree(target):
+                if entry.is_dir:
+                    self.created_dirs[entry.path] = None
                 else:
-                    self.copied_files.append(item)
+                    self.copied_files[entry.path] = None
             
             return True
             
@@ -121,6 +213,47 @@ class FileManager:
             print(f"Error copying directory {source} to {target}: {e}")
             return False
     
+    def _copy_tree_file(self, source: str, target: str) -> str:
+        """copytree copy_function routed through the copy engine"""
+        seq = self._journal_intent("write", Path(target))
+        self._detach_target(Path(target))
+        self.copy_engine.copy(Path(source), Path(target))
+        self._journal_done(seq)
+        return target
+    
+    def attach_journal(self, journal: Optional[FileJournal]) -> None:
+        """
+        Record subsequent file operations in a write-ahead journal
+        
+        Args:
+            journal: Open journal, or None to stop journaling
+        """
+        self.journal = journal
+    
+    def _journal_intent(self, action: str, path: Path, **details: Any) -> Optional[int]:
+        """Record an operation before running it (no-op without a journal)"""
+        if self.journal is None:
+            return None
+        return self.journal.record_intent(action, path, **details)
+    
+    def _journal_done(self, seq: Optional[int]) -> None:
+        """Record that a journaled operation completed"""
+        if seq is not None:
+            self.journal.record_done(seq)
+    
+    def _make_directory(self, directory: Path, mode: int = 0o777) -> None:
+        """mkdir -p, journaling the topmost directory that did not exist"""
+        if directory.is_dir():
+            return
+        
+        missing = directory
+        while not missing.parent.exists() and missing.parent != missing:
+            missing = missing.parent
+        
+        seq = self._journal_intent("mkdir", missing, tree=True)
+        directory.mkdir(parents=True, exist_ok=True, mode=mode)
+        self._journal_done(seq)
+    
     def ensure_directory(self, directory: Path, mode: int = 0o755) -> bool:
         """
         Create directory and parents if they don't exist
@@ -137,10 +270,10 @@ class FileManager:
             return True
         
         try:
-            directory.mkdir(parents=True, exist_ok=True, mode=mode)
+            self._make_directory(directory, mode)
+            TreeSnapshot.invalidate(directory)
             
-            if directory not in self.created_dirs:
-                self.created_dirs.append(directory)
+            self.created_dirs[directory] = None
             
             return True
             
@@ -158,7 +291,7 @@ class FileManager:
         Returns:
             True if successful, False otherwise
         """
-        if not file_path.exists():
+        if not file_path.exists() and not file_path.is_symlink():
             return True  # Already gone
         
         if self.dry_run:
@@ -166,15 +299,18 @@ class FileManager:
             return True
         
         try:
-            if file_path.is_file():
+            # Links (including dangling ones) are removed, never their targets
+            if file_path.is_symlink() or file_path.is_file():
+                seq = self._journal_intent("remove", file_path)
                 file_path.unlink()
+                TreeSnapshot.invalidate(file_path)
+                self._journal_done(seq)
             else:
                 print(f"Warning: {file_path} is not a file, skipping")
                 return False
             
             # Remove from tracking
-            if file_path in self.copied_files:
-                self.copied_files.remove(file_path)
+            self.copied_files.pop(file_path, None)
             
             return True
             
@@ -203,13 +339,18 @@ class FileManager:
         
         try:
             if recursive:
-                shutil.rmtree(directory)
+                # A journal moves the tree into its undo area instead
+                seq = self._journal_intent("rmtree", directory)
+                if directory.exists():
+                    shutil.rmtree(directory)
             else:
+                seq = self._journal_intent("rmdir", directory)
                 directory.rmdir()  # Only works if empty
+            TreeSnapshot.invalidate(directory)
+            self._journal_done(seq)
             
             # Remove from tracking
-            if directory in self.created_dirs:
-                self.created_dirs.remove(directory)
+            self.created_dirs.pop(directory, None)
             
             return True
             
@@ -264,6 +405,9 @@ class FileManager:
         """
         Calculate file hash
         
+        Digests are cached by (device, inode, size, mtime_ns), so a file is
+        only read again when it has actually changed.
+        
         Args:
             file_path: Path to file
             algorithm: Hash algorithm (md5, sha1, sha256, etc.)
@@ -271,18 +415,38 @@ class FileManager:
         Returns:
             Hex hash string or None if error
         """
-        if not file_path.exists() or not file_path.is_file():
+        try:
+            file_stat = file_path.stat()
+        except OSError:
             return None
         
+        if not stat.S_ISREG(file_stat.st_mode):
+            return None
+        
+        cached = self.hash_cache.get(file_stat, algorithm)
+        if cached is not None:
+            return cached
+        
         try:
             hasher = hashlib.new(algorithm)
             
             with open(file_path, 'rb') as f:
-                # Read in chunks for large files
-                for chunk in iter(lambda: f.read(8192), b""):
-                    hasher.update(chunk)
+                if file_stat.st_size >= self.MMAP_THRESHOLD:
+                    # Map large files so hashlib reads straight from the page cache
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                        hasher.update(mapped)
+                else:
+                    # Read in chunks for everything else
+                    for chunk in iter(lambda: f.read(self.HASH_BUFFER_SIZE), b""):
+                        hasher.update(chunk)
             
-            return hasher.hexdigest()
+            digest = hasher.hexdigest()
+            
+            # Only cache if the file did not change while we were reading it
+            if HashCache.make_key(file_path.stat(), algorithm) == HashCache.make_key(file_stat, algorithm):
+                self.hash_cache.put(file_stat, algorithm, digest)
+            
+            return digest
             
         except Exception:
             return None
@@ -302,51 +466,163 @@ class FileManager:
         actual_hash = self.get_file_hash(file_path, algorithm)
         return actual_hash is not None and actual_hash.lower() == expected_hash.lower()
     
-    def get_directory_size(self, directory: Path) -> int:
+    def hash_files(self, file_paths: Iterable[Path], algorithm: str = 'sha256',
+                   max_workers: Optional[int] = None) -> Iterator[Tuple[Path, Optional[str]]]:
+        """
+        Hash many files across a thread pool
+        
+        hashlib releases the GIL while digesting, so large files are hashed
+        in parallel. Results are yielded as soon as each file completes.
+        
+        Args:
+            file_paths: Files to hash
+            algorithm: Hash algorithm (md5, sha1, sha256, etc.)
+            max_workers: Thread pool size (defaults to CPU count + 4, max 32)
+            
+        Yields:
+            Tuples of (file_path, hex hash or None if error), in completion order
+        """
+        file_paths = list(file_paths)
+        if not file_paths:
+            return
+        
+        max_workers = max_workers or self._default_workers()
+        if max_workers <= 1 or len(file_paths) == 1:
+            for file_path in file_paths:
+                yield file_path, self.get_file_hash(file_path, algorithm)
+            return
+        
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(file_paths)),
+                                thread_name_prefix="culturabuilder-hash") as executor:
+            futures = {
+                executor.submit(self.get_file_hash, file_path, algorithm): file_path
+                for file_path in file_paths
+            }
+            for future in as_completed(futures):
+                yield futures[future], future.result()
+    
+    def verify_files(self, expected_hashes: Dict[Path, str], algorithm: str = 'sha256',
+                     max_workers: Optional[int] = None) -> Iterator[Tuple[Path, bool]]:
+        """
+        Verify many files against expected hashes across a thread pool
+        
+        Args:
+            expected_hashes: Dict of file_path -> expected hex hash
+            algorithm: Hash algorithm used
+            max_workers: Thread pool size (defaults to CPU count + 4, max 32)
+            
+        Yields:
+            Tuples of (file_path, matches), in completion order
+        """
+        for file_path, actual_hash in self.hash_files(expected_hashes.keys(), algorithm, max_workers):
+            expected_hash = expected_hashes[file_path]
+            yield file_path, actual_hash is not None and actual_hash.lower() == expected_hash.lower()
+    
+    def build_hash_manifest(self, directory: Path, algorithm: str = 'sha256',
+                            max_workers: Optional[int] = None) -> Dict[str, str]:
+        """
+        Hash every file below a directory in parallel
+        
+        Args:
+            directory: Directory to scan
+            algorithm: Hash algorithm (md5, sha1, sha256, etc.)
+            max_workers: Thread pool size (defaults to CPU count + 4, max 32)
+            
+        Returns:
+            Dict of POSIX-style relative path -> hex hash
+        """
+        files = [entry.path for entry in walk_tree(directory, include_dirs=False) if entry.is_file]
+        manifest = {}
+        for file_path, digest in self.hash_files(files, algorithm, max_workers):
+            if digest is not None:
+                manifest[file_path.relative_to(directory).as_posix()] = digest
+        return manifest
+    
+    def verify_directory(self, directory: Path, manifest: Dict[str, str], algorithm: str = 'sha256',
+                         max_workers: Optional[int] = None) -> Tuple[bool, List[str]]:
+        """
+        Verify files below a directory against a hash manifest
+        
+        Args:
+            directory: Directory the manifest paths are relative to
+            manifest: Dict of relative path -> expected hex hash
+            algorithm: Hash algorithm used
+            max_workers: Thread pool size (defaults to CPU count + 4, max 32)
+            
+        Returns:
+            Tuple of (all_valid: bool, error_messages: List[str])
+        """
+        errors = []
+        expected = {directory / rel_path: digest for rel_path, digest in manifest.items()}
+        for file_path, matches in self.verify_files(expected, algorithm, max_workers):
+            if not matches:
+                rel_path = file_path.relative_to(directory).as_posix()
+                if file_path.exists():
+                    errors.append(f"Hash mismatch: {rel_path}")
+                else:
+                    errors.append(f"Missing file: {rel_path}")
+        
+        errors.sort()
+        return len(errors) == 0, errors
+    
+    @staticmethod
+    def _default_workers() -> int:
+        """Default thread pool size for batch hashing"""
+        return min(32, (os.cpu_count() or 1) + 4)
+    
+    def get_directory_size(self, directory: Path, snapshot: Optional[TreeSnapshot] = None) -> int:
         """
         Calculate total size of directory in bytes
         
         Args:
             directory: Directory path
+            snapshot: Previously captured snapshot of directory to reuse
             
         Returns:
-            Total size in bytes
+            Total size in bytes (symbolic links count their own size)
         """
-        if not directory.exists() or not directory.is_dir():
+        if snapshot is not None:
+            return snapshot.total_size()
+        
+        if not directory.is_dir():
             return 0
         
         total_size = 0
-        try:
-            for file_path in directory.rglob('*'):
-                if file_path.is_file():
-                    total_size += file_path.stat().st_size
-        except Exception:
-            pass  # Skip files we can't access
+        for entry in walk_tree(directory, include_dirs=False):
+            if entry.kind in (WalkEntry.FILE, WalkEntry.SYMLINK):
+                try:
+                    total_size += entry.size
+                except OSError:
+                    pass  # Skip files we can't access
         
         return total_size
     
-    def find_files(self, directory: Path, pattern: str = '*', recursive: bool = True) -> List[Path]:
+    def find_files(self, directory: Path, pattern: str = '*', recursive: bool = True,
+                   snapshot: Optional[TreeSnapshot] = None) -> List[Path]:
         """
         Find files matching pattern
         
         Args:
             directory: Directory to search
-            pattern: Glob pattern to match
+            pattern: Glob pattern matched against entry names, or against
+                     relative paths if it contains a separator (e.g. "sub/*.md")
             recursive: Whether to search recursively
+            snapshot: Previously captured snapshot of directory to reuse
             
         Returns:
-            List of matching file paths
+            List of matching paths
         """
-        if not directory.exists() or not directory.is_dir():
-            return []
+        if snapshot is not None:
+            return [entry.path for entry in snapshot.find(pattern, recursive)]
         
-        try:
-            if recursive:
-                return list(directory.rglob(pattern))
-            else:
-                return list(directory.glob(pattern))
-        except Exception:
+        if not directory.is_dir():
             return []
+        
+        # Non-recursive patterns only need to descend as deep as they reach
+        depth = len(pattern_parts(pattern)) - 1
+        prune = None if recursive else (lambda entry: entry.depth >= depth)
+        return [entry.path for entry in walk_tree(directory, prune=prune)
+                if entry.matches(pattern, recursive)]
     
     def backup_file(self, file_path: Path, backup_suffix: str = '.backup') -> Optional[Path]:
         """
@@ -394,7 +670,7 @@ class FileManager:
             return
         
         # Remove files first
-        for file_path in reversed(self.copied_files):
+        for file_path in reversed(list(self.copied_files)):
             try:
                 if file_path.exists():
                     file_path.unlink()
@@ -402,13 +678,15 @@ class FileManager:
                 pass
         
         # Remove directories (in reverse order of creation)
-        for directory in reversed(self.created_dirs):
+        for directory in reversed(list(self.created_dirs)):
             try:
                 if directory.exists() and not any(directory.iterdir()):
                     directory.rmdir()
             except Exception:
                 pass
         
+        if self.copied_files or self.created_dirs:
+            TreeSnapshot.invalidate()
         self.copied_files.clear()
         self.created_dirs.clear()
     
@@ -423,6 +701,7 @@ class FileManager:
             'files_copied': len(self.copied_files),
             'directories_created': len(self.created_dirs),
             'dry_run': self.dry_run,
+            'copy_strategies': self.copy_engine.get_counts(),
             'copied_files': [str(f) for f in self.copied_files],
             'created_directories': [str(d) for d in self.created_dirs]
         }
\ No newline at end of file
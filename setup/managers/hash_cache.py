@@ -0,0 +1,109 @@
+"""
+Persistent file-hash cache for CulturaBuilder installation system
+Caches digests keyed by file identity so unchanged files are never re-hashed
+"""
+
+import os
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, List, Optional
+
+from .persistent_cache import PersistentCache
+
+
+class HashCache(PersistentCache):
+    """Bounded LRU cache of file digests persisted as JSON"""
+
+    # Files modified this recently are not cached: on filesystems with coarse
+    # mtime resolution a rewrite within the same tick would go unnoticed
+    RACY_WINDOW_SECONDS = 2.0
+
+    def __init__(self, cache_file: Optional[Path] = None, max_entries: int = 10000):
+        """
+        Initialize hash cache
+
+        Args:
+            cache_file: JSON file backing the cache (None keeps it in memory only)
+            max_entries: Maximum number of digests kept before LRU eviction
+        """
+        super().__init__(cache_file)
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, str]" = OrderedDict()
+
+    @staticmethod
+    def make_key(file_stat: os.stat_result, algorithm: str) -> str:
+        """
+        Build cache key from file identity
+
+        Args:
+            file_stat: Result of os.stat() for the file
+            algorithm: Hash algorithm name
+
+        Returns:
+            Key string of (device, inode, size, mtime_ns, algorithm)
+        """
+        return (f"{file_stat.st_dev}:{file_stat.st_ino}:{file_stat.st_size}:"
+                f"{file_stat.st_mtime_ns}:{algorithm.lower()}")
+
+    def get(self, file_stat: os.stat_result, algorithm: str) -> Optional[str]:
+        """
+        Look up cached digest
+
+        Args:
+            file_stat: Result of os.stat() for the file
+            algorithm: Hash algorithm name
+
+        Returns:
+            Hex digest or None if not cached
+        """
+        key = self.make_key(file_stat, algorithm)
+        with self._lock:
+            self._ensure_loaded()
+            digest = self._entries.get(key)
+            if digest is not None:
+                self._entries.move_to_end(key)
+            return digest
+
+    def put(self, file_stat: os.stat_result, algorithm: str, digest: str) -> None:
+        """
+        Store digest for a file
+
+        Args:
+            file_stat: Result of os.stat() taken before hashing
+            algorithm: Hash algorithm name
+            digest: Hex digest
+        """
+        if time.time() - file_stat.st_mtime_ns / 1e9 < self.RACY_WINDOW_SECONDS:
+            return
+
+        key = self.make_key(file_stat, algorithm)
+        with self._lock:
+            self._ensure_loaded()
+            self._entries[key] = digest
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+            self._dirty = True
+
+    def clear(self) -> None:
+        """Drop all cached digests"""
+        with self._lock:
+            self._entries.clear()
+            self._loaded = True
+            self._dirty = True
+
+    def __len__(self) -> int:
+        with self._lock:
+            self._ensure_loaded()
+            return len(self._entries)
+
+    def _dump_entries(self) -> List[List[str]]:
+        return [[key, digest] for key, digest in self._entries.items()]
+
+    def _load_entries(self, entries: Any) -> None:
+        if not isinstance(entries, list):
+            return
+        for entry in entries[-self.max_entries:]:
+            if isinstance(entry, list) and len(entry) == 2:
+                self._entries[entry[0]] = entry[1]
@@ -0,0 +1,234 @@
+"""
+Snapshot of configured MCP servers for CulturaBuilder installation system
+Parses `claude mcp list` once and keeps the result current as servers are added and removed
+"""
+
+import os
+import re
+import subprocess
+import sys
+import threading
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from ..utils import json_codec
+
+# "<name>: <command or URL> - <health status>" (status missing in older CLI versions)
+_LIST_LINE = re.compile(r'^(?P<name>[^\s:][^:]*?):\s+(?P<target>.+?)(?:\s+-\s+(?P<status>[^\w\s].*))?$')
+
+
+def parse_mcp_list(output: str) -> Dict[str, Dict[str, Any]]:
+    """
+    Parse the output of `claude mcp list`
+
+    Args:
+        output: Standard output of the command
+
+    Returns:
+        Dict of server name -> {"name", "command", "status"}
+    """
+    servers: Dict[str, Dict[str, Any]] = {}
+    for line in output.splitlines():
+        line = line.strip()
+        if not line or line.startswith("No MCP servers") or line.endswith("…") or line.endswith("..."):
+            continue
+        match = _LIST_LINE.match(line)
+        if match:
+            servers[match.group("name")] = {
+                "name": match.group("name"),
+                "command": match.group("target"),
+                "status": (match.group("status") or "").strip() or None
+            }
+    return servers
+
+
+class MCPSnapshot:
+    """
+    Configured MCP servers, read once per operation
+
+    The first lookup runs `claude mcp list`; every later check reads the
+    snapshot, and record_added()/record_removed() keep it in step with the
+    changes the installer makes, so one operation spawns the listing once.
+    The CLI health-checks every server while listing, which can outlast the
+    timeout; the snapshot then falls back to the servers recorded in the
+    Claude configuration files (source "config" instead of "cli").
+    """
+
+    LIST_TIMEOUT = 15
+
+    def __init__(self, cwd: Optional[Path] = None):
+        """
+        Initialize MCP snapshot
+
+        Args:
+            cwd: Directory whose local and project scoped servers apply
+                (defaults to the current directory)
+        """
+        self.cwd = cwd or Path.cwd()
+        self.servers: Dict[str, Dict[str, Any]] = {}
+        self.available = False
+        self.error: Optional[str] = None
+        # Where the server list came from: "cli", "config" or None
+        self.source: Optional[str] = None
+        self._loaded = False
+        self._lock = threading.RLock()
+
+    def refresh(self) -> bool:
+        """
+        Re-read the configured servers from the Claude CLI
+
+        Returns:
+            True if the listing succeeded
+        """
+        with self._lock:
+            self._loaded = True
+            configured = self._config_servers()
+            try:
+                result = subprocess.run(
+                    ["claude", "mcp", "list"],
+                    capture_output=True,
+                    text=True,
+                    timeout=self.LIST_TIMEOUT,
+                    shell=(sys.platform == "win32")
+                )
+                if result.returncode != 0:
+                    error = result.stderr.strip() or f"claude mcp list exited with {result.returncode}"
+                else:
+                    error = None
+            except (subprocess.TimeoutExpired, subprocess.SubprocessError, OSError) as e:
+                error = str(e)
+
+            if error is None:
+                servers = parse_mcp_list(result.stdout)
+                for name, server in servers.items():
+                    server["scope"] = (configured or {}).get(name, {}).get("scope")
+                self.servers = servers
+                self.source = "cli"
+            elif configured is not None:
+                self.servers = configured
+                self.source = "config"
+            else:
+                self.servers = {}
+                self.source = None
+
+            self.available = self.source is not None
+            self.error = error
+            return self.available
+
+    def ensure_loaded(self) -> bool:
+        """
+        Take the snapshot unless already taken
+
+        Returns:
+            True if the server list is available
+        """
+        with self._lock:
+            if not self._loaded:
+                self.refresh()
+            return self.available
+
+    def is_installed(self, server_name: str) -> bool:
+        """
+        Check whether an MCP server is configured
+
+        Args:
+            server_name: Server name
+
+        Returns:
+            True if the server is in the snapshot
+        """
+        with self._lock:
+            self.ensure_loaded()
+            return server_name in self.servers
+
+    def get(self, server_name: str) -> Optional[Dict[str, Any]]:
+        """
+        Get a configured server
+
+        Args:
+            server_name: Server name
+
+        Returns:
+            Dict with name, scope, command and status, or None
+        """
+        with self._lock:
+            self.ensure_loaded()
+            server = self.servers.get(server_name)
+            return dict(server) if server else None
+
+    def list_servers(self) -> List[Dict[str, Any]]:
+        """
+        Get all configured servers
+
+        Returns:
+            List of server dicts, in listing order
+        """
+        with self._lock:
+            self.ensure_loaded()
+            return [dict(server) for server in self.servers.values()]
+
+    def record_added(self, server_name: str, scope: str, command: List[str]) -> None:
+        """
+        Reflect a successful `claude mcp add`
+
+        Args:
+            server_name: Server name
+            scope: Scope the server was added to
+            command: Server command line
+        """
+        with self._lock:
+            self.servers[server_name] = {
+                "name": server_name,
+                "command": " ".join(command),
+                "status": None,
+                "scope": scope
+            }
+
+    def record_removed(self, server_name: str) -> None:
+        """
+        Reflect a successful `claude mcp remove`
+
+        Args:
+            server_name: Server name
+        """
+        with self._lock:
+            self.servers.pop(server_name, None)
+
+    def _config_servers(self) -> Optional[Dict[str, Dict[str, Any]]]:
+        """
+        Servers recorded in the Claude configuration files
+
+        Returns:
+            Dict of server name -> {"name", "command", "status", "scope"},
+            or None if the user configuration cannot be read
+        """
+        config_dir = os.environ.get("CLAUDE_CONFIG_DIR")
+        user_config_file = Path(config_dir) / ".claude.json" if config_dir else Path.home() / ".claude.json"
+        try:
+            user_config = json_codec.load_file(user_config_file) if user_config_file.exists() else {}
+        except (OSError, ValueError):
+            return None
+        if not isinstance(user_config, dict):
+            return None
+
+        try:
+            project_config = json_codec.load_file(self.cwd / ".mcp.json")
+        except (OSError, ValueError):
+            project_config = {}
+
+        projects = user_config.get("projects")
+        project = projects.get(str(self.cwd)) if isinstance(projects, dict) else None
+        servers: Dict[str, Dict[str, Any]] = {}
+        # Later scopes take precedence, as in the CLI: local > project > user
+        for scope, config in (("user", user_config), ("project", project_config), ("local", project)):
+            entries = config.get("mcpServers") if isinstance(config, dict) else None
+            if not isinstance(entries, dict):
+                continue
+            for name, entry in entries.items():
+                entry = entry if isinstance(entry, dict) else {}
+                if entry.get("url"):
+                    command = f"{entry['url']} ({entry.get('type', 'http').upper()})"
+                else:
+                    command = " ".join([entry.get("command", "")] + list(entry.get("args", []))).strip()
+                servers[name] = {"name": name, "command": command, "status": None, "scope": scope}
+        return servers
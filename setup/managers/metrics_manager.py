@@ -3,7 +3,6 @@ Metrics Manager for CulturaBuilder Framework
 Handles usage metrics collection, storage, and export functionality
 """
 
-import json
 import csv
 import time
 from pathlib import Path
@@ -13,6 +12,7 @@ from collections import defaultdict, Counter
 from enum import Enum
 
 from .settings_manager import SettingsManager
+from ..utils import json_codec
 from ..utils.logger import Logger
 
 
@@ -93,19 +93,18 @@ class MetricsManager(SettingsManager):
         """Load metrics from file."""
         try:
             if self.metrics_file.exists():
-                with open(self.metrics_file, 'r', encoding='utf-8') as f:
-                    return json.load(f)
+                return json_codec.load_file(self.metrics_file)
         except Exception as e:
             self.logger.error(f"Failed to load metrics: {e}")
         
         self._ensure_metrics_file()
-        return json.loads(self.metrics_file.read_text(encoding='utf-8'))
+        return json_codec.load_file(self.metrics_file)
     
     def _save_metrics(self, metrics: Dict[str, Any]) -> bool:
         """Save metrics to file."""
         try:
-            with open(self.metrics_file, 'w', encoding='utf-8') as f:
-                json.dump(metrics, f, indent=2, ensure_ascii=False)
+            # Machine-owned file, saved compact
+            json_codec.dump_file(self.metrics_file, metrics, pretty=False)
             return True
         except Exception as e:
             self.logger.error(f"Failed to save metrics: {e}")
@@ -126,6 +125,9 @@ class MetricsManager(SettingsManager):
         metrics["privacy"]["anonymous"] = anonymous
         metrics["privacy"]["last_consent_check"] = datetime.now().isoformat()
         
+        # Consent is read back from settings by _check_metrics_consent()
+        if not self._save_consent(True):
+            return False
         self.metrics_enabled = True
         return self._save_metrics(metrics)
     
@@ -135,9 +137,20 @@ class MetricsManager(SettingsManager):
         metrics["privacy"]["enabled"] = False
         metrics["privacy"]["last_consent_check"] = datetime.now().isoformat()
         
+        if not self._save_consent(False):
+            return False
         self.metrics_enabled = False
         return self._save_metrics(metrics)
     
+    def _save_consent(self, enabled: bool) -> bool:
+        """Persist the metrics consent in settings."""
+        try:
+            self.update_settings({"metrics": {"enabled": enabled}})
+            return True
+        except Exception as e:
+            self.logger.error(f"Failed to save metrics consent: {e}")
+            return False
+    
     def record_command(self, command: str, flags: List[str] = None, 
                       success: bool = True, duration: float = 0.0,
                       metadata: Dict[str, Any] = None):
@@ -245,6 +258,34 @@ class MetricsManager(SettingsManager):
         
         self._save_metrics(metrics)
     
+    def record_mcp_benchmark(self, server: str, result: Dict[str, Any]):
+        """
+        Record an MCP server startup measurement.
+        
+        Args:
+            server: MCP server name
+            result: Probe result (status, spawn_to_ready, tools_list_latency,
+                tools_count, rss_bytes, strategy, ...)
+        """
+        if not self.metrics_enabled:
+            return
+        
+        metrics = self._load_metrics()
+        history = metrics["performance"].setdefault("mcp_servers", {}).setdefault(server, [])
+        
+        record = {
+            "timestamp": datetime.now().isoformat(),
+            "session_id": self.session_id
+        }
+        record.update(result)
+        history.append(record)
+        
+        # Keep only the last 100 measurements per server
+        if len(history) > 100:
+            del history[:-100]
+        
+        self._save_metrics(metrics)
+    
     def record_error(self, error_type: str, command: str = None, 
                     details: str = None):
         """
@@ -518,7 +559,7 @@ class MetricsManager(SettingsManager):
     def _filter_by_time_range(self, metrics: Dict[str, Any], 
                              start: datetime, end: datetime) -> Dict[str, Any]:
         """Filter metrics by time range."""
-        filtered = json.loads(json.dumps(metrics))  # Deep copy
+        filtered = json_codec.loads(json_codec.dumpb(metrics, pretty=False))  # Deep copy
         
         # Filter operations
         filtered["performance"]["operations"] = [
@@ -542,8 +583,7 @@ class MetricsManager(SettingsManager):
     
     def _export_json(self, metrics: Dict[str, Any], output_path: Path):
         """Export metrics as JSON."""
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(metrics, f, indent=2, ensure_ascii=False)
+        json_codec.dump_file(output_path, metrics)
     
     def _export_csv(self, metrics: Dict[str, Any], output_path: Path):
         """Export metrics as CSV."""
@@ -0,0 +1,236 @@
+"""
+Offline npm package cache for CulturaBuilder installation system
+Packs MCP server packages into local tarballs so servers start without the registry
+"""
+
+import os
+import re
+import shutil
+import subprocess
+import sys
+import tarfile
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from ..utils import json_codec
+
+# "@scope/name@range" or "name@range" -> package name
+_SPEC_NAME = re.compile(r'^(@[^/@]+/[^@]+|[^@]+)(?:@.*)?$')
+
+
+def package_name(spec: str) -> str:
+    """
+    Get the package name of an npm package spec
+
+    Args:
+        spec: Package spec such as "@playwright/mcp@latest"
+
+    Returns:
+        Package name such as "@playwright/mcp"
+    """
+    match = _SPEC_NAME.match(spec)
+    return match.group(1) if match else spec
+
+
+def select_bin(manifest: Dict[str, Any]) -> Optional[Tuple[str, str]]:
+    """
+    Pick the executable a package provides
+
+    Args:
+        manifest: Parsed package.json
+
+    Returns:
+        Tuple of (bin name, path relative to the package), or None if the
+        package declares no executable
+    """
+    bin_field = manifest.get("bin")
+    unscoped = str(manifest.get("name", "")).split("/")[-1]
+    if isinstance(bin_field, str) and unscoped:
+        return unscoped, bin_field
+    if isinstance(bin_field, dict) and bin_field:
+        name = unscoped if unscoped in bin_field else next(iter(bin_field))
+        return name, bin_field[name]
+    return None
+
+
+class NpmPackageCache:
+    """
+    Local tarball cache of npm packages
+
+    prefetch() packs each package with `npm pack` into <cache>/tarballs and
+    installs it once against a private npm cache (<cache>/_npm), which pulls
+    its dependencies in as well. Servers can then be launched with
+    `npx --offline` from the tarball, with no registry access at startup.
+    Packages can also be packed from a local directory of package folders
+    (<dir>/<name> or <dir>/@scope/<name>), which needs no network at all.
+    """
+
+    # Bump when the index layout changes; older indexes are ignored
+    FORMAT_VERSION = 1
+
+    NPM_TIMEOUT = 300
+
+    def __init__(self, cache_dir: Path):
+        """
+        Initialize npm package cache
+
+        Args:
+            cache_dir: Directory holding the tarballs and index
+        """
+        self.cache_dir = Path(cache_dir).expanduser().resolve()
+        self.tarball_dir = self.cache_dir / "tarballs"
+        self.npm_cache_dir = self.cache_dir / "_npm"
+        self.index_file = self.cache_dir / "index.json"
+        self._index: Optional[Dict[str, Dict[str, Any]]] = None
+
+    def prefetch(self, spec: str, source_dir: Optional[Path] = None) -> Dict[str, Any]:
+        """
+        Pack a package into the cache
+
+        Args:
+            spec: Package spec such as "@upstash/context7-mcp"
+            source_dir: Directory of local package folders to pack from
+                instead of the registry
+
+        Returns:
+            Index entry (name, version, filename, integrity, bin, fetched)
+
+        Raises:
+            RuntimeError: If the package could not be packed
+        """
+        if source_dir is not None:
+            target = Path(source_dir).expanduser().resolve() / package_name(spec)
+            if not (target / "package.json").exists():
+                raise RuntimeError(f"{package_name(spec)} not found in {source_dir}")
+            pack_target = str(target)
+        else:
+            pack_target = spec
+
+        self.tarball_dir.mkdir(parents=True, exist_ok=True)
+        result = self._npm(["pack", pack_target, "--json", "--pack-destination", str(self.tarball_dir)])
+        try:
+            packed = json_codec.loads(result.stdout)[0]
+        except (ValueError, IndexError, KeyError, TypeError):
+            raise RuntimeError(f"Unexpected npm pack output for {spec}")
+
+        tarball = self.tarball_dir / packed["filename"]
+        entry = {
+            "name": packed.get("name", package_name(spec)),
+            "version": packed.get("version"),
+            "filename": packed["filename"],
+            "integrity": packed.get("integrity"),
+            "bin": self._read_bin(tarball),
+            "fetched": time.time()
+        }
+
+        # Installing once puts the dependency tree into the private npm cache
+        staging = self.cache_dir / f"staging-{os.getpid()}"
+        try:
+            self._npm(["install", "--prefix", str(staging), "--prefer-offline", "--no-save",
+                       "--no-audit", "--no-fund", str(tarball)])
+        finally:
+            shutil.rmtree(staging, ignore_errors=True)
+
+        index = self._load_index()
+        index[spec] = entry
+        self._save_index()
+        return entry
+
+    def get(self, spec: str) -> Optional[Dict[str, Any]]:
+        """
+        Get the cached copy of a package
+
+        Args:
+            spec: Package spec as passed to prefetch()
+
+        Returns:
+            Index entry with "tarball" set to the tarball path, or None if the
+            package is not cached (or its tarball has gone)
+        """
+        entry = self._load_index().get(spec)
+        if entry is None:
+            return None
+        tarball = self.tarball_dir / entry["filename"]
+        if not tarball.exists():
+            return None
+        return dict(entry, tarball=str(tarball))
+
+    def list_packages(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Get all cached packages
+
+        Returns:
+            Dict of spec -> index entry
+        """
+        return {spec: dict(entry) for spec, entry in self._load_index().items()}
+
+    def offline_command(self, spec: str) -> Optional[List[str]]:
+        """
+        Build the command that runs a cached package without the registry
+
+        Args:
+            spec: Package spec as passed to prefetch()
+
+        Returns:
+            Command list, or None if the package is not cached or has no bin
+        """
+        entry = self.get(spec)
+        if entry is None or not entry.get("bin"):
+            return None
+        return ["npx", "-y", "--offline", "--cache", str(self.npm_cache_dir),
+                "--package", entry["tarball"], "--", entry["bin"]]
+
+    def _npm(self, args: List[str]) -> subprocess.CompletedProcess:
+        """Run npm against the private npm cache"""
+        command = ["npm"] + args + ["--cache", str(self.npm_cache_dir)]
+        try:
+            result = subprocess.run(
+                command,
+                capture_output=True,
+                text=True,
+                timeout=self.NPM_TIMEOUT,
+                cwd=str(self.cache_dir),
+                shell=(sys.platform == "win32")
+            )
+        except subprocess.TimeoutExpired:
+            raise RuntimeError(f"npm {args[0]} timed out after {self.NPM_TIMEOUT}s")
+        except OSError as e:
+            raise RuntimeError(f"Could not run npm: {e}")
+
+        if result.returncode != 0:
+            lines = [line for line in result.stderr.strip().splitlines() if line.strip()]
+            raise RuntimeError(lines[-1] if lines else f"npm {args[0]} exited with {result.returncode}")
+        return result
+
+    @staticmethod
+    def _read_bin(tarball: Path) -> Optional[str]:
+        """Name of the executable a packed package provides"""
+        try:
+            with tarfile.open(tarball, "r:gz") as archive:
+                member = archive.extractfile("package/package.json")
+                manifest = json_codec.loads(member.read()) if member else {}
+        except (OSError, KeyError, ValueError, tarfile.TarError):
+            return None
+
+        selected = select_bin(manifest)
+        return selected[0] if selected else None
+
+    def _load_index(self) -> Dict[str, Dict[str, Any]]:
+        """Load the index on first use"""
+        if self._index is None:
+            self._index = {}
+            try:
+                payload = json_codec.load_file(self.index_file)
+            except (OSError, ValueError):
+                payload = None  # Missing or corrupt index starts empty
+            if isinstance(payload, dict) and payload.get("version") == self.FORMAT_VERSION:
+                self._index.update(payload.get("packages", {}))
+        return self._index
+
+    def _save_index(self) -> None:
+        """Write the index atomically"""
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        temp_file = self.index_file.with_name(f"{self.index_file.name}.{os.getpid()}.tmp")
+        json_codec.dump_file(temp_file, {"version": self.FORMAT_VERSION, "packages": self._index})
+        os.replace(temp_file, self.index_file)
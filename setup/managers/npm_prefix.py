@@ -0,0 +1,140 @@
+"""
+Managed node_modules prefix for CulturaBuilder installation system
+Installs MCP server packages once so Claude starts them with plain `node`
+"""
+
+import subprocess
+import sys
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from ..utils import json_codec
+from ..utils.path_resolver import which
+from .npm_cache import NpmPackageCache, package_name, select_bin
+
+
+class NpmPrefix:
+    """
+    Pinned MCP server packages installed into one node_modules prefix
+
+    All packages are installed by a single `npm install --save-exact`, so the
+    prefix's package.json records the exact versions in use. Servers are then
+    registered as `node <entry point>`, which skips the package resolution
+    `npx -y` performs on every start. Packages already in an NpmPackageCache
+    are installed from their tarballs without contacting the registry.
+    """
+
+    NPM_TIMEOUT = 600
+
+    def __init__(self, prefix_dir: Path, package_cache: Optional[NpmPackageCache] = None):
+        """
+        Initialize npm prefix
+
+        Args:
+            prefix_dir: Directory holding package.json and node_modules
+            package_cache: Prefetched packages to install from (optional)
+        """
+        self.prefix_dir = Path(prefix_dir).expanduser().resolve()
+        self.package_cache = package_cache
+
+    def install(self, specs: List[str]) -> None:
+        """
+        Install packages into the prefix (one npm run for all of them)
+
+        Args:
+            specs: Package specs such as "@upstash/context7-mcp"
+
+        Raises:
+            RuntimeError: If npm failed
+        """
+        if not specs:
+            return
+
+        targets = []
+        offline = self.package_cache is not None
+        for spec in specs:
+            cached = self.package_cache.get(spec) if self.package_cache is not None else None
+            if cached is not None:
+                targets.append(cached["tarball"])
+            else:
+                targets.append(spec)
+                offline = False
+
+        command = ["npm", "install", "--prefix", str(self.prefix_dir), "--save-exact",
+                   "--no-audit", "--no-fund"]
+        if offline:
+            command += ["--offline", "--cache", str(self.package_cache.npm_cache_dir)]
+
+        self.prefix_dir.mkdir(parents=True, exist_ok=True)
+        try:
+            result = subprocess.run(
+                command + targets,
+                capture_output=True,
+                text=True,
+                timeout=self.NPM_TIMEOUT,
+                shell=(sys.platform == "win32")
+            )
+        except subprocess.TimeoutExpired:
+            raise RuntimeError(f"npm install timed out after {self.NPM_TIMEOUT}s")
+        except OSError as e:
+            raise RuntimeError(f"Could not run npm: {e}")
+
+        if result.returncode != 0:
+            lines = [line for line in result.stderr.strip().splitlines() if line.strip()]
+            raise RuntimeError(lines[-1] if lines else f"npm install exited with {result.returncode}")
+
+    def installed_version(self, spec: str) -> Optional[str]:
+        """
+        Get the installed version of a package
+
+        Args:
+            spec: Package spec
+
+        Returns:
+            Version string, or None if the package is not installed
+        """
+        manifest = self._manifest(spec)
+        return manifest.get("version") if manifest else None
+
+    def entry_point(self, spec: str) -> Optional[Path]:
+        """
+        Get the script a package's executable runs
+
+        Args:
+            spec: Package spec
+
+        Returns:
+            Absolute path of the entry point, or None if the package is not
+            installed or declares no executable
+        """
+        manifest = self._manifest(spec)
+        selected = select_bin(manifest) if manifest else None
+        if selected is None:
+            return None
+        entry = (self.prefix_dir / "node_modules" / package_name(spec) / selected[1]).resolve()
+        return entry if entry.is_file() else None
+
+    def command(self, spec: str) -> Optional[List[str]]:
+        """
+        Build the command that starts a package's executable with node
+
+        Args:
+            spec: Package spec
+
+        Returns:
+            Command list, or None if the package is not installed
+        """
+        entry = self.entry_point(spec)
+        if entry is None:
+            return None
+        # Absolute node path, so sessions started with a different PATH (e.g. nvm) still work
+        return [which("node") or "node", str(entry)]
+
+    def _manifest(self, spec: str) -> Optional[Dict[str, Any]]:
+        """Parsed package.json of an installed package"""
+        manifest_file = self.prefix_dir / "node_modules" / package_name(spec) / "package.json"
+        try:
+            manifest = json_codec.load_file(manifest_file)
+        except (OSError, ValueError):
+            return None
+        return manifest if isinstance(manifest, dict) else None
@@ -0,0 +1,159 @@
+"""
+Versioned JSON persistence shared by CulturaBuilder's on-disk caches
+Caches are written atomically and silently rebuilt when unreadable or from an older layout
+"""
+
+import atexit
+import os
+import threading
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+from ..utils import json_codec
+
+
+def read_cache_file(cache_file: Optional[Path], version: int) -> Optional[Any]:
+    """
+    Read the entries of a versioned cache file
+
+    Args:
+        cache_file: JSON cache file (None for in-memory caches)
+        version: Expected format version
+
+    Returns:
+        Stored entries, or None if the file is missing, corrupt or of another version
+    """
+    if cache_file is None or not cache_file.exists():
+        return None
+    try:
+        payload = json_codec.load_file(cache_file)
+    except (OSError, ValueError):
+        return None  # Corrupt or unreadable cache is simply rebuilt
+
+    if not isinstance(payload, dict) or payload.get("version") != version:
+        return None
+    return payload.get("entries")
+
+
+def write_cache_file(cache_file: Path, version: int, entries: Any, create_parents: bool = True) -> bool:
+    """
+    Atomically write the entries of a versioned cache file
+
+    Args:
+        cache_file: JSON cache file
+        version: Format version stored with the entries
+        entries: JSON-serializable entries
+        create_parents: Create missing parent directories; when False only
+            the directory holding the file is created, and only if its own
+            parent (e.g. the installation directory) exists
+
+    Returns:
+        True if the file was written
+    """
+    cache_dir = cache_file.parent
+    if not create_parents and not cache_dir.exists() and not cache_dir.parent.exists():
+        return False
+
+    temp_file = cache_file.with_name(f"{cache_file.name}.{os.getpid()}.tmp")
+    try:
+        cache_dir.mkdir(parents=create_parents, exist_ok=True)
+        json_codec.dump_file(temp_file, {"version": version, "entries": entries}, pretty=False)
+        os.replace(temp_file, cache_file)
+        return True
+    except OSError:
+        try:
+            temp_file.unlink()
+        except OSError:
+            pass
+        return False
+
+
+class PersistentCache(ABC):
+    """
+    Base for caches loaded lazily from a JSON file and flushed when changed
+
+    Subclasses hold their entries in memory, convert them with
+    _dump_entries()/_load_entries() and set _dirty (under _lock) whenever
+    they change. The file is only written inside an existing installation
+    directory, never creating the installation directory itself.
+    """
+
+    # Bump when the on-disk layout changes; older files are ignored
+    FORMAT_VERSION = 1
+
+    _instances: Dict[Tuple[type, str], "PersistentCache"] = {}
+    _instances_lock = threading.Lock()
+
+    def __init__(self, cache_file: Optional[Path] = None):
+        """
+        Initialize persistent cache
+
+        Args:
+            cache_file: JSON file backing the cache (None keeps it in memory only)
+        """
+        self.cache_file = cache_file
+        self._lock = threading.Lock()
+        self._dirty = False
+        self._loaded = False
+
+    @classmethod
+    def for_path(cls, cache_file: Path, **kwargs: Any) -> "PersistentCache":
+        """
+        Get the shared cache instance backed by a file
+
+        Every user of the same cache file in a process shares one instance,
+        so concurrent writers never clobber each other's entries. The
+        instance is flushed at exit.
+
+        Args:
+            cache_file: JSON file backing the cache
+            **kwargs: Constructor arguments (used on first creation)
+
+        Returns:
+            Shared cache instance
+        """
+        key = (cls, str(cache_file))
+        with cls._instances_lock:
+            instance = PersistentCache._instances.get(key)
+            if instance is None:
+                instance = cls(cache_file, **kwargs)
+                PersistentCache._instances[key] = instance
+                atexit.register(instance.flush)
+            return instance
+
+    def flush(self) -> bool:
+        """
+        Persist cache to disk if it changed
+
+        Returns:
+            True if cache is persisted (or nothing to write), False on error
+        """
+        with self._lock:
+            if not self._dirty or self.cache_file is None:
+                return True
+            if not write_cache_file(self.cache_file, self.FORMAT_VERSION, self._dump_entries(),
+                                    create_parents=False):
+                return False
+            self._dirty = False
+            return True
+
+    def _ensure_loaded(self) -> None:
+        """Load entries from disk on first use (caller holds the lock)"""
+        if self._loaded:
+            return
+        self._loaded = True
+
+        entries = read_cache_file(self.cache_file, self.FORMAT_VERSION)
+        if entries is not None:
+            self._load_entries(entries)
+
+    @abstractmethod
+    def _dump_entries(self) -> Any:
+        """Get the entries in their JSON form (caller holds the lock)"""
+        pass
+
+    @abstractmethod
+    def _load_entries(self, entries: Any) -> None:
+        """Restore entries read from disk, ignoring malformed ones (caller holds the lock)"""
+        pass
@@ -0,0 +1,308 @@
+"""
+Deduplicated settings history for CulturaBuilder installation system
+Stores settings.json versions as content-hashed keyframes plus JSON Patch deltas
+"""
+
+import hashlib
+import os
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from ..utils import json_codec
+
+
+def _escape(key: str) -> str:
+    return key.replace('~', '~0').replace('/', '~1')
+
+
+def _unescape(token: str) -> str:
+    return token.replace('~1', '/').replace('~0', '~')
+
+
+def make_patch(old: Any, new: Any, path: str = "") -> List[Dict[str, Any]]:
+    """
+    Compute an RFC 6902 JSON Patch turning old into new
+
+    Dicts are diffed key by key; lists that only grew at the end become
+    "add" operations, other changed lists and scalars are replaced whole.
+
+    Args:
+        old: Original JSON value
+        new: Target JSON value
+        path: JSON Pointer of the values (empty for the document root)
+
+    Returns:
+        List of patch operations
+    """
+    if old == new:
+        return []
+
+    if isinstance(old, dict) and isinstance(new, dict):
+        ops: List[Dict[str, Any]] = []
+        for key in old:
+            if key not in new:
+                ops.append({"op": "remove", "path": f"{path}/{_escape(key)}"})
+        for key, value in new.items():
+            child = f"{path}/{_escape(key)}"
+            if key not in old:
+                ops.append({"op": "add", "path": child, "value": value})
+            else:
+                ops.extend(make_patch(old[key], value, child))
+        return ops
+
+    if isinstance(old, list) and isinstance(new, list) and len(new) > len(old) and new[:len(old)] == old:
+        return [{"op": "add", "path": f"{path}/-", "value": value} for value in new[len(old):]]
+
+    return [{"op": "replace", "path": path, "value": new}]
+
+
+def apply_patch(document: Any, patch: List[Dict[str, Any]]) -> Any:
+    """
+    Apply an RFC 6902 JSON Patch (add, remove and replace operations) in place
+
+    Args:
+        document: JSON value to modify
+        patch: Patch operations
+
+    Returns:
+        Patched document (a new object if the root was replaced)
+
+    Raises:
+        ValueError: If an operation does not fit the document
+    """
+    for op in patch:
+        tokens = [_unescape(token) for token in op["path"].split('/')[1:]]
+        if not tokens:
+            if op["op"] == "remove":
+                raise ValueError("Cannot remove the document root")
+            document = op["value"]
+            continue
+
+        parent = document
+        try:
+            for token in tokens[:-1]:
+                parent = parent[int(token)] if isinstance(parent, list) else parent[token]
+
+            last = tokens[-1]
+            if isinstance(parent, list):
+                if op["op"] == "add":
+                    parent.insert(len(parent) if last == '-' else int(last), op["value"])
+                elif op["op"] == "remove":
+                    del parent[int(last)]
+                else:
+                    parent[int(last)] = op["value"]
+            else:
+                if op["op"] == "remove":
+                    del parent[last]
+                else:
+                    parent[last] = op["value"]
+        except (KeyError, IndexError, TypeError, ValueError) as e:
+            raise ValueError(f"Cannot apply {op['op']} at {op['path']}: {e}")
+    return document
+
+
+class SettingsHistory:
+    """
+    Versioned history of a JSON settings file
+
+    Each version is a line in an append-only versions.jsonl. The first
+    version, every KEYFRAME_INTERVAL-th one after it and any version whose
+    delta would not be smaller than the document store the full document as
+    a content-hashed file under objects/; the others store a JSON Patch
+    against the previous version. Recording content identical to the latest version is a no-op,
+    and rebuilding any version applies at most KEYFRAME_INTERVAL - 1 patches.
+    """
+
+    VERSIONS_FILE = "versions.jsonl"
+    OBJECTS_DIR = "objects"
+    NAME_PREFIX = "settings@"
+
+    KEYFRAME_INTERVAL = 20
+    MAX_VERSIONS = 500
+
+    def __init__(self, history_dir: Path):
+        """
+        Initialize settings history
+
+        Args:
+            history_dir: Directory holding the history
+        """
+        self.history_dir = history_dir
+        self.versions_file = history_dir / self.VERSIONS_FILE
+        self.objects_dir = history_dir / self.OBJECTS_DIR
+
+    @staticmethod
+    def content_hash(document: Any) -> str:
+        """
+        Hash of a document's canonical JSON form
+
+        Args:
+            document: JSON value
+
+        Returns:
+            Hex SHA-256 digest
+        """
+        canonical = json_codec.dumpb(document, pretty=False, sort_keys=True)
+        return hashlib.sha256(canonical).hexdigest()
+
+    def versions(self) -> List[Dict[str, Any]]:
+        """
+        Get version records, oldest first
+
+        Returns:
+            List of version records (seq, name, hash, created, size and
+            either keyframe or delta)
+        """
+        if not self.versions_file.exists():
+            return []
+        records = []
+        with open(self.versions_file, 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    records.append(json_codec.loads(line))
+                except ValueError:
+                    break  # Torn last line from an interrupted append
+        return records
+
+    def latest_hash(self) -> Optional[str]:
+        """Content hash of the most recent version (None if there is none)"""
+        records = self.versions()
+        return records[-1]["hash"] if records else None
+
+    def record(self, document: Dict[str, Any], source_mtime: Optional[float] = None) -> Optional[str]:
+        """
+        Add a version unless it matches the most recent one
+
+        Args:
+            document: Settings document
+            source_mtime: Modification time of the file the document came from
+
+        Returns:
+            Name of the new version, or None if it was a duplicate
+        """
+        records = self.versions()
+        digest = self.content_hash(document)
+        if records and records[-1]["hash"] == digest:
+            return None
+
+        seq = records[-1]["seq"] + 1 if records else 1
+        record: Dict[str, Any] = {
+            "seq": seq,
+            "name": f"{self.NAME_PREFIX}{seq:05d}",
+            "hash": digest,
+            "created": datetime.now().isoformat(),
+            "source_mtime": source_mtime,
+            "size": len(json_codec.dumpb(document, sort_keys=True))
+        }
+
+        deltas_since_keyframe = 0
+        for previous_record in reversed(records):
+            if "keyframe" in previous_record:
+                break
+            deltas_since_keyframe += 1
+
+        delta = None
+        if records and deltas_since_keyframe < self.KEYFRAME_INTERVAL - 1:
+            previous = self.reconstruct(records[-1]["name"], records)
+            delta = make_patch(previous, document)
+            if len(json_codec.dumpb(delta, pretty=False)) >= record["size"]:
+                delta = None
+
+        if delta is None:
+            self._store_object(digest, document)
+            record["keyframe"] = digest
+        else:
+            record["delta"] = delta
+
+        self.history_dir.mkdir(parents=True, exist_ok=True)
+        with open(self.versions_file, 'a', encoding='utf-8') as f:
+            f.write(json_codec.dumps(record, pretty=False) + '\n')
+
+        if len(records) + 1 > self.MAX_VERSIONS:
+            self.prune(self.MAX_VERSIONS)
+        return record["name"]
+
+    def reconstruct(self, name: str, records: Optional[List[Dict[str, Any]]] = None) -> Dict[str, Any]:
+        """
+        Rebuild the document of a version
+
+        Args:
+            name: Version name
+            records: Version records, if already loaded
+
+        Returns:
+            Settings document
+
+        Raises:
+            ValueError: If the version is unknown or its data is damaged
+        """
+        records = records if records is not None else self.versions()
+        index = next((i for i, record in enumerate(records) if record["name"] == name), None)
+        if index is None:
+            raise ValueError(f"Unknown settings version: {name}")
+
+        start = index
+        while "keyframe" not in records[start]:
+            start -= 1
+            if start < 0:
+                raise ValueError(f"No keyframe found for settings version {name}")
+
+        document = self._load_object(records[start]["keyframe"])
+        for record in records[start + 1:index + 1]:
+            document = apply_patch(document, record["delta"])
+
+        if self.content_hash(document) != records[index]["hash"]:
+            raise ValueError(f"Settings version {name} failed its integrity check")
+        return document
+
+    def prune(self, keep: int) -> None:
+        """
+        Keep only the most recent versions
+
+        Args:
+            keep: Number of versions to keep
+        """
+        records = self.versions()
+        if len(records) <= keep:
+            return
+
+        kept = records[-keep:] if keep > 0 else []
+        if kept and "keyframe" not in kept[0]:
+            # The new oldest version loses its base, so turn it into a keyframe
+            document = self.reconstruct(kept[0]["name"], records)
+            self._store_object(kept[0]["hash"], document)
+            kept[0] = {key: value for key, value in kept[0].items() if key != "delta"}
+            kept[0]["keyframe"] = kept[0]["hash"]
+
+        temp_file = self.versions_file.with_name(f".{self.VERSIONS_FILE}.{os.getpid()}.tmp")
+        with open(temp_file, 'w', encoding='utf-8') as f:
+            for record in kept:
+                f.write(json_codec.dumps(record, pretty=False) + '\n')
+        os.replace(temp_file, self.versions_file)
+
+        referenced = {record["keyframe"] for record in kept if "keyframe" in record}
+        if self.objects_dir.exists():
+            for object_file in self.objects_dir.glob("*.json"):
+                if object_file.stem not in referenced:
+                    try:
+                        object_file.unlink()
+                    except OSError:
+                        pass
+
+    def _store_object(self, digest: str, document: Dict[str, Any]) -> None:
+        """Write a keyframe unless an identical one is already stored"""
+        object_file = self.objects_dir / f"{digest}.json"
+        if object_file.exists():
+            return
+        self.objects_dir.mkdir(parents=True, exist_ok=True)
+        temp_file = object_file.with_name(f".{object_file.name}.{os.getpid()}.tmp")
+        json_codec.dump_file(temp_file, document, pretty=False, sort_keys=True)
+        os.replace(temp_file, object_file)
+
+    def _load_object(self, digest: str) -> Dict[str, Any]:
+        """Read a keyframe"""
+        try:
+            return json_codec.load_file(self.objects_dir / f"{digest}.json")
+        except (OSError, ValueError) as e:
+            raise ValueError(f"Could not read settings keyframe {digest}: {e}")
@@ -4,17 +4,116 @@ Handles settings.json migration to the new CulturaBuilder metadata json file
 Allows for manipulation of these json files with deep merge and backup
 """
 
-import json
+import os
 import shutil
-from typing import Dict, Any, Optional, List
+import threading
+from contextlib import contextmanager
+from typing import Dict, Any, Iterator, Optional, List, Tuple, Union
 from pathlib import Path
 from datetime import datetime
 import copy
 
+from .settings_history import SettingsHistory
+from ..utils import json_codec
+
+
+class MetadataTransaction:
+    """
+    Batch of metadata changes applied in memory and written once on commit
+    
+    While a transaction is open for a metadata file, every SettingsManager
+    for that file reads and writes the transaction's copy instead of the
+    file, so existing calls such as update_metadata() and
+    add_component_registration() are batched without changes.
+    """
+    
+    def __init__(self, settings_manager: "SettingsManager"):
+        """
+        Initialize transaction (use SettingsManager.transaction())
+        
+        Args:
+            settings_manager: Manager whose metadata file is being changed
+        """
+        self.settings_manager = settings_manager
+        self.data = settings_manager.load_metadata()
+        self.dirty = False
+        self.lock = threading.RLock()
+    
+    def merge(self, modifications: Dict[str, Any]) -> None:
+        """
+        Deep merge modifications into the metadata
+        
+        Args:
+            modifications: Metadata modifications to merge
+        """
+        with self.lock:
+            self.data = self.settings_manager._deep_merge(self.data, modifications)
+            self.dirty = True
+    
+    def register(self, component_name: str, component_info: Dict[str, Any]) -> None:
+        """
+        Add component to the registry
+        
+        Args:
+            component_name: Name of component
+            component_info: Component metadata dict
+        """
+        with self.lock:
+            self.data.setdefault("components", {})[component_name] = {
+                **copy.deepcopy(component_info),
+                "installed_at": datetime.now().isoformat()
+            }
+            self.dirty = True
+    
+    def unregister(self, component_name: str) -> bool:
+        """
+        Remove component from the registry
+        
+        Args:
+            component_name: Name of component to remove
+            
+        Returns:
+            True if component was registered
+        """
+        with self.lock:
+            if component_name not in self.data.get("components", {}):
+                return False
+            del self.data["components"][component_name]
+            self.dirty = True
+            return True
+    
+    def replace(self, metadata: Dict[str, Any]) -> None:
+        """
+        Replace the whole metadata document (what save_metadata() does in a transaction)
+        
+        Args:
+            metadata: New metadata dict
+        """
+        with self.lock:
+            self.data = copy.deepcopy(metadata)
+            self.dirty = True
+    
+    def commit(self) -> None:
+        """Write the metadata file once, atomically, if anything changed"""
+        with self.lock:
+            if self.dirty:
+                self.settings_manager._write_json(self.settings_manager.metadata_file,
+                                                  self.data, "metadata", atomic=True, pretty=False)
+                self.dirty = False
+
 
 class SettingsManager:
     """Manages settings.json file operations"""
     
+    # Parsed JSON files shared by all instances: path -> ((mtime_ns, size), data).
+    # Entries are served while the file's stat signature is unchanged, so
+    # writes by other processes are still picked up; saves write through.
+    _cache: Dict[str, Tuple[Tuple[int, int], Dict[str, Any]]] = {}
+    _cache_lock = threading.Lock()
+    
+    # Open metadata transactions: metadata file path -> transaction
+    _transactions: Dict[str, MetadataTransaction] = {}
+    
     def __init__(self, install_dir: Path):
         """
         Initialize settings manager
@@ -26,6 +125,7 @@ class SettingsManager:
         self.settings_file = install_dir / "settings.json"
         self.metadata_file = install_dir / ".culturabuilder-metadata.json"
         self.backup_dir = install_dir / "backups" / "settings"
+        self.history = SettingsHistory(self.backup_dir / "history")
         
     def load_settings(self) -> Dict[str, Any]:
         """
@@ -34,14 +134,7 @@ class SettingsManager:
         Returns:
             Settings dict (empty if file doesn't exist)
         """
-        if not self.settings_file.exists():
-            return {}
-        
-        try:
-            with open(self.settings_file, 'r', encoding='utf-8') as f:
-                return json.load(f)
-        except (json.JSONDecodeError, IOError) as e:
-            raise ValueError(f"Could not load settings from {self.settings_file}: {e}")
+        return copy.deepcopy(self._read_json(self.settings_file, "settings"))
     
     def save_settings(self, settings: Dict[str, Any], create_backup: bool = True) -> None:
         """
@@ -51,6 +144,14 @@ class SettingsManager:
             settings: Settings dict to save
             create_backup: Whether to create backup before saving
         """
+        # Saving unchanged content costs nothing (no backup, no write)
+        if self.settings_file.exists():
+            try:
+                if self._read_json(self.settings_file, "settings") == settings:
+                    return
+            except ValueError:
+                pass  # Unreadable file gets overwritten (after a backup)
+        
         # Create backup if requested and file exists
         if create_backup and self.settings_file.exists():
             self._create_settings_backup()
@@ -59,11 +160,7 @@ class SettingsManager:
         self.settings_file.parent.mkdir(parents=True, exist_ok=True)
         
         # Save with pretty formatting
-        try:
-            with open(self.settings_file, 'w', encoding='utf-8') as f:
-                json.dump(settings, f, indent=2, ensure_ascii=False, sort_keys=True)
-        except IOError as e:
-            raise ValueError(f"Could not save settings to {self.settings_file}: {e}")
+        self._write_json(self.settings_file, settings, "settings")
     
     def load_metadata(self) -> Dict[str, Any]:
         """
@@ -72,14 +169,11 @@ class SettingsManager:
         Returns:
             Metadata dict (empty if file doesn't exist)
         """
-        if not self.metadata_file.exists():
-            return {}
-        
-        try:
-            with open(self.metadata_file, 'r', encoding='utf-8') as f:
-                return json.load(f)
-        except (json.JSONDecodeError, IOError) as e:
-            raise ValueError(f"Could not load metadata from {self.metadata_file}: {e}")
+        transaction = self._active_transaction()
+        if transaction is not None:
+            with transaction.lock:
+                return copy.deepcopy(transaction.data)
+        return copy.deepcopy(self._read_json(self.metadata_file, "metadata"))
     
     def save_metadata(self, metadata: Dict[str, Any]) -> None:
         """
@@ -88,15 +182,155 @@ class SettingsManager:
         Args:
             metadata: Metadata dict to save
         """
+        transaction = self._active_transaction()
+        if transaction is not None:
+            transaction.replace(metadata)
+            return
+        
         # Ensure directory exists
         self.metadata_file.parent.mkdir(parents=True, exist_ok=True)
         
-        # Save with pretty formatting
+        # Machine-owned file, saved compact
+        self._write_json(self.metadata_file, metadata, "metadata", atomic=True, pretty=False)
+    
+    @contextmanager
+    def transaction(self) -> Iterator[MetadataTransaction]:
+        """
+        Batch metadata changes into a single write
+        
+        All metadata reads and writes for this installation directory, from
+        any SettingsManager, go to an in-memory copy until the block exits;
+        the file is then written once through an atomic rename. If the block
+        raises, the changes are discarded. Nested calls join the open
+        transaction.
+        
+        Yields:
+            MetadataTransaction
+        """
+        existing = self._active_transaction()
+        if existing is not None:
+            yield existing
+            return
+        
+        transaction = MetadataTransaction(self)
+        key = os.path.abspath(self.metadata_file)
+        with self._cache_lock:
+            self._transactions[key] = transaction
+        try:
+            yield transaction
+        except BaseException:
+            with self._cache_lock:
+                self._transactions.pop(key, None)
+            raise
+        with self._cache_lock:
+            self._transactions.pop(key, None)
+        transaction.commit()
+    
+    def _active_transaction(self) -> Optional[MetadataTransaction]:
+        """Get the open transaction for this metadata file, if any"""
+        if not self._transactions:
+            return None
+        with self._cache_lock:
+            return self._transactions.get(os.path.abspath(self.metadata_file))
+    
+    def _read_json(self, path: Path, description: str) -> Dict[str, Any]:
+        """
+        Get parsed content of a JSON file, re-reading it only when its
+        (mtime_ns, size) changed
+        
+        The returned dict is shared with the cache and must not be modified.
+        
+        Args:
+            path: JSON file
+            description: What the file holds, for error messages
+            
+        Returns:
+            Parsed dict (empty if the file doesn't exist)
+        """
+        key = os.path.abspath(path)
+        try:
+            file_stat = os.stat(path)
+        except FileNotFoundError:
+            with self._cache_lock:
+                self._cache.pop(key, None)
+            return {}
+        except OSError as e:
+            raise ValueError(f"Could not load {description} from {path}: {e}")
+        
+        signature = (file_stat.st_mtime_ns, file_stat.st_size)
+        with self._cache_lock:
+            cached = self._cache.get(key)
+        if cached is not None and cached[0] == signature:
+            return cached[1]
+        
+        try:
+            data = json_codec.load_file(path)
+        except (json_codec.JSONDecodeError, IOError) as e:
+            raise ValueError(f"Could not load {description} from {path}: {e}")
+        
+        # Keyed by the signature taken before reading; if the file changed in
+        # between, the next lookup sees a new signature and reads it again
+        with self._cache_lock:
+            self._cache[key] = (signature, data)
+        return data
+    
+    def _write_json(self, path: Path, data: Dict[str, Any], description: str,
+                    atomic: bool = False, pretty: bool = True) -> None:
+        """
+        Write a JSON file and update the cache with what was written
+        
+        Args:
+            path: JSON file
+            data: Dict to save
+            description: What the file holds, for error messages
+            atomic: Write a temporary file and rename it over path, so readers
+                    never see a partial file (replaces a symlink at path)
+            pretty: Indent the file (False writes compact JSON, for machine-owned files)
+        """
+        key = os.path.abspath(path)
         try:
-            with open(self.metadata_file, 'w', encoding='utf-8') as f:
-                json.dump(metadata, f, indent=2, ensure_ascii=False, sort_keys=True)
-        except IOError as e:
-            raise ValueError(f"Could not save metadata to {self.metadata_file}: {e}")
+            text = json_codec.dumpb(data, pretty=pretty, sort_keys=True)
+            if atomic:
+                path.parent.mkdir(parents=True, exist_ok=True)
+                temp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+                with open(temp_path, 'wb') as f:
+                    f.write(text)
+                    f.flush()
+                    os.fsync(f.fileno())
+                os.replace(temp_path, path)
+            else:
+                with open(path, 'wb') as f:
+                    f.write(text)
+            file_stat = os.stat(path)
+        except (IOError, TypeError, ValueError) as e:
+            with self._cache_lock:
+                self._cache.pop(key, None)
+            raise ValueError(f"Could not save {description} to {path}: {e}")
+        
+        # Cache the round-tripped data, exactly what a re-read would return
+        with self._cache_lock:
+            self._cache[key] = ((file_stat.st_mtime_ns, file_stat.st_size), json_codec.loads(text))
+    
+    def _current_metadata(self) -> Dict[str, Any]:
+        """Metadata as currently seen, from an open transaction or the cache (do not modify)"""
+        transaction = self._active_transaction()
+        if transaction is not None:
+            return transaction.data
+        return self._read_json(self.metadata_file, "metadata")
+    
+    @classmethod
+    def invalidate_cache(cls, path: Optional[Path] = None) -> None:
+        """
+        Drop cached file contents
+        
+        Args:
+            path: File to drop (None drops everything)
+        """
+        with cls._cache_lock:
+            if path is None:
+                cls._cache.clear()
+            else:
+                cls._cache.pop(os.path.abspath(path), None)
 
     def merge_metadata(self, modifications: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -119,7 +353,13 @@ class SettingsManager:
             modifications: Settings modifications to apply
             create_backup: Whether to create backup before updating
         """
-        merged = self.merge_metadata(modifications)
+        transaction = self._active_transaction()
+        if transaction is not None:
+            transaction.merge(modifications)
+            return
+        
+        # Merge onto the cached document; the merge never modifies it
+        merged = self._deep_merge(self._read_json(self.metadata_file, "metadata"), modifications)
         self.save_metadata(merged)
 
     def migrate_culturabuilder_data(self) -> bool:
@@ -181,7 +421,8 @@ class SettingsManager:
             modifications: Settings modifications to apply
             create_backup: Whether to create backup before updating
         """
-        merged = self.merge_settings(modifications)
+        # Merge onto the cached document; the merge never modifies it
+        merged = self._deep_merge(self._read_json(self.settings_file, "settings"), modifications)
         self.save_settings(merged, create_backup)
     
     def get_setting(self, key_path: str, default: Any = None) -> Any:
@@ -195,13 +436,13 @@ class SettingsManager:
         Returns:
             Setting value or default
         """
-        settings = self.load_settings()
+        settings = self._read_json(self.settings_file, "settings")
         
         try:
             value = settings
             for key in key_path.split('.'):
                 value = value[key]
-            return value
+            return copy.deepcopy(value)
         except (KeyError, TypeError):
             return default
     
@@ -266,6 +507,11 @@ class SettingsManager:
             component_name: Name of component
             component_info: Component metadata dict
         """
+        transaction = self._active_transaction()
+        if transaction is not None:
+            transaction.register(component_name, component_info)
+            return
+        
         metadata = self.load_metadata()
         if "components" not in metadata:
             metadata["components"] = {}
@@ -287,6 +533,10 @@ class SettingsManager:
         Returns:
             True if component was removed, False if not found
         """
+        transaction = self._active_transaction()
+        if transaction is not None:
+            return transaction.unregister(component_name)
+        
         metadata = self.load_metadata()
         if "components" in metadata and component_name in metadata["components"]:
             del metadata["components"][component_name]
@@ -301,8 +551,8 @@ class SettingsManager:
         Returns:
             Dict of component_name -> component_info
         """
-        metadata = self.load_metadata()
-        return metadata.get("components", {})
+        metadata = self._current_metadata()
+        return copy.deepcopy(metadata.get("components", {}))
     
     def is_component_installed(self, component_name: str) -> bool:
         """
@@ -314,7 +564,7 @@ class SettingsManager:
         Returns:
             True if component is installed, False otherwise
         """
-        components = self.get_installed_components()
+        components = self._current_metadata().get("components", {})
         return component_name in components
     
     def get_component_version(self, component_name: str) -> Optional[str]:
@@ -327,7 +577,7 @@ class SettingsManager:
         Returns:
             Version string or None if not installed
         """
-        components = self.get_installed_components()
+        components = self._current_metadata().get("components", {})
         component_info = components.get(component_name, {})
         return component_info.get("version")
     
@@ -376,47 +626,65 @@ class SettingsManager:
         Returns:
             Metadata value or default
         """
-        metadata = self.load_metadata()
+        metadata = self._current_metadata()
         
         try:
             value = metadata
             for key in key_path.split('.'):
                 value = value[key]
-            return value
+            return copy.deepcopy(value)
         except (KeyError, TypeError):
             return default
     
     def _deep_merge(self, base: Dict[str, Any], overlay: Dict[str, Any]) -> Dict[str, Any]:
         """
-        Deep merge two dictionaries
+        Deep merge two dictionaries (copy-on-write)
+        
+        base is never modified. Only the dicts on the paths the overlay
+        changes are copied; every other subtree of the result is shared with
+        base, so merging a small patch costs O(patch) rather than O(document).
+        Values taken from the overlay are deep-copied.
         
         Args:
             base: Base dictionary
             overlay: Dictionary to merge on top
             
         Returns:
-            Merged dictionary
+            Merged dictionary (shares unchanged subtrees with base)
         """
-        result = copy.deepcopy(base)
+        result = dict(base)
         
         for key, value in overlay.items():
-            if key in result and isinstance(result[key], dict) and isinstance(value, dict):
-                result[key] = self._deep_merge(result[key], value)
+            existing = result.get(key)
+            if isinstance(existing, dict) and isinstance(value, dict):
+                result[key] = self._deep_merge(existing, value)
             else:
                 result[key] = copy.deepcopy(value)
         
         return result
     
-    def _create_settings_backup(self) -> Path:
+    def _create_settings_backup(self) -> Optional[Union[str, Path]]:
         """
-        Create timestamped backup of settings.json
+        Record the current settings.json in the settings history
+        
+        Versions are deduplicated by content and stored as deltas, so a backup
+        of unchanged settings costs nothing. A settings file that is not valid
+        JSON is copied to a timestamped settings_*.json file instead.
         
         Returns:
-            Path to backup file
+            Name of the new version or path to the backup file (None if the
+            settings match the latest version)
         """
         if not self.settings_file.exists():
             raise ValueError("Cannot backup non-existent settings file")
         
+        try:
+            current = self._read_json(self.settings_file, "settings")
+        except ValueError:
+            current = None
+        if current is not None:
+            return self.history.record(current, source_mtime=self.settings_file.stat().st_mtime)
+        
         # Create backup directory
         self.backup_dir.mkdir(parents=True, exist_ok=True)
         
@@ -433,7 +701,8 @@ class SettingsManager:
     
     def _cleanup_old_backups(self, keep_count: int = 10) -> None:
         """
-        Remove old backup files, keeping only the most recent
+        Remove old timestamped backup files, keeping only the most recent
+        (the settings history prunes itself)
         
         Args:
             keep_count: Number of backups to keep
@@ -461,11 +730,22 @@ class SettingsManager:
         
         Returns:
             List of backup info dicts with name, path, and timestamp
+            (history versions and legacy settings_*.json files)
         """
         if not self.backup_dir.exists():
             return []
         
         backups = []
+        for record in self.history.versions():
+            source_mtime = record.get("source_mtime")
+            backups.append({
+                "name": record["name"],
+                "path": str(self.history.versions_file),
+                "size": record["size"],
+                "created": record["created"],
+                "modified": datetime.fromtimestamp(source_mtime).isoformat() if source_mtime else record["created"]
+            })
+        
         for file in self.backup_dir.glob("settings_*.json"):
             try:
                 stat = file.stat()
@@ -488,11 +768,20 @@ class SettingsManager:
         Restore settings from backup
         
         Args:
-            backup_name: Name of backup file to restore
+            backup_name: Name of a history version or backup file to restore
             
         Returns:
             True if successful, False otherwise
         """
+        if backup_name.startswith(SettingsHistory.NAME_PREFIX):
+            try:
+                settings = self.history.reconstruct(backup_name)
+                # save_settings records the current settings first
+                self.save_settings(settings, create_backup=True)
+                return True
+            except ValueError:
+                return False
+        
         backup_file = self.backup_dir / backup_name
         
         if not backup_file.exists():
@@ -500,16 +789,16 @@ class SettingsManager:
         
         try:
             # Validate backup file first
-            with open(backup_file, 'r', encoding='utf-8') as f:
-                json.load(f)  # Will raise exception if invalid
+            json_codec.load_file(backup_file)  # Will raise exception if invalid
             
             # Create backup of current settings
             if self.settings_file.exists():
                 self._create_settings_backup()
             
-            # Restore backup
+            # Restore backup (copy2 keeps the backup's mtime, so drop the cache entry)
             shutil.copy2(backup_file, self.settings_file)
+            self.invalidate_cache(self.settings_file)
             return True
             
-        except (json.JSONDecodeError, IOError):
+        except (json_codec.JSONDecodeError, IOError):
             return False
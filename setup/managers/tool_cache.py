@@ -0,0 +1,131 @@
+"""
+Persistent tool-detection cache for CulturaBuilder installation system
+Remembers probe results (e.g. `node --version`) across runs so unchanged tools are not re-spawned
+"""
+
+import hashlib
+import os
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from .persistent_cache import PersistentCache
+from ..utils.path_resolver import which
+
+# Seconds a detection result stays valid; 0 disables the cache
+TTL_ENV_VAR = "CULTURABUILDER_TOOL_CACHE_TTL"
+
+
+class ToolProbeCache(PersistentCache):
+    """
+    Probe results keyed by command line and fingerprinted by the binary it runs
+
+    A cached result is only used while the command still resolves (through
+    the same PATH) to the same binary with the same size and modification
+    time, and while it is younger than the TTL. Upgrading, removing or
+    installing a tool, or changing PATH, therefore forces a fresh probe.
+    """
+
+    DEFAULT_TTL = 24 * 60 * 60
+
+    def __init__(self, cache_file: Optional[Path] = None, ttl: Optional[float] = None):
+        """
+        Initialize tool probe cache
+
+        Args:
+            cache_file: JSON file backing the cache (None keeps it in memory only)
+            ttl: Seconds a result stays valid (defaults to $CULTURABUILDER_TOOL_CACHE_TTL
+                or DEFAULT_TTL; 0 disables caching)
+        """
+        super().__init__(cache_file)
+        if ttl is None:
+            try:
+                ttl = float(os.environ.get(TTL_ENV_VAR, self.DEFAULT_TTL))
+            except ValueError:
+                ttl = self.DEFAULT_TTL
+        self.ttl = ttl
+        self._entries: Dict[str, Dict[str, Any]] = {}
+
+    @staticmethod
+    def fingerprint(command: List[str]) -> Dict[str, Any]:
+        """
+        Identify the binary a command runs, without running it
+
+        Args:
+            command: Probe command
+
+        Returns:
+            Dict of resolved path, real path, size, mtime_ns and a hash of PATH
+        """
+        path_env = os.environ.get("PATH", "")
+        fingerprint: Dict[str, Any] = {
+            "path_hash": hashlib.sha256(path_env.encode('utf-8')).hexdigest()[:16],
+            "binary": which(command[0]) if command else None
+        }
+        if fingerprint["binary"]:
+            try:
+                st = os.stat(fingerprint["binary"])
+                fingerprint["realpath"] = os.path.realpath(fingerprint["binary"])
+                fingerprint["size"] = st.st_size
+                fingerprint["mtime_ns"] = st.st_mtime_ns
+            except OSError:
+                fingerprint["binary"] = None
+        return fingerprint
+
+    def get(self, command: List[str]) -> Optional[Dict[str, Any]]:
+        """
+        Look up the cached result of a probe
+
+        Args:
+            command: Probe command
+
+        Returns:
+            Cached result fields (status, returncode, stdout, stderr) or None
+        """
+        if self.ttl <= 0:
+            return None
+
+        key = " ".join(command)
+        with self._lock:
+            self._ensure_loaded()
+            entry = self._entries.get(key)
+        if entry is None or time.time() - entry.get("checked", 0) > self.ttl:
+            return None
+        if entry.get("fingerprint") != self.fingerprint(command):
+            return None
+        return entry.get("result")
+
+    def put(self, command: List[str], result: Dict[str, Any]) -> None:
+        """
+        Store the result of a probe
+
+        Args:
+            command: Probe command
+            result: Result fields (status, returncode, stdout, stderr)
+        """
+        if self.ttl <= 0:
+            return
+
+        entry = {
+            "fingerprint": self.fingerprint(command),
+            "checked": time.time(),
+            "result": result
+        }
+        with self._lock:
+            self._ensure_loaded()
+            self._entries[" ".join(command)] = entry
+            self._dirty = True
+
+    def clear(self) -> None:
+        """Drop all cached results"""
+        with self._lock:
+            self._entries.clear()
+            self._loaded = True
+            self._dirty = True
+
+    def _dump_entries(self) -> Dict[str, Dict[str, Any]]:
+        return self._entries
+
+    def _load_entries(self, entries: Any) -> None:
+        if isinstance(entries, dict):
+            self._entries.update(entries)
@@ -6,17 +6,20 @@ executed through the unified CLI hub (CulturaBuilder).
 
 Each operation module should implement:
 - register_parser(subparsers): Register CLI arguments for the operation
-- run(args): Execute the operation with parsed arguments
+- run(args, context=None): Execute the operation with parsed arguments and the
+  shared OperationContext of the invocation (created by run() when omitted)
 
 Available operations:
 - install: Install CulturaBuilder framework components
 - update: Update existing CulturaBuilder installation
 - uninstall: Remove CulturaBuilder framework installation  
 - backup: Backup and restore CulturaBuilder installations
+- mcp: Manage MCP server packages (prefetch for offline installs)
+- metrics: View and manage local usage metrics
 """
 
 __version__ = "3.0.0"
-__all__ = ["install", "update", "uninstall", "backup"]
+__all__ = ["install", "update", "uninstall", "backup", "mcp", "metrics"]
 
 
 def get_operation_info():
@@ -41,6 +44,16 @@ def get_operation_info():
             "name": "backup",
             "description": "Backup and restore CulturaBuilder installations",
             "module": "setup.operations.backup"
+        },
+        "mcp": {
+            "name": "mcp",
+            "description": "Manage MCP server packages",
+            "module": "setup.operations.mcp"
+        },
+        "metrics": {
+            "name": "metrics",
+            "description": "View and manage usage metrics",
+            "module": "setup.operations.metrics"
         }
     }
 
@@ -3,25 +3,52 @@ CulturaBuilder Backup Operation Module
 Refactored from backup.py for unified CLI hub
 """
 
+import io
 import sys
 import time
 import tarfile
-import json
+import hashlib
 from pathlib import Path
 from datetime import datetime
 from typing import List, Optional, Dict, Any, Tuple
 import argparse
 
+from ..core.context import OperationContext
 from ..managers.settings_manager import SettingsManager
+from ..managers.file_manager import FileManager
+from ..managers.hash_cache import HashCache
 from ..utils.ui import (
     display_header, display_info, display_success, display_error, 
     display_warning, Menu, confirm, ProgressBar, Colors, format_size
 )
 from ..utils.logger import get_logger
-from .. import DEFAULT_INSTALL_DIR
+from ..utils import json_codec
+from ..utils.ignore import IgnoreMatcher
+from ..utils.walker import WalkEntry, walk_tree
+from .. import DEFAULT_INSTALL_DIR, CACHE_DIR_NAME
 from . import OperationBase
 
 
+# Archive member holding sha256 digests of every archived file
+BACKUP_MANIFEST_NAME = "backup_manifest.json"
+
+
+class _HashingReader:
+    """File wrapper that hashes bytes as tarfile reads them"""
+    
+    def __init__(self, fileobj):
+        self.fileobj = fileobj
+        self.hasher = hashlib.sha256()
+    
+    def read(self, size: int = -1) -> bytes:
+        data = self.fileobj.read(size)
+        self.hasher.update(data)
+        return data
+    
+    def hexdigest(self) -> str:
+        return self.hasher.hexdigest()
+
+
 class BackupOperation(OperationBase):
     """Backup operation implementation"""
     
@@ -104,6 +131,14 @@ Examples:
         help="Compression method (default: gzip)"
     )
     
+    parser.add_argument(
+        "--exclude",
+        action="append",
+        default=[],
+        metavar="PATTERN",
+        help="gitignore-style pattern to leave out of the backup (repeatable, e.g. /backups/)"
+    )
+    
     # Restore options
     parser.add_argument(
         "--overwrite",
@@ -136,9 +171,9 @@ def get_backup_directory(args: argparse.Namespace) -> Path:
         return args.install_dir / "backups"
 
 
-def check_installation_exists(install_dir: Path) -> bool:
+def check_installation_exists(install_dir: Path, context: Optional[OperationContext] = None) -> bool:
     """Check if CulturaBuilder installation (v2 included) exists"""
-    settings_manager = SettingsManager(install_dir)
+    settings_manager = context.settings_manager if context else SettingsManager(install_dir)
 
     return settings_manager.check_installation_exists() or settings_manager.check_v2_installation_exists()
 
@@ -176,10 +211,18 @@ def get_backup_info(backup_path: Path) -> Dict[str, Any]:
                 metadata_member = tar.getmember("backup_metadata.json")
                 metadata_file = tar.extractfile(metadata_member)
                 if metadata_file:
-                    info["metadata"] = json.loads(metadata_file.read().decode())
+                    info["metadata"] = json_codec.loads(metadata_file.read())
             except KeyError:
                 pass  # No metadata file
             
+            # Look for hash manifest (backups made by older versions have none)
+            try:
+                manifest_file = tar.extractfile(tar.getmember(BACKUP_MANIFEST_NAME))
+                if manifest_file:
+                    info["manifest"] = json_codec.loads(manifest_file.read())
+            except KeyError:
+                pass
+            
             # Get list of files in backup
             info["files"] = len(tar.getnames())
             
@@ -231,7 +274,7 @@ def display_backup_list(backups: List[Dict[str, Any]]) -> None:
     print()
 
 
-def create_backup_metadata(install_dir: Path) -> Dict[str, Any]:
+def create_backup_metadata(install_dir: Path, context: Optional[OperationContext] = None) -> Dict[str, Any]:
     """Create metadata for the backup"""
     metadata = {
         "backup_version": "3.0.0",
@@ -243,7 +286,7 @@ def create_backup_metadata(install_dir: Path) -> Dict[str, Any]:
     
     try:
         # Get installed components from metadata
-        settings_manager = SettingsManager(install_dir)
+        settings_manager = context.settings_manager if context else SettingsManager(install_dir)
         framework_config = settings_manager.get_metadata_setting("framework")
         
         if framework_config:
@@ -260,13 +303,13 @@ def create_backup_metadata(install_dir: Path) -> Dict[str, Any]:
     return metadata
 
 
-def create_backup(args: argparse.Namespace) -> bool:
+def create_backup(args: argparse.Namespace, context: Optional[OperationContext] = None) -> bool:
     """Create a new backup"""
     logger = get_logger()
     
     try:
         # Check if installation exists
-        if not check_installation_exists(args.install_dir):
+        if not check_installation_exists(args.install_dir, context):
             logger.error(f"No CulturaBuilder installation found in {args.install_dir}")
             return False
         
@@ -295,28 +338,39 @@ def create_backup(args: argparse.Namespace) -> bool:
         logger.info(f"Creating backup: {backup_file}")
         
         # Create metadata
-        metadata = create_backup_metadata(args.install_dir)
+        metadata = create_backup_metadata(args.install_dir, context)
         
         # Create backup
         start_time = time.time()
         
         with tarfile.open(backup_file, mode) as tar:
             # Add metadata file
-            import tempfile
-            with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as temp_file:
-                json.dump(metadata, temp_file, indent=2)
-                temp_file.flush()
-                tar.add(temp_file.name, arcname="backup_metadata.json")
-                Path(temp_file.name).unlink()  # Clean up temp file
+            metadata_data = json_codec.dumpb(metadata)
+            metadata_info = tarfile.TarInfo("backup_metadata.json")
+            metadata_info.size = len(metadata_data)
+            metadata_info.mtime = int(time.time())
+            tar.addfile(metadata_info, io.BytesIO(metadata_data))
             
-            # Add installation directory contents
+            # Add installation directory contents, hashing exactly what is archived
             files_added = 0
-            for item in args.install_dir.rglob("*"):
-                if item.is_file() and item != backup_file:
+            manifest = {}
+            excludes = IgnoreMatcher(list(getattr(args, "exclude", None) or []))
+            for entry in walk_tree(args.install_dir, exclude=excludes.walk_filter(), include_dirs=False):
+                item = entry.path
+                if entry.kind in (WalkEntry.FILE, WalkEntry.SYMLINK) and item != backup_file:
                     try:
                         # Create relative path for archive
                         rel_path = item.relative_to(args.install_dir)
-                        tar.add(item, arcname=str(rel_path))
+                        tarinfo = tar.gettarinfo(str(item), arcname=str(rel_path))
+                        if tarinfo.issym():
+                            # Link installs are archived as links to the content store
+                            tar.addfile(tarinfo)
+                            files_added += 1
+                            continue
+                        with open(item, 'rb') as f:
+                            reader = _HashingReader(f)
+                            tar.addfile(tarinfo, reader)
+                        manifest[rel_path.as_posix()] = reader.hexdigest()
                         files_added += 1
                         
                         if files_added % 10 == 0:
@@ -324,6 +378,13 @@ def create_backup(args: argparse.Namespace) -> bool:
                             
                     except Exception as e:
                         logger.warning(f"Could not add {item} to backup: {e}")
+            
+            # Add hash manifest used to verify restores
+            manifest_data = json_codec.dumpb(manifest, pretty=False)
+            manifest_info = tarfile.TarInfo(BACKUP_MANIFEST_NAME)
+            manifest_info.size = len(manifest_data)
+            manifest_info.mtime = int(time.time())
+            tar.addfile(manifest_info, io.BytesIO(manifest_data))
         
         duration = time.time() - start_time
         file_size = backup_file.stat().st_size
@@ -340,7 +401,8 @@ def create_backup(args: argparse.Namespace) -> bool:
         return False
 
 
-def restore_backup(backup_path: Path, args: argparse.Namespace) -> bool:
+def restore_backup(backup_path: Path, args: argparse.Namespace,
+                   context: Optional[OperationContext] = None) -> bool:
     """Restore from a backup file"""
     logger = get_logger()
     
@@ -366,18 +428,19 @@ def restore_backup(backup_path: Path, args: argparse.Namespace) -> bool:
             mode = "r"
         
         # Create backup of current installation if it exists
-        if check_installation_exists(args.install_dir) and not args.dry_run:
+        if check_installation_exists(args.install_dir, context) and not args.dry_run:
             logger.info("Creating backup of current installation before restore")
             # This would call create_backup internally
         
         # Extract backup
         start_time = time.time()
         files_restored = 0
+        restored_paths = []
         
         with tarfile.open(backup_path, mode) as tar:
             # Extract all files except metadata
             for member in tar.getmembers():
-                if member.name == "backup_metadata.json":
+                if member.name in ("backup_metadata.json", BACKUP_MANIFEST_NAME):
                     continue
                 
                 try:
@@ -391,6 +454,8 @@ def restore_backup(backup_path: Path, args: argparse.Namespace) -> bool:
                     # Extract file
                     tar.extract(member, args.install_dir)
                     files_restored += 1
+                    if member.isfile():
+                        restored_paths.append(member.name)
                     
                     if files_restored % 10 == 0:
                         logger.debug(f"Restored {files_restored} files")
@@ -398,6 +463,28 @@ def restore_backup(backup_path: Path, args: argparse.Namespace) -> bool:
                 except Exception as e:
                     logger.warning(f"Could not restore {member.name}: {e}")
         
+        # Verify restored files against the hashes recorded at backup time
+        manifest = info.get("manifest", {})
+        to_verify = {
+            args.install_dir / name: manifest[name]
+            for name in restored_paths if name in manifest
+        }
+        if to_verify:
+            logger.info(f"Verifying {len(to_verify)} restored files...")
+            file_manager = context.file_manager if context else FileManager(
+                hash_cache=HashCache.for_path(args.install_dir / CACHE_DIR_NAME / "file-hashes.json")
+            )
+            mismatched = sorted(
+                str(path.relative_to(args.install_dir))
+                for path, matches in file_manager.verify_files(to_verify)
+                if not matches
+            )
+            for name in mismatched:
+                logger.warning(f"Restored file failed integrity check: {name}")
+        
+        if context is not None:
+            context.invalidate()
+        
         duration = time.time() - start_time
         
         logger.success(f"Restore completed successfully in {duration:.1f} seconds")
@@ -483,8 +570,9 @@ def cleanup_old_backups(backup_dir: Path, args: argparse.Namespace) -> bool:
         return False
 
 
-def run(args: argparse.Namespace) -> int:
+def run(args: argparse.Namespace, context: Optional[OperationContext] = None) -> int:
     """Execute backup operation with parsed arguments"""
+    context = context or OperationContext.from_args(args)
     operation = BackupOperation()
     operation.setup_operation_logging(args)
     logger = get_logger()
@@ -517,7 +605,7 @@ def run(args: argparse.Namespace) -> int:
         
         # Handle different backup operations
         if args.create:
-            success = create_backup(args)
+            success = create_backup(args, context)
             
         elif args.list:
             backups = list_backups(backup_dir)
@@ -538,7 +626,7 @@ def run(args: argparse.Namespace) -> int:
                 if not backup_path.is_absolute():
                     backup_path = backup_dir / backup_path
             
-            success = restore_backup(backup_path, args)
+            success = restore_backup(backup_path, args, context)
             
         elif args.info:
             backup_path = Path(args.info)
@@ -9,7 +9,9 @@ from pathlib import Path
 from typing import List, Optional, Dict, Any
 import argparse
 
-from ..base.installer import Installer
+from ..base.checkpoint import InstallCheckpoint
+from ..components.mcp import MCPComponent
+from ..core.context import OperationContext
 from ..core.registry import ComponentRegistry
 from ..managers.config_manager import ConfigManager
 from ..core.validator import Validator
@@ -18,7 +20,10 @@ from ..utils.ui import (
     display_warning, Menu, confirm, ProgressBar, Colors, format_size
 )
 from ..utils.logger import get_logger
-from .. import DEFAULT_INSTALL_DIR, PROJECT_ROOT
+from .. import (
+    DEFAULT_INSTALL_DIR, DEFAULT_CONTENT_STORE, DEFAULT_NPM_CACHE_DIR, LINK_MODES, MCP_PREFIX_DIR_NAME, MCP_STRATEGIES,
+    PROJECT_ROOT
+)
 from . import OperationBase
 
 
@@ -44,6 +49,10 @@ Examples:
   CulturaBuilder install --profile developer      # Developer profile  
   CulturaBuilder install --components core mcp    # Specific components
   CulturaBuilder install --verbose --force        # Verbose with force mode
+  CulturaBuilder install --link-mode symlink      # Link to shared content store
+  CulturaBuilder install --staged                 # Stage, validate, then swap in
+  CulturaBuilder install --rollback               # Undo the last staged install
+  CulturaBuilder install --resume --yes           # Finish an interrupted install
         """,
         formatter_class=argparse.RawDescriptionHelpFormatter,
         parents=parents
@@ -82,6 +91,76 @@ Examples:
         help="Skip backup creation"
     )
     
+    parser.add_argument(
+        "--link-mode",
+        choices=LINK_MODES,
+        help="How framework files are installed: copied, or linked to a read-only content store "
+             "(default: mode of the existing installation, else copy)"
+    )
+    
+    parser.add_argument(
+        "--content-store",
+        type=Path,
+        default=DEFAULT_CONTENT_STORE,
+        help=f"Content store used by --link-mode (default: {DEFAULT_CONTENT_STORE})"
+    )
+    
+    parser.add_argument(
+        "--staged",
+        action="store_true",
+        help="Build components in a staging directory and swap them in atomically (replaces the tar backup)"
+    )
+    
+    parser.add_argument(
+        "--rollback",
+        action="store_true",
+        help="Restore the files replaced by the last staged installation and exit"
+    )
+    
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="Resume an interrupted installation, skipping work that was completed and is unchanged"
+    )
+    
+    # MCP server options
+    parser.add_argument(
+        "--mcp-jobs",
+        type=int,
+        default=MCPComponent.DEFAULT_JOBS,
+        help=f"MCP servers installed at the same time (default: {MCPComponent.DEFAULT_JOBS})"
+    )
+    
+    parser.add_argument(
+        "--mcp-retries",
+        type=int,
+        default=MCPComponent.DEFAULT_RETRIES,
+        help=f"Retries for a failed MCP server installation (default: {MCPComponent.DEFAULT_RETRIES})"
+    )
+    
+    parser.add_argument(
+        "--mcp-budget",
+        type=float,
+        default=MCPComponent.DEFAULT_BUDGET,
+        help=f"Seconds all MCP server installations may take together (default: {MCPComponent.DEFAULT_BUDGET:.0f})"
+    )
+    
+    parser.add_argument(
+        "--mcp-strategy",
+        choices=MCP_STRATEGIES,
+        default="npx",
+        help="How MCP servers are started: npx from the registry, offline from the packages "
+             "prefetched by 'CulturaBuilder mcp --prefetch', or local from pinned packages installed "
+             f"into <install-dir>/{MCP_PREFIX_DIR_NAME} (default: npx)"
+    )
+    
+    parser.add_argument(
+        "--npm-cache",
+        type=Path,
+        default=DEFAULT_NPM_CACHE_DIR,
+        help=f"Prefetched package cache used by --mcp-strategy offline and local (default: {DEFAULT_NPM_CACHE_DIR})"
+    )
+    
     parser.add_argument(
         "--list-components",
         action="store_true",
@@ -97,7 +176,8 @@ Examples:
     return parser
 
 
-def validate_system_requirements(validator: Validator, component_names: List[str]) -> bool:
+def validate_system_requirements(validator: Validator, component_names: List[str],
+                                 config_manager: Optional[ConfigManager] = None) -> bool:
     """Validate system requirements"""
     logger = get_logger()
     
@@ -105,7 +185,7 @@ def validate_system_requirements(validator: Validator, component_names: List[str
     
     try:
         # Load requirements configuration
-        config_manager = ConfigManager(PROJECT_ROOT / "config")
+        config_manager = config_manager or ConfigManager(PROJECT_ROOT / "config")
         requirements = config_manager.get_requirements_for_components(component_names)
         
         # Validate requirements
@@ -131,6 +211,18 @@ def validate_system_requirements(validator: Validator, component_names: List[str
         return False
 
 
+def validate_mcp_args(args: argparse.Namespace) -> List[str]:
+    """Check the MCP server installation options"""
+    errors = []
+    if args.mcp_jobs < 1:
+        errors.append(f"--mcp-jobs must be at least 1 (got {args.mcp_jobs})")
+    if args.mcp_retries < 0:
+        errors.append(f"--mcp-retries cannot be negative (got {args.mcp_retries})")
+    if args.mcp_budget <= 0:
+        errors.append(f"--mcp-budget must be greater than 0 seconds (got {args.mcp_budget:g})")
+    return errors
+
+
 def get_components_to_install(args: argparse.Namespace, registry: ComponentRegistry, config_manager: ConfigManager) -> Optional[List[str]]:
     """Determine which components to install"""
     logger = get_logger()
@@ -236,7 +328,8 @@ def interactive_component_selection(registry: ComponentRegistry, config_manager:
         return None
 
 
-def display_installation_plan(components: List[str], registry: ComponentRegistry, install_dir: Path) -> None:
+def display_installation_plan(components: List[str], registry: ComponentRegistry, install_dir: Path,
+                              context: Optional[OperationContext] = None) -> None:
     """Display installation plan"""
     logger = get_logger()
     
@@ -259,7 +352,10 @@ def display_installation_plan(components: List[str], registry: ComponentRegistry
                 
                 # Get size estimate if component supports it
                 try:
-                    instance = registry.get_component_instance(component_name, install_dir)
+                    if context is not None:
+                        instance = context.get_component(component_name)
+                    else:
+                        instance = registry.get_component_instance(component_name, install_dir)
                     if instance and hasattr(instance, 'get_size_estimate'):
                         size = instance.get_size_estimate()
                         total_size += size
@@ -331,21 +427,19 @@ def run_system_diagnostics(validator: Validator) -> None:
         print("  3. Run 'CulturaBuilder install --diagnose' again to verify")
 
 
-def perform_installation(components: List[str], args: argparse.Namespace) -> bool:
+def perform_installation(components: List[str], args: argparse.Namespace,
+                         context: Optional[OperationContext] = None) -> bool:
     """Perform the actual installation"""
     logger = get_logger()
     start_time = time.time()
+    context = context or OperationContext.from_args(args)
     
     try:
-        # Create installer
-        installer = Installer(args.install_dir, dry_run=args.dry_run)
-        
-        # Create component registry
-        registry = ComponentRegistry(PROJECT_ROOT / "setup" / "components")
-        registry.discover_components()
+        installer = context.installer
+        registry = context.registry
         
-        # Create component instances
-        component_instances = registry.create_component_instances(components, args.install_dir)
+        # Component instances are shared with the installation plan
+        component_instances = context.get_components(components)
         
         if not component_instances:
             logger.error("No valid component instances created")
@@ -370,10 +464,23 @@ def perform_installation(components: List[str], args: argparse.Namespace) -> boo
         config = {
             "force": args.force,
             "backup": not args.no_backup,
-            "dry_run": args.dry_run
+            "dry_run": args.dry_run,
+            "link_mode": args.link_mode,
+            "content_store": args.content_store,
+            "resume": args.resume,
+            "mcp_jobs": args.mcp_jobs,
+            "mcp_retries": args.mcp_retries,
+            "mcp_budget": args.mcp_budget,
+            "mcp_strategy": args.mcp_strategy,
+            "npm_cache": args.npm_cache,
+            # Resolved against the live directory, since staged installs build components elsewhere
+            "mcp_prefix": args.install_dir / MCP_PREFIX_DIR_NAME
         }
         
-        success = installer.install_components(ordered_components, config)
+        if args.staged:
+            success = installer.install_components_staged(ordered_components, config)
+        else:
+            success = installer.install_components(ordered_components, config)
         
         # Update progress
         for i, component_name in enumerate(ordered_components):
@@ -398,6 +505,8 @@ def perform_installation(components: List[str], args: argparse.Namespace) -> boo
             
             if summary['backup_path']:
                 logger.info(f"Backup created: {summary['backup_path']}")
+            if summary['generation_path']:
+                logger.info(f"Previous files kept for rollback: {summary['generation_path']}")
                 
         else:
             logger.error(f"Installation completed with errors in {duration:.1f} seconds")
@@ -413,8 +522,9 @@ def perform_installation(components: List[str], args: argparse.Namespace) -> boo
         return False
 
 
-def run(args: argparse.Namespace) -> int:
+def run(args: argparse.Namespace, context: Optional[OperationContext] = None) -> int:
     """Execute installation operation with parsed arguments"""
+    context = context or OperationContext.from_args(args)
     operation = InstallOperation()
     operation.setup_operation_logging(args)
     logger = get_logger()
@@ -431,7 +541,8 @@ def run(args: argparse.Namespace) -> int:
     try:
         # Validate global arguments
         success, errors = operation.validate_global_args(args)
-        if not success:
+        errors += validate_mcp_args(args)
+        if errors:
             for error in errors:
                 logger.error(error)
             return 1
@@ -445,8 +556,7 @@ def run(args: argparse.Namespace) -> int:
         
         # Handle special modes
         if args.list_components:
-            registry = ComponentRegistry(PROJECT_ROOT / "setup" / "components")
-            registry.discover_components()
+            registry = context.registry
             
             components = registry.list_components()
             if components:
@@ -463,20 +573,29 @@ def run(args: argparse.Namespace) -> int:
                 print("No components found")
             return 0
         
+        # Handle rollback of the last staged installation
+        if args.rollback:
+            if args.dry_run:
+                logger.info("[DRY RUN] Would roll back the last staged installation")
+                return 0
+            generation = context.installer.rollback()
+            if generation is None:
+                logger.error("No staged installation to roll back")
+                return 1
+            logger.success(f"Rolled back to the installation before {generation.name}")
+            return 0
+        
         # Handle diagnostic mode
         if args.diagnose:
-            validator = Validator()
-            run_system_diagnostics(validator)
+            run_system_diagnostics(context.validator)
             return 0
         
         # Create component registry and load configuration
         logger.info("Initializing installation system...")
         
-        registry = ComponentRegistry(PROJECT_ROOT / "setup" / "components")
-        registry.discover_components()
-        
-        config_manager = ConfigManager(PROJECT_ROOT / "config")
-        validator = Validator()
+        registry = context.registry
+        config_manager = context.config_manager
+        validator = context.validator
         
         # Validate configuration
         config_errors = config_manager.validate_config_files()
@@ -486,14 +605,30 @@ def run(args: argparse.Namespace) -> int:
                 logger.error(f"  - {error}")
             return 1
         
-        # Get components to install
-        components = get_components_to_install(args, registry, config_manager)
+        # Get components to install (by default those of the interrupted run when resuming)
+        checkpoint = None
+        if args.resume:
+            if args.staged:
+                logger.error("--resume cannot be combined with --staged (staged installs are discarded when interrupted)")
+                return 1
+            checkpoint = InstallCheckpoint.load(args.install_dir)
+            if checkpoint is None:
+                logger.error("No interrupted installation to resume")
+                return 1
+            logger.info(f"Resuming installation started {checkpoint.state.get('started', 'earlier')}")
+        
+        if checkpoint is not None and not args.components:
+            components = checkpoint.components
+        else:
+            components = get_components_to_install(args, registry, config_manager)
         if not components:
             logger.error("No components selected for installation")
             return 1
         
-        # Validate system requirements
-        if not validate_system_requirements(validator, components):
+        # Validate system requirements (the interrupted run already passed them)
+        if checkpoint is not None:
+            logger.info("Skipping system requirement checks (validated by the interrupted run)")
+        elif not validate_system_requirements(validator, components, config_manager):
             if not args.force:
                 logger.error("System requirements not met. Use --force to override.")
                 return 1
@@ -510,7 +645,7 @@ def run(args: argparse.Namespace) -> int:
         
         # Display installation plan
         if not args.quiet:
-            display_installation_plan(components, registry, args.install_dir)
+            display_installation_plan(components, registry, args.install_dir, context)
             
             if not args.dry_run:
                 if not args.yes and not confirm("Proceed with installation?", default=True):
@@ -518,7 +653,7 @@ def run(args: argparse.Namespace) -> int:
                     return 0
         
         # Perform installation
-        success = perform_installation(components, args)
+        success = perform_installation(components, args, context)
         
         if success:
             if not args.quiet:
@@ -537,6 +672,8 @@ def run(args: argparse.Namespace) -> int:
             
     except KeyboardInterrupt:
         print(f"\n{Colors.YELLOW}Installation cancelled by user{Colors.RESET}")
+        if not getattr(args, "staged", False) and InstallCheckpoint.load(args.install_dir) is not None:
+            print("Finished components were kept; continue with: CulturaBuilder install --resume")
         return 130
     except Exception as e:
         return operation.handle_operation_error("install", e)
@@ -0,0 +1,279 @@
+"""
+CulturaBuilder MCP Operation Module
+Manages the MCP server packages used by offline installs and benchmarks server startup
+"""
+
+import argparse
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from ..core.context import OperationContext
+from ..managers.npm_cache import NpmPackageCache
+from ..utils.mcp_probe import probe_mcp_server
+from ..utils.ui import (
+    display_header, display_info, display_success, display_error, display_warning, Colors
+)
+from ..utils.logger import get_logger
+from .. import DEFAULT_NPM_CACHE_DIR, MCP_PREFIX_DIR_NAME, MCP_STRATEGIES, SETUP_DIR
+from . import OperationBase
+
+# Stdio server started in place of every MCP server by `mcp bench --stub`
+STUB_SERVER = SETUP_DIR / "utils" / "mcp_stub_server.py"
+
+
+class MCPOperation(OperationBase):
+    """MCP operation implementation"""
+
+    def __init__(self):
+        super().__init__("mcp")
+
+
+def register_parser(subparsers, global_parser=None) -> argparse.ArgumentParser:
+    """Register mcp CLI arguments"""
+    parents = [global_parser] if global_parser else []
+
+    parser = subparsers.add_parser(
+        "mcp",
+        help="Manage MCP server packages",
+        description="Prefetch MCP server packages for offline installation and benchmark server startup",
+        epilog="""
+Examples:
+  CulturaBuilder mcp                                   # Show prefetched packages
+  CulturaBuilder mcp --prefetch                        # Pack all server packages from the registry
+  CulturaBuilder mcp --prefetch --from ./packages      # Pack from local package folders (no network)
+  CulturaBuilder install --mcp-strategy offline --yes  # Register servers that run from the cache
+  CulturaBuilder mcp bench --rounds 3                  # Time server startup and handshake
+  CulturaBuilder mcp bench --stub                      # Benchmark the bundled stub server (no network)
+        """,
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        parents=parents
+    )
+
+    parser.add_argument(
+        "action",
+        nargs="?",
+        choices=["bench"],
+        help="bench: start each MCP server, perform the initialize handshake and record "
+             "spawn-to-ready time, first tools/list latency and memory"
+    )
+
+    parser.add_argument(
+        "--prefetch",
+        action="store_true",
+        help="Pack the MCP server packages into the local package cache"
+    )
+
+    parser.add_argument(
+        "--from",
+        dest="source_dir",
+        type=Path,
+        help="Directory of package folders (<dir>/<name> or <dir>/@scope/<name>) to pack instead of the registry"
+    )
+
+    parser.add_argument(
+        "--servers",
+        type=str,
+        nargs="+",
+        help="MCP servers to prefetch or benchmark (default: all)"
+    )
+
+    parser.add_argument(
+        "--npm-cache",
+        type=Path,
+        default=DEFAULT_NPM_CACHE_DIR,
+        help=f"Package cache directory (default: {DEFAULT_NPM_CACHE_DIR})"
+    )
+
+    # Benchmark options
+    bench_group = parser.add_argument_group("Benchmark Options")
+    bench_group.add_argument(
+        "--rounds",
+        type=int,
+        default=1,
+        help="Starts per server (default: 1)"
+    )
+    bench_group.add_argument(
+        "--timeout",
+        type=float,
+        default=60.0,
+        help="Seconds a server may take to answer (default: 60)"
+    )
+    bench_group.add_argument(
+        "--mcp-strategy",
+        choices=MCP_STRATEGIES,
+        default="npx",
+        help="Start servers the way this install strategy registers them (default: npx)"
+    )
+    bench_group.add_argument(
+        "--stub",
+        action="store_true",
+        help="Start the bundled stub stdio server in place of every server"
+    )
+
+    return parser
+
+
+def get_mcp_servers(context: OperationContext) -> Dict[str, Dict[str, Any]]:
+    """Get the MCP server definitions of the MCP component"""
+    component = context.get_component("mcp")
+    return component.mcp_servers if component is not None else {}
+
+
+def prefetch_packages(cache: NpmPackageCache, servers: Dict[str, Dict[str, Any]],
+                      source_dir: Optional[Path], dry_run: bool) -> bool:
+    """Pack the packages of the given servers into the cache"""
+    logger = get_logger()
+    failed = []
+
+    for server_name, server_info in servers.items():
+        npm_package = server_info["npm_package"]
+        if dry_run:
+            logger.info(f"Would prefetch {npm_package} for {server_name}")
+            continue
+
+        start = time.time()
+        try:
+            entry = cache.prefetch(npm_package, source_dir)
+        except RuntimeError as e:
+            logger.error(f"Could not prefetch {npm_package}: {e}")
+            failed.append(server_name)
+            continue
+        logger.success(f"Prefetched {entry['name']}@{entry['version']} for {server_name} "
+                       f"in {time.time() - start:.1f}s")
+        if not entry.get("bin"):
+            logger.warning(f"{entry['name']} declares no executable; it cannot be started offline")
+
+    if failed:
+        display_error(f"Failed to prefetch: {', '.join(failed)}")
+        return False
+    return True
+
+
+def display_cache_status(cache: NpmPackageCache, servers: Dict[str, Dict[str, Any]]) -> None:
+    """Show which server packages are prefetched"""
+    print(f"\n{Colors.CYAN}{Colors.BRIGHT}MCP Server Packages{Colors.RESET}")
+    print("=" * 50)
+    print(f"{Colors.BLUE}Package cache:{Colors.RESET} {cache.cache_dir}")
+
+    for server_name, server_info in servers.items():
+        entry = cache.get(server_info["npm_package"])
+        if entry is None:
+            state = f"{Colors.YELLOW}not prefetched{Colors.RESET}"
+        else:
+            state = f"{Colors.GREEN}{entry['name']}@{entry['version']}{Colors.RESET} ({entry['filename']})"
+        print(f"  {server_name:<20} {state}")
+    print()
+
+
+def benchmark_servers(context: OperationContext, servers: Dict[str, Dict[str, Any]],
+                      args: argparse.Namespace) -> int:
+    """Start each server, measure its handshake and record the results"""
+    logger = get_logger()
+    component = context.get_component("mcp")
+    config = {
+        "mcp_strategy": args.mcp_strategy,
+        "npm_cache": args.npm_cache,
+        "mcp_prefix": args.install_dir / MCP_PREFIX_DIR_NAME
+    }
+    strategy = "stub" if args.stub else args.mcp_strategy
+    metrics_manager = context.metrics_manager
+    if not metrics_manager.metrics_enabled:
+        display_warning("Metrics collection is disabled; results are not recorded "
+                        "(enable with: CulturaBuilder metrics --enable)")
+
+    print(f"\n{Colors.CYAN}{Colors.BRIGHT}MCP Server Startup ({strategy}, {args.rounds} "
+          f"round{'s' if args.rounds != 1 else ''}){Colors.RESET}")
+    print(f"{'server':<22}{'ready':>10}{'tools/list':>12}{'tools':>7}{'RSS':>10}  status")
+
+    failures = 0
+    for server_name in servers:
+        if args.stub:
+            command: Optional[List[str]] = [sys.executable, str(STUB_SERVER), "--name", server_name]
+            error = None
+        else:
+            command, error = component.get_server_command(server_name, config)
+        if command is None:
+            print(f"{server_name:<22}{'-':>10}{'-':>12}{'-':>7}{'-':>10}  {Colors.RED}{error}{Colors.RESET}")
+            failures += 1
+            continue
+
+        results = []
+        for _ in range(max(1, args.rounds)):
+            result = probe_mcp_server(command, timeout=args.timeout)
+            result["strategy"] = strategy
+            metrics_manager.record_mcp_benchmark(server_name, result)
+            results.append(result)
+            if result["status"] != "ok":
+                break
+
+        failed = [result for result in results if result["status"] != "ok"]
+        if failed:
+            failures += 1
+            logger.debug(f"MCP server {server_name} command: {' '.join(command)}")
+            print(f"{server_name:<22}{'-':>10}{'-':>12}{'-':>7}{'-':>10}  "
+                  f"{Colors.RED}{failed[0]['status']}: {failed[0]['error']}{Colors.RESET}")
+            continue
+
+        ready = statistics.median(result["spawn_to_ready"] for result in results)
+        tools_list = statistics.median(result["tools_list_latency"] for result in results)
+        rss_values = [result["rss_bytes"] for result in results if result["rss_bytes"] is not None]
+        rss = f"{statistics.median(rss_values) / (1024 * 1024):.1f} MB" if rss_values else "n/a"
+        print(f"{server_name:<22}{ready * 1000:>8.0f}ms{tools_list * 1000:>10.1f}ms"
+              f"{results[-1]['tools_count']:>7}{rss:>10}  {Colors.GREEN}ok{Colors.RESET}")
+
+    print()
+    if failures:
+        display_error(f"{failures} of {len(servers)} MCP servers did not complete the handshake")
+        return 1
+    display_success(f"All {len(servers)} MCP servers completed the handshake")
+    return 0
+
+
+def run(args: argparse.Namespace, context: Optional[OperationContext] = None) -> int:
+    """Execute mcp operation with parsed arguments"""
+    context = context or OperationContext.from_args(args)
+    operation = MCPOperation()
+    operation.setup_operation_logging(args)
+    logger = get_logger()
+
+    try:
+        servers = get_mcp_servers(context)
+        if args.servers:
+            unknown = [name for name in args.servers if name not in servers]
+            if unknown:
+                logger.error(f"Unknown MCP servers: {', '.join(unknown)}")
+                logger.info(f"Available servers: {', '.join(servers)}")
+                return 1
+            servers = {name: servers[name] for name in args.servers}
+
+        cache = NpmPackageCache(args.npm_cache)
+
+        if args.action == "bench":
+            if not args.quiet:
+                display_header("CulturaBuilder MCP Bench v3.0", "Measuring MCP server startup and handshake")
+            return benchmark_servers(context, servers, args)
+
+        if args.prefetch:
+            if not args.quiet:
+                display_header("CulturaBuilder MCP Prefetch v3.0", "Packing MCP server packages for offline use")
+            if args.source_dir is not None and not args.source_dir.is_dir():
+                logger.error(f"Package directory not found: {args.source_dir}")
+                return 1
+
+            success = prefetch_packages(cache, servers, args.source_dir, args.dry_run)
+            if success and not args.dry_run:
+                display_success(f"MCP server packages prefetched into {cache.cache_dir}")
+                display_info("Install with: CulturaBuilder install --components mcp --mcp-strategy offline")
+            return 0 if success else 1
+
+        display_cache_status(cache, servers)
+        return 0
+
+    except KeyboardInterrupt:
+        print(f"\n{Colors.YELLOW}MCP operation cancelled by user{Colors.RESET}")
+        return 130
+    except Exception as e:
+        return operation.handle_operation_error("mcp", e)
@@ -10,9 +10,10 @@ from typing import Optional
 
 from ..utils.ui import (
     display_header, display_info, display_success, display_error,
-    display_warning, prompt_yes_no, Colors
+    display_warning, confirm, Colors
 )
 from ..utils.logger import get_logger
+from ..core.context import OperationContext
 from ..managers.metrics_manager import MetricsManager, ExportFormat
 
 
@@ -84,13 +85,13 @@ Examples:
                            help='Enable anonymous mode (no user-specific data)')
 
 
-def run(args: argparse.Namespace) -> int:
+def run(args: argparse.Namespace, context: Optional[OperationContext] = None) -> int:
     """Execute metrics operations"""
     logger = get_logger()
     
     try:
         # Initialize metrics manager
-        metrics_manager = MetricsManager(args.install_dir)
+        metrics_manager = context.metrics_manager if context else MetricsManager(args.install_dir)
         
         # Handle privacy controls first
         if args.enable:
@@ -138,13 +139,13 @@ def handle_enable_metrics(metrics_manager: MetricsManager, args: argparse.Namesp
     print("• Anonymous mode available (no user-specific data)")
     
     if not args.yes:
-        if not prompt_yes_no("\nDo you consent to local metrics collection?"):
+        if not confirm("\nDo you consent to local metrics collection?", default=False):
             display_info("Metrics collection not enabled")
             return 0
     
     anonymous = args.anonymous
     if not anonymous and not args.yes:
-        anonymous = prompt_yes_no("Enable anonymous mode? (recommended)")
+        anonymous = confirm("Enable anonymous mode? (recommended)", default=True)
     
     if metrics_manager.enable_metrics(anonymous=anonymous):
         display_success("Metrics collection enabled")
@@ -199,7 +200,7 @@ def handle_clear_metrics(metrics_manager: MetricsManager, args: argparse.Namespa
     display_warning("This will permanently delete all metrics data")
     
     if not args.yes:
-        if not prompt_yes_no("Are you sure you want to clear all metrics?"):
+        if not confirm("Are you sure you want to clear all metrics?", default=False):
             display_info("Clear operation cancelled")
             return 0
     
@@ -417,7 +418,7 @@ def handle_export(metrics_manager: MetricsManager, args: argparse.Namespace) ->
         
         # For HTML exports, offer to open in browser
         if export_format == ExportFormat.HTML and not args.quiet:
-            if prompt_yes_no("\nOpen in browser?"):
+            if confirm("\nOpen in browser?", default=False):
                 import webbrowser
                 webbrowser.open(f"file://{output_path.absolute()}")
         
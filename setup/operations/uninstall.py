@@ -9,7 +9,7 @@ from pathlib import Path
 from typing import List, Optional, Dict, Any
 import argparse
 
-from ..core.registry import ComponentRegistry
+from ..core.context import OperationContext
 from ..managers.settings_manager import SettingsManager
 from ..managers.file_manager import FileManager
 from ..utils.ui import (
@@ -17,6 +17,8 @@ from ..utils.ui import (
     display_warning, Menu, confirm, ProgressBar, Colors
 )
 from ..utils.logger import get_logger
+from ..utils.ignore import IgnoreMatcher
+from ..utils.walker import TreeSnapshot
 from .. import DEFAULT_INSTALL_DIR, PROJECT_ROOT
 from . import OperationBase
 
@@ -89,8 +91,10 @@ Examples:
     
     return parser
 
-def get_installed_components(install_dir: Path) -> Dict[str, Dict[str, Any]]:
+def get_installed_components(install_dir: Path, context: Optional[OperationContext] = None) -> Dict[str, Dict[str, Any]]:
     """Get currently installed components and their versions"""
+    if context is not None:
+        return context.get_installed_components()
     try:
         settings_manager = SettingsManager(install_dir)
         return settings_manager.get_installed_components()
@@ -98,7 +102,7 @@ def get_installed_components(install_dir: Path) -> Dict[str, Dict[str, Any]]:
         return {}
 
 
-def get_installation_info(install_dir: Path) -> Dict[str, Any]:
+def get_installation_info(install_dir: Path, context: Optional[OperationContext] = None) -> Dict[str, Any]:
     """Get detailed installation information"""
     info = {
         "install_dir": install_dir,
@@ -113,16 +117,15 @@ def get_installation_info(install_dir: Path) -> Dict[str, Any]:
         return info
     
     info["exists"] = True
-    info["components"] = get_installed_components(install_dir)
+    info["components"] = get_installed_components(install_dir, context)
     
-    # Scan installation directory
+    # Scan installation directory once; links to the content store count
+    # as files but only take up their own size
     try:
-        for item in install_dir.rglob("*"):
-            if item.is_file():
-                info["files"].append(item)
-                info["total_size"] += item.stat().st_size
-            elif item.is_dir():
-                info["directories"].append(item)
+        snapshot = TreeSnapshot.get(install_dir, refresh=True)
+        info["files"] = [entry.path for entry in snapshot.files(include_symlinks=True)]
+        info["directories"] = [entry.path for entry in snapshot.directories()]
+        info["total_size"] = snapshot.total_size()
     except Exception:
         pass
     
@@ -267,7 +270,6 @@ def create_uninstall_backup(install_dir: Path, components: List[str]) -> Optiona
         with tarfile.open(backup_path, "w:gz") as tar:
             for component in components:
                 # Add component files to backup
-                settings_manager = SettingsManager(install_dir)
                 # This would need component-specific backup logic
                 pass
         
@@ -279,18 +281,16 @@ def create_uninstall_backup(install_dir: Path, components: List[str]) -> Optiona
         return None
 
 
-def perform_uninstall(components: List[str], args: argparse.Namespace, info: Dict[str, Any]) -> bool:
+def perform_uninstall(components: List[str], args: argparse.Namespace, info: Dict[str, Any],
+                      context: Optional[OperationContext] = None) -> bool:
     """Perform the actual uninstall"""
     logger = get_logger()
     start_time = time.time()
+    context = context or OperationContext.from_args(args)
     
     try:
-        # Create component registry
-        registry = ComponentRegistry(PROJECT_ROOT / "setup" / "components")
-        registry.discover_components()
-        
         # Create component instances
-        component_instances = registry.create_component_instances(components, args.install_dir)
+        component_instances = context.get_components(components)
         
         # Setup progress tracking
         progress = ProgressBar(
@@ -331,7 +331,7 @@ def perform_uninstall(components: List[str], args: argparse.Namespace, info: Dic
         
         # Handle complete uninstall cleanup
         if args.complete:
-            cleanup_installation_directory(args.install_dir, args)
+            cleanup_installation_directory(args.install_dir, args, context)
         
         # Show results
         duration = time.time() - start_time
@@ -352,21 +352,22 @@ def perform_uninstall(components: List[str], args: argparse.Namespace, info: Dic
         return False
 
 
-def cleanup_installation_directory(install_dir: Path, args: argparse.Namespace) -> None:
+def cleanup_installation_directory(install_dir: Path, args: argparse.Namespace,
+                                   context: Optional[OperationContext] = None) -> None:
     """Clean up installation directory for complete uninstall"""
     logger = get_logger()
-    file_manager = FileManager()
+    file_manager = context.file_manager if context else FileManager()
     
     try:
         # Preserve specific directories/files if requested
         preserve_patterns = []
         
         if args.keep_backups:
-            preserve_patterns.append("backups/*")
+            preserve_patterns.append("/backups/")
         if args.keep_logs:
-            preserve_patterns.append("logs/*")
+            preserve_patterns.append("/logs/")
         if args.keep_settings and not args.complete:
-            preserve_patterns.append("settings.json")
+            preserve_patterns.append("/settings.json")
         
         # Remove installation directory contents
         if args.complete and not preserve_patterns:
@@ -377,16 +378,12 @@ def cleanup_installation_directory(install_dir: Path, args: argparse.Namespace)
                 logger.warning(f"Could not remove installation directory: {install_dir}")
         else:
             # Selective removal
+            preserve = IgnoreMatcher(preserve_patterns)
             for item in install_dir.iterdir():
-                should_preserve = False
-                
-                for pattern in preserve_patterns:
-                    if item.match(pattern):
-                        should_preserve = True
-                        break
+                should_preserve = preserve.match(item.name, item.is_dir() and not item.is_symlink())
                 
                 if not should_preserve:
-                    if item.is_file():
+                    if item.is_symlink() or item.is_file():
                         file_manager.remove_file(item)
                     elif item.is_dir():
                         file_manager.remove_directory(item)
@@ -395,8 +392,9 @@ def cleanup_installation_directory(install_dir: Path, args: argparse.Namespace)
         logger.error(f"Error during cleanup: {e}")
 
 
-def run(args: argparse.Namespace) -> int:
+def run(args: argparse.Namespace, context: Optional[OperationContext] = None) -> int:
     """Execute uninstall operation with parsed arguments"""
+    context = context or OperationContext.from_args(args)
     operation = UninstallOperation()
     operation.setup_operation_logging(args)
     logger = get_logger()
@@ -426,7 +424,7 @@ def run(args: argparse.Namespace) -> int:
             )
         
         # Get installation information
-        info = get_installation_info(args.install_dir)
+        info = get_installation_info(args.install_dir, context)
         
         # Display current installation
         if not args.quiet:
@@ -466,7 +464,7 @@ def run(args: argparse.Namespace) -> int:
             create_uninstall_backup(args.install_dir, components)
         
         # Perform uninstall
-        success = perform_uninstall(components, args, info)
+        success = perform_uninstall(components, args, info, context)
         
         if success:
             if not args.quiet:
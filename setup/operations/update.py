@@ -9,10 +9,9 @@ from pathlib import Path
 from typing import List, Optional, Dict, Any
 import argparse
 
-from ..base.installer import Installer
+from ..core.context import OperationContext
 from ..core.registry import ComponentRegistry
 from ..managers.settings_manager import SettingsManager
-from ..core.validator import Validator
 from ..utils.ui import (
     display_header, display_info, display_success, display_error, 
     display_warning, Menu, confirm, ProgressBar, Colors, format_size
@@ -84,14 +83,16 @@ Examples:
     
     return parser
 
-def check_installation_exists(install_dir: Path) -> bool:
+def check_installation_exists(install_dir: Path, context: Optional[OperationContext] = None) -> bool:
     """Check if CulturaBuilder installation exists"""
-    settings_manager = SettingsManager(install_dir)
+    settings_manager = context.settings_manager if context else SettingsManager(install_dir)
 
     return settings_manager.check_installation_exists()
 
-def get_installed_components(install_dir: Path) -> Dict[str, Dict[str, Any]]:
+def get_installed_components(install_dir: Path, context: Optional[OperationContext] = None) -> Dict[str, Dict[str, Any]]:
     """Get currently installed components and their versions"""
+    if context is not None:
+        return context.get_installed_components()
     try:
         settings_manager = SettingsManager(install_dir)
         return settings_manager.get_installed_components()
@@ -235,21 +236,18 @@ def display_update_plan(components: List[str], available_updates: Dict[str, Dict
     print()
 
 
-def perform_update(components: List[str], args: argparse.Namespace) -> bool:
+def perform_update(components: List[str], args: argparse.Namespace,
+                   context: Optional[OperationContext] = None) -> bool:
     """Perform the actual update"""
     logger = get_logger()
     start_time = time.time()
+    context = context or OperationContext.from_args(args)
     
     try:
-        # Create installer
-        installer = Installer(args.install_dir, dry_run=args.dry_run)
-        
-        # Create component registry
-        registry = ComponentRegistry(PROJECT_ROOT / "setup" / "components")
-        registry.discover_components()
+        installer = context.installer
         
         # Create component instances
-        component_instances = registry.create_component_instances(components, args.install_dir)
+        component_instances = context.get_components(components)
         
         if not component_instances:
             logger.error("No valid component instances created")
@@ -318,8 +316,9 @@ def perform_update(components: List[str], args: argparse.Namespace) -> bool:
         return False
 
 
-def run(args: argparse.Namespace) -> int:
+def run(args: argparse.Namespace, context: Optional[OperationContext] = None) -> int:
     """Execute update operation with parsed arguments"""
+    context = context or OperationContext.from_args(args)
     operation = UpdateOperation()
     operation.setup_operation_logging(args)
     logger = get_logger()
@@ -349,7 +348,7 @@ def run(args: argparse.Namespace) -> int:
             )
         
         # Check if CulturaBuilder is installed
-        if not check_installation_exists(args.install_dir):
+        if not check_installation_exists(args.install_dir, context):
             logger.error(f"CulturaBuilder installation not found in {args.install_dir}")
             logger.info("Use 'CulturaBuilder install' to install CulturaBuilder first")
             return 1
@@ -357,11 +356,10 @@ def run(args: argparse.Namespace) -> int:
         # Create component registry
         logger.info("Checking for available updates...")
         
-        registry = ComponentRegistry(PROJECT_ROOT / "setup" / "components")
-        registry.discover_components()
+        registry = context.registry
         
         # Get installed components
-        installed_components = get_installed_components(args.install_dir)
+        installed_components = get_installed_components(args.install_dir, context)
         if not installed_components:
             logger.error("Could not determine installed components")
             return 1
@@ -396,7 +394,7 @@ def run(args: argparse.Namespace) -> int:
                     return 0
         
         # Perform update
-        success = perform_update(components, args)
+        success = perform_update(components, args, context)
         
         if success:
             if not args.quiet:
@@ -0,0 +1,255 @@
+"""
+Compiled gitignore-style pattern matching for CulturaBuilder installation system
+"""
+
+import os
+import re
+from pathlib import Path
+from typing import Callable, Iterable, List, Optional, Pattern, Tuple
+
+from .walker import WalkEntry
+
+
+class IgnoreRule:
+    """A single parsed gitignore pattern"""
+
+    __slots__ = ("pattern", "regex", "negate", "dir_only")
+
+    def __init__(self, pattern: str, regex: str, negate: bool, dir_only: bool):
+        self.pattern = pattern
+        self.regex = regex
+        self.negate = negate
+        self.dir_only = dir_only
+
+    def __repr__(self) -> str:
+        return f"<IgnoreRule({self.pattern!r})>"
+
+
+class IgnoreMatcher:
+    """
+    Matches relative paths against gitignore-style patterns
+
+    Supported syntax: '#' comments, '!' negation, trailing '/' for
+    directory-only rules, anchoring with a leading or inner '/', '*', '?',
+    '[...]' and '**' (leading, trailing and inner). As in git, the last
+    matching pattern decides.
+
+    Consecutive rules with the same sign are compiled into a single regex
+    (plus one without the directory-only rules for files), so a lookup
+    costs one regex match per block of rules instead of one fnmatch per
+    pattern.
+    """
+
+    def __init__(self, patterns: Iterable[str]):
+        """
+        Initialize matcher
+
+        Args:
+            patterns: gitignore-style pattern lines
+        """
+        self.rules: List[IgnoreRule] = []
+        for line in patterns:
+            rule = self.parse_rule(line)
+            if rule is not None:
+                self.rules.append(rule)
+
+        self.has_dir_only_rules = any(rule.dir_only for rule in self.rules)
+        # Blocks of (negate, regex for directories, regex for files)
+        self._blocks: List[Tuple[bool, Optional[Pattern], Optional[Pattern]]] = []
+        self._compile()
+
+    @classmethod
+    def from_file(cls, ignore_file: Path, extra_patterns: Optional[Iterable[str]] = None) -> "IgnoreMatcher":
+        """
+        Build matcher from a .gitignore-style file
+
+        Args:
+            ignore_file: File with one pattern per line (missing file means no patterns)
+            extra_patterns: Patterns applied before those in the file
+
+        Returns:
+            IgnoreMatcher instance
+        """
+        patterns = list(extra_patterns or [])
+        if ignore_file.is_file():
+            with open(ignore_file, 'r', encoding='utf-8') as f:
+                patterns.extend(f.read().splitlines())
+        return cls(patterns)
+
+    @classmethod
+    def parse_rule(cls, line: str) -> Optional[IgnoreRule]:
+        """
+        Parse one pattern line
+
+        Args:
+            line: Pattern line
+
+        Returns:
+            IgnoreRule or None for blank lines and comments
+        """
+        pattern = line.rstrip('\n')
+        # Trailing spaces are ignored unless escaped
+        while pattern.endswith(' ') and not pattern.endswith('\\ '):
+            pattern = pattern[:-1]
+        if not pattern or pattern.startswith('#'):
+            return None
+
+        negate = False
+        if pattern.startswith('!'):
+            negate = True
+            pattern = pattern[1:]
+        elif pattern.startswith('\\!') or pattern.startswith('\\#'):
+            pattern = pattern[1:]
+
+        dir_only = pattern.endswith('/')
+        pattern = pattern.rstrip('/')
+        if not pattern:
+            return None
+
+        # A slash anywhere but at the end anchors the pattern to the root
+        anchored = '/' in pattern
+        pattern = pattern.lstrip('/')
+
+        body = cls._translate(pattern)
+        if not anchored:
+            body = f"(?:.*/)?{body}"
+        return IgnoreRule(line, body, negate, dir_only)
+
+    @staticmethod
+    def _translate(pattern: str) -> str:
+        """Translate a glob pattern (without anchoring) to a regex body"""
+        segments = pattern.split('/')
+        parts = []
+        for index, segment in enumerate(segments):
+            last = index == len(segments) - 1
+            if segment == '**':
+                if last:
+                    parts.append('.*')
+                else:
+                    parts.append('(?:.*/)?')
+                continue
+
+            regex = ''
+            i = 0
+            while i < len(segment):
+                char = segment[i]
+                if char == '*':
+                    regex += '[^/]*'
+                    while i + 1 < len(segment) and segment[i + 1] == '*':
+                        i += 1
+                elif char == '?':
+                    regex += '[^/]'
+                elif char == '\\' and i + 1 < len(segment):
+                    i += 1
+                    regex += re.escape(segment[i])
+                elif char == '[':
+                    end = segment.find(']', i + 2 if segment[i + 1:i + 2] in ('!', '^') else i + 1)
+                    if end == -1:
+                        regex += re.escape(char)
+                    else:
+                        contents = segment[i + 1:end]
+                        if contents[:1] in ('!', '^'):
+                            contents = '^' + contents[1:]
+                        regex += f"[{contents.replace(chr(92), chr(92) * 2)}]"
+                        i = end
+                else:
+                    regex += re.escape(char)
+                i += 1
+
+            parts.append(regex if last else regex + '/')
+        return ''.join(parts)
+
+    def _compile(self) -> None:
+        """Group consecutive same-sign rules and compile each group"""
+        start = 0
+        while start < len(self.rules):
+            negate = self.rules[start].negate
+            end = start
+            while end < len(self.rules) and self.rules[end].negate == negate:
+                end += 1
+            block = self.rules[start:end]
+
+            dir_regex = self._join(rule.regex for rule in block)
+            file_regex = self._join(rule.regex for rule in block if not rule.dir_only)
+            self._blocks.append((negate, dir_regex, file_regex))
+            start = end
+
+    @staticmethod
+    def _join(bodies: Iterable[str]) -> Optional[Pattern]:
+        bodies = list(bodies)
+        if not bodies:
+            return None
+        return re.compile('(?:' + '|'.join(bodies) + r')\Z')
+
+    def match(self, rel_path: str, is_dir: bool = False) -> bool:
+        """
+        Check whether a path is ignored by the patterns themselves
+
+        Parent directories are not consulted; use is_ignored() when the path
+        was not reached through a walk that already skipped ignored directories.
+
+        Args:
+            rel_path: POSIX-style path relative to the root
+            is_dir: Whether the path is a directory
+
+        Returns:
+            True if ignored
+        """
+        for negate, dir_regex, file_regex in reversed(self._blocks):
+            regex = dir_regex if is_dir else file_regex
+            if regex is not None and regex.match(rel_path):
+                return not negate
+        return False
+
+    def is_ignored(self, rel_path: str, is_dir: bool = False) -> bool:
+        """
+        Check whether a path or any of its parent directories is ignored
+
+        Args:
+            rel_path: POSIX-style path relative to the root
+            is_dir: Whether the path is a directory
+
+        Returns:
+            True if ignored
+        """
+        parts = rel_path.strip('/').split('/')
+        for depth in range(1, len(parts)):
+            if self.match('/'.join(parts[:depth]), True):
+                return True
+        return self.match('/'.join(parts), is_dir)
+
+    def copytree_ignore(self, root: Path) -> Callable[[str, List[str]], List[str]]:
+        """
+        Build an ignore callable for shutil.copytree
+
+        Args:
+            root: Source directory passed to copytree
+
+        Returns:
+            Callable returning the names to skip in a directory
+        """
+        root_str = os.fspath(root)
+
+        def ignore(directory: str, names: List[str]) -> List[str]:
+            rel_dir = os.path.relpath(directory, root_str).replace(os.sep, '/')
+            prefix = '' if rel_dir == '.' else rel_dir + '/'
+            ignored = []
+            for name in names:
+                is_dir = self.has_dir_only_rules and os.path.isdir(os.path.join(directory, name))
+                if self.match(prefix + name, is_dir):
+                    ignored.append(name)
+            return ignored
+
+        return ignore
+
+    def walk_filter(self) -> Callable[[WalkEntry], bool]:
+        """
+        Build an exclude predicate for walk_tree
+
+        Returns:
+            Predicate returning True for ignored entries
+        """
+        return lambda entry: self.match(entry.rel_path, entry.is_dir)
+
+    def __bool__(self) -> bool:
+        return bool(self.rules)
@@ -0,0 +1,142 @@
+"""
+JSON encoding and decoding for CulturaBuilder installation system
+Uses orjson when it is installed and the standard json module otherwise
+"""
+
+import json
+import os
+from pathlib import Path
+from typing import Any, Union
+
+# Handle orjson import - optional accelerator, same output format as json
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None
+    ORJSON_AVAILABLE = False
+
+# Set to "stdlib" to force the json module even when orjson is installed
+BACKEND_ENV_VAR = "CULTURABUILDER_JSON_BACKEND"
+
+# orjson.JSONDecodeError subclasses this, so callers catch one type for both backends
+JSONDecodeError = json.JSONDecodeError
+
+
+def get_backend() -> str:
+    """
+    Get the active JSON backend
+
+    Returns:
+        "orjson" or "stdlib"
+    """
+    if ORJSON_AVAILABLE and os.environ.get(BACKEND_ENV_VAR, "").strip().lower() != "stdlib":
+        return "orjson"
+    return "stdlib"
+
+
+def loads(data: Union[str, bytes]) -> Any:
+    """
+    Parse a JSON document
+
+    Args:
+        data: JSON text (bytes are decoded as UTF-8)
+
+    Returns:
+        Parsed value
+
+    Raises:
+        JSONDecodeError: If the document is invalid
+    """
+    if get_backend() == "orjson":
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumpb(obj: Any, pretty: bool = True, sort_keys: bool = False) -> bytes:
+    """
+    Serialize to UTF-8 encoded JSON
+
+    Pretty output matches json.dump(obj, indent=2, ensure_ascii=False) for
+    both backends. Compact output has no whitespace at all and is meant for
+    machine-owned files (metrics, metadata, caches).
+
+    Args:
+        obj: Value to serialize
+        pretty: Indent with two spaces (False for compact output)
+        sort_keys: Sort object keys
+
+    Returns:
+        Encoded JSON
+
+    Raises:
+        TypeError: If obj contains values JSON cannot represent
+    """
+    if get_backend() == "orjson":
+        option = orjson.OPT_NON_STR_KEYS
+        if pretty:
+            option |= orjson.OPT_INDENT_2
+        if sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        try:
+            return orjson.dumps(obj, option=option)
+        except orjson.JSONEncodeError:
+            pass  # e.g. integers beyond 64 bits; the json module handles those
+
+    if pretty:
+        text = json.dumps(obj, indent=2, ensure_ascii=False, sort_keys=sort_keys)
+    else:
+        text = json.dumps(obj, separators=(',', ':'), ensure_ascii=False, sort_keys=sort_keys)
+    return text.encode('utf-8')
+
+
+def dumps(obj: Any, pretty: bool = True, sort_keys: bool = False) -> str:
+    """
+    Serialize to a JSON string (see dumpb() for the format)
+
+    Args:
+        obj: Value to serialize
+        pretty: Indent with two spaces (False for compact output)
+        sort_keys: Sort object keys
+
+    Returns:
+        JSON text
+    """
+    return dumpb(obj, pretty, sort_keys).decode('utf-8')
+
+
+def load_file(path: Path) -> Any:
+    """
+    Read and parse a JSON file
+
+    Args:
+        path: JSON file
+
+    Returns:
+        Parsed value
+
+    Raises:
+        OSError: If the file cannot be read
+        JSONDecodeError: If the file is not valid JSON
+    """
+    with open(path, 'rb') as f:
+        return loads(f.read())
+
+
+def dump_file(path: Path, obj: Any, pretty: bool = True, sort_keys: bool = False) -> None:
+    """
+    Serialize to a JSON file (written in place)
+
+    Args:
+        path: Target file
+        obj: Value to serialize
+        pretty: Indent with two spaces (False for compact output)
+        sort_keys: Sort object keys
+
+    Raises:
+        OSError: If the file cannot be written
+        TypeError: If obj contains values JSON cannot represent
+    """
+    data = dumpb(obj, pretty, sort_keys)
+    with open(path, 'wb') as f:
+        f.write(data)
@@ -4,6 +4,7 @@ Logging system for CulturaBuilder installation suite
 
 import logging
 import sys
+import threading
 from datetime import datetime
 from pathlib import Path
 from typing import Optional, Dict, Any
@@ -39,6 +40,8 @@ class Logger:
         self.console_level = console_level
         self.file_level = file_level
         self.session_start = datetime.now()
+        # Guards the formatter swap in success(), which worker threads may call concurrently
+        self._format_lock = threading.Lock()
         
         # Create logger
         self.logger = logging.getLogger(name)
@@ -174,14 +177,16 @@ class Logger:
         if self.logger.handlers:
             console_handler = self.logger.handlers[0]
             if hasattr(console_handler, 'formatter'):
-                original_format = console_handler.formatter.format
-                
                 def success_format(record):
                     return f"{Colors.GREEN}[✓] {record.getMessage()}{Colors.RESET}"
                 
-                console_handler.formatter.format = success_format
-                self.logger.info(message, **kwargs)
-                console_handler.formatter.format = original_format
+                with self._format_lock:
+                    original_format = console_handler.formatter.format
+                    console_handler.formatter.format = success_format
+                    try:
+                        self.logger.info(message, **kwargs)
+                    finally:
+                        console_handler.formatter.format = original_format
             else:
                 self.logger.info(f"SUCCESS: {message}", **kwargs)
         else:
@@ -0,0 +1,259 @@
+"""
+MCP server startup probe for CulturaBuilder installation system
+Spawns a server, performs the stdio JSON-RPC handshake and measures how long it takes
+"""
+
+import json
+import os
+import queue
+import signal
+import subprocess
+import sys
+import threading
+import time
+from collections import deque
+from typing import Any, Dict, List, Optional
+
+try:
+    import psutil
+    PSUTIL_AVAILABLE = True
+except ImportError:
+    PSUTIL_AVAILABLE = False
+
+PROTOCOL_VERSION = "2024-11-05"
+
+
+def process_tree_rss(pid: int) -> Optional[int]:
+    """
+    Resident memory of a process and all its descendants
+
+    Launchers such as npx run the server as a child process, so the whole
+    tree is counted.
+
+    Args:
+        pid: Root process id
+
+    Returns:
+        Bytes, or None if memory cannot be read on this platform
+    """
+    if PSUTIL_AVAILABLE:
+        try:
+            root = psutil.Process(pid)
+            processes = [root] + root.children(recursive=True)
+        except psutil.Error:
+            return None
+        total = 0
+        for process in processes:
+            try:
+                total += process.memory_info().rss
+            except psutil.Error:
+                pass  # Exited while being measured
+        return total
+
+    if not os.path.isdir("/proc"):
+        return None
+
+    # Linux without psutil: walk /proc for the process tree
+    children: Dict[int, List[int]] = {}
+    for entry in os.listdir("/proc"):
+        if not entry.isdigit():
+            continue
+        try:
+            with open(f"/proc/{entry}/stat", "rb") as stat_file:
+                stat = stat_file.read()
+        except OSError:
+            continue
+        # Fields after the parenthesised command name: state, ppid, ...
+        fields = stat[stat.rfind(b")") + 2:].split()
+        children.setdefault(int(fields[1]), []).append(int(entry))
+
+    page_size = os.sysconf("SC_PAGE_SIZE")
+    total = 0
+    found = False
+    pending = [pid]
+    while pending:
+        current = pending.pop()
+        pending.extend(children.get(current, []))
+        try:
+            with open(f"/proc/{current}/statm") as statm_file:
+                total += int(statm_file.read().split()[1]) * page_size
+            found = True
+        except (OSError, ValueError, IndexError):
+            pass
+    return total if found else None
+
+
+class MCPProbe:
+    """
+    One timed MCP server start
+
+    Measures spawn-to-ready (until the `initialize` response arrives), the
+    latency of the first `tools/list` request and the resident memory of the
+    server's process tree once it has answered.
+    """
+
+    def __init__(self, command: List[str], env: Optional[Dict[str, str]] = None, timeout: float = 60.0):
+        """
+        Initialize probe
+
+        Args:
+            command: Command that starts the server
+            env: Environment for the server (defaults to the current one)
+            timeout: Seconds the whole probe may take
+        """
+        self.command = command
+        self.env = env
+        self.timeout = timeout
+        self._messages: "queue.Queue[Optional[Dict[str, Any]]]" = queue.Queue()
+        self._stderr: deque = deque(maxlen=20)
+
+    def run(self) -> Dict[str, Any]:
+        """
+        Start the server, complete the handshake and stop it again
+
+        Returns:
+            Dict with status (ok, failed or timeout), spawn_to_ready,
+            tools_list_latency (seconds), tools_count, rss_bytes,
+            server_info and error
+        """
+        result: Dict[str, Any] = {
+            "status": "failed",
+            "spawn_to_ready": None,
+            "tools_list_latency": None,
+            "tools_count": None,
+            "rss_bytes": None,
+            "server_info": None,
+            "error": None
+        }
+
+        start = time.perf_counter()
+        end = start + self.timeout
+        try:
+            process = subprocess.Popen(
+                self.command,
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                env=self.env,
+                shell=(sys.platform == "win32"),
+                # Own process group, so stopping it also stops launcher children
+                start_new_session=(sys.platform != "win32")
+            )
+        except OSError as e:
+            result["error"] = str(e)
+            return result
+
+        threading.Thread(target=self._read_stdout, args=(process,), daemon=True).start()
+        threading.Thread(target=self._read_stderr, args=(process,), daemon=True).start()
+
+        try:
+            initialize = self._request(process, 1, "initialize", {
+                "protocolVersion": PROTOCOL_VERSION,
+                "capabilities": {},
+                "clientInfo": {"name": "culturabuilder-bench", "version": "3.0.0"}
+            }, end)
+            result["spawn_to_ready"] = time.perf_counter() - start
+            result["server_info"] = initialize.get("serverInfo")
+            self._send(process, {"jsonrpc": "2.0", "method": "notifications/initialized"})
+
+            tools_start = time.perf_counter()
+            tools = self._request(process, 2, "tools/list", {}, end)
+            result["tools_list_latency"] = time.perf_counter() - tools_start
+            result["tools_count"] = len(tools.get("tools", []))
+            result["rss_bytes"] = process_tree_rss(process.pid)
+            result["status"] = "ok"
+        except TimeoutError as e:
+            result["status"] = "timeout"
+            result["error"] = str(e)
+        except RuntimeError as e:
+            result["error"] = str(e)
+        finally:
+            self._stop(process)
+
+        if result["status"] != "ok" and self._stderr:
+            result["error"] = f"{result['error']} ({self._stderr[-1]})"
+        return result
+
+    def _request(self, process: subprocess.Popen, request_id: int, method: str,
+                 params: Dict[str, Any], end: float) -> Dict[str, Any]:
+        """Send a request and wait for its result, skipping unrelated messages"""
+        self._send(process, {"jsonrpc": "2.0", "id": request_id, "method": method, "params": params})
+        while True:
+            remaining = end - time.perf_counter()
+            if remaining <= 0:
+                raise TimeoutError(f"No {method} response within {self.timeout:.0f}s")
+            try:
+                message = self._messages.get(timeout=remaining)
+            except queue.Empty:
+                raise TimeoutError(f"No {method} response within {self.timeout:.0f}s")
+            if message is None:
+                raise RuntimeError(f"Server exited with status {process.wait()} before answering {method}")
+            if message.get("id") != request_id:
+                continue  # Notifications or server-initiated requests
+            if "error" in message:
+                raise RuntimeError(f"{method} failed: {message['error'].get('message', message['error'])}")
+            return message.get("result") or {}
+
+    @staticmethod
+    def _send(process: subprocess.Popen, message: Dict[str, Any]) -> None:
+        """Write one JSON-RPC message to the server"""
+        try:
+            process.stdin.write((json.dumps(message) + "\n").encode("utf-8"))
+            process.stdin.flush()
+        except OSError:
+            pass  # Server already gone; reported when its response never arrives
+
+    def _read_stdout(self, process: subprocess.Popen) -> None:
+        """Queue JSON-RPC messages from the server (reader thread)"""
+        for line in process.stdout:
+            try:
+                message = json.loads(line)
+            except ValueError:
+                continue  # Log output on stdout is not part of the protocol
+            if isinstance(message, dict):
+                self._messages.put(message)
+        self._messages.put(None)
+
+    def _read_stderr(self, process: subprocess.Popen) -> None:
+        """Keep the last lines of the server's log output (reader thread)"""
+        for line in process.stderr:
+            text = line.decode("utf-8", errors="replace").strip()
+            if text:
+                self._stderr.append(text)
+
+    @staticmethod
+    def _stop(process: subprocess.Popen) -> None:
+        """Close stdin (the MCP way to stop a stdio server), then kill what is left"""
+        try:
+            process.stdin.close()
+        except OSError:
+            pass
+        try:
+            process.wait(timeout=2)
+        except subprocess.TimeoutExpired:
+            pass
+        if sys.platform == "win32":
+            if process.poll() is None:
+                process.kill()
+        else:
+            try:
+                os.killpg(process.pid, signal.SIGKILL)
+            except OSError:
+                pass
+        process.wait()
+
+
+def probe_mcp_server(command: List[str], env: Optional[Dict[str, str]] = None,
+                     timeout: float = 60.0) -> Dict[str, Any]:
+    """
+    Start an MCP server once and measure its handshake (see MCPProbe.run)
+
+    Args:
+        command: Command that starts the server
+        env: Environment for the server (defaults to the current one)
+        timeout: Seconds the whole probe may take
+
+    Returns:
+        Probe result dict
+    """
+    return MCPProbe(command, env, timeout).run()
@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+Minimal MCP server speaking JSON-RPC over stdio
+Stands in for real MCP servers when benchmarking or testing without node or network
+
+Usage:
+    python setup/utils/mcp_stub_server.py [--startup-delay SECONDS] [--tools N] [--name NAME]
+
+Implements initialize, ping, tools/list and tools/call (every tool echoes its
+arguments). Only the standard library is used, so the file can be run
+directly by path.
+"""
+
+import argparse
+import json
+import sys
+import time
+from typing import Any, Dict, List, Optional
+
+PROTOCOL_VERSION = "2024-11-05"
+
+
+def make_tools(count: int) -> List[Dict[str, Any]]:
+    """Tool definitions advertised by the stub"""
+    return [
+        {
+            "name": f"echo_{index}" if index else "echo",
+            "description": "Return the arguments unchanged",
+            "inputSchema": {"type": "object", "properties": {"text": {"type": "string"}}}
+        }
+        for index in range(count)
+    ]
+
+
+def handle(message: Dict[str, Any], name: str, tools: List[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+    """
+    Answer one JSON-RPC message
+
+    Args:
+        message: Parsed request or notification
+        name: Server name reported by initialize
+        tools: Tool definitions
+
+    Returns:
+        Response object, or None for notifications
+    """
+    if "id" not in message:
+        return None  # Notifications (e.g. notifications/initialized) get no response
+
+    method = message.get("method")
+    if method == "initialize":
+        requested = message.get("params", {}).get("protocolVersion", PROTOCOL_VERSION)
+        result: Dict[str, Any] = {
+            "protocolVersion": requested,
+            "capabilities": {"tools": {"listChanged": False}},
+            "serverInfo": {"name": name, "version": "1.0.0"}
+        }
+    elif method == "ping":
+        result = {}
+    elif method == "tools/list":
+        result = {"tools": tools}
+    elif method == "tools/call":
+        arguments = message.get("params", {}).get("arguments", {})
+        result = {"content": [{"type": "text", "text": json.dumps(arguments)}]}
+    else:
+        return {"jsonrpc": "2.0", "id": message["id"],
+                "error": {"code": -32601, "message": f"Method not found: {method}"}}
+
+    return {"jsonrpc": "2.0", "id": message["id"], "result": result}
+
+
+def serve(name: str, tool_count: int) -> None:
+    """Serve requests from stdin until it is closed"""
+    tools = make_tools(tool_count)
+    for line in sys.stdin:
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            message = json.loads(line)
+        except ValueError:
+            response: Optional[Dict[str, Any]] = {
+                "jsonrpc": "2.0", "id": None, "error": {"code": -32700, "message": "Parse error"}
+            }
+        else:
+            response = handle(message, name, tools) if isinstance(message, dict) else None
+        if response is not None:
+            sys.stdout.write(json.dumps(response) + "\n")
+            sys.stdout.flush()
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Minimal MCP server speaking JSON-RPC over stdio")
+    parser.add_argument("--startup-delay", type=float, default=0.0,
+                        help="Seconds to wait before serving, simulating a slow start (default: 0)")
+    parser.add_argument("--tools", type=int, default=1, help="Number of tools to advertise (default: 1)")
+    parser.add_argument("--name", default="culturabuilder-stub", help="Server name reported by initialize")
+    args = parser.parse_args()
+
+    if args.startup_delay > 0:
+        time.sleep(args.startup_delay)
+    print(f"{args.name} running on stdio", file=sys.stderr, flush=True)
+    serve(args.name, args.tools)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
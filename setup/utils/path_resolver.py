@@ -0,0 +1,168 @@
+"""
+In-process executable lookup for CulturaBuilder installation system
+Resolves commands against PATH like shutil.which, listing each PATH directory once
+"""
+
+import os
+import shutil
+import sys
+import threading
+from typing import Dict, FrozenSet, Iterable, List, Optional, Tuple
+
+
+class PathResolver:
+    """
+    Finds executables on PATH without spawning `which` or `where`
+
+    Each PATH directory is listed once and the listing reused while the
+    directory's modification time is unchanged (installing or removing a
+    tool changes it), so resolving many tools costs one pass over PATH.
+    Matches follow shutil.which: the first PATH entry wins, candidates must
+    be executable files, and PATHEXT applies on Windows.
+    """
+
+    # Directory listings shared by all resolvers: dir -> (mtime_ns, names)
+    _listings: Dict[str, Tuple[int, FrozenSet[str]]] = {}
+    _listings_lock = threading.Lock()
+
+    def __init__(self, path: Optional[str] = None):
+        """
+        Initialize PATH resolver
+
+        Args:
+            path: Search path (defaults to the PATH environment variable)
+        """
+        self.path = os.environ.get("PATH", os.defpath) if path is None else path
+        self.directories = self._split_path(self.path)
+        if sys.platform == "win32":
+            pathext = os.environ.get("PATHEXT", ".COM;.EXE;.BAT;.CMD")
+            self.extensions = [ext.lower() for ext in pathext.split(os.pathsep) if ext]
+        else:
+            self.extensions = []
+
+    def resolve(self, command: str) -> Optional[str]:
+        """
+        Find the executable a command name runs
+
+        Args:
+            command: Command name (or path)
+
+        Returns:
+            Full path of the executable or None if it is not on PATH
+        """
+        return self.resolve_all([command])[command]
+
+    def resolve_all(self, commands: Iterable[str]) -> Dict[str, Optional[str]]:
+        """
+        Find the executables of several commands in one pass over PATH
+
+        Args:
+            commands: Command names (or paths)
+
+        Returns:
+            Dict of command -> full path, or None if it is not on PATH
+        """
+        results: Dict[str, Optional[str]] = {}
+        wanted: Dict[str, List[str]] = {}
+        for command in commands:
+            if os.path.dirname(command):
+                # Paths are checked directly, without searching PATH
+                results[command] = shutil.which(command)
+            else:
+                results[command] = None
+                wanted[command] = self._candidates(command)
+
+        for directory in self.directories:
+            if not wanted:
+                break
+            names = self._listing(directory)
+            if not names:
+                continue
+            for command in list(wanted):
+                for candidate in wanted[command]:
+                    if self._normalize(candidate) not in names:
+                        continue
+                    full_path = os.path.join(directory, candidate)
+                    if os.path.isfile(full_path) and os.access(full_path, os.X_OK):
+                        results[command] = full_path
+                        del wanted[command]
+                        break
+        return results
+
+    @classmethod
+    def clear_cache(cls) -> None:
+        """Forget all directory listings"""
+        with cls._listings_lock:
+            cls._listings.clear()
+
+    def _candidates(self, command: str) -> List[str]:
+        """File names a command may be stored under"""
+        if not self.extensions or any(command.lower().endswith(ext) for ext in self.extensions):
+            return [command]
+        return [command + ext for ext in self.extensions]
+
+    def _listing(self, directory: str) -> FrozenSet[str]:
+        """Names in a PATH directory (empty if it cannot be read)"""
+        try:
+            mtime_ns = os.stat(directory).st_mtime_ns
+        except OSError:
+            return frozenset()
+
+        with self._listings_lock:
+            cached = self._listings.get(directory)
+        if cached is not None and cached[0] == mtime_ns:
+            return cached[1]
+
+        try:
+            names = frozenset(self._normalize(name) for name in os.listdir(directory))
+        except OSError:
+            names = frozenset()
+        with self._listings_lock:
+            self._listings[directory] = (mtime_ns, names)
+        return names
+
+    @staticmethod
+    def _normalize(name: str) -> str:
+        return name.lower() if sys.platform == "win32" else name
+
+    @staticmethod
+    def _split_path(path: str) -> List[str]:
+        """PATH entries in order, without duplicates or empty entries"""
+        directories: List[str] = []
+        seen = set()
+        if sys.platform == "win32":
+            directories.append(os.curdir)  # Windows searches the current directory first
+        for entry in path.split(os.pathsep):
+            if not entry:
+                continue
+            key = os.path.normcase(entry)
+            if key not in seen:
+                seen.add(key)
+                directories.append(entry)
+        return directories
+
+
+def resolve_commands(commands: Iterable[str]) -> Dict[str, Optional[str]]:
+    """
+    Find executables on the current PATH (see PathResolver.resolve_all)
+
+    Args:
+        commands: Command names
+
+    Returns:
+        Dict of command -> full path, or None if it is not on PATH
+    """
+    return PathResolver().resolve_all(commands)
+
+
+def which(command: str) -> Optional[str]:
+    """
+    Find an executable on the current PATH (see PathResolver.resolve)
+
+    Args:
+        command: Command name
+
+    Returns:
+        Full path of the executable or None if it is not on PATH
+    """
+    return PathResolver().resolve(command)
@@ -538,8 +538,10 @@ class SecurityValidator:
             if not is_safe:
                 errors.append(f"Invalid source path {source}: {msg}")
             
-            # Validate target path
-            is_safe, msg = cls.validate_path(target, base_target_dir)
+            # Validate target path (an existing link is replaced, not followed,
+            # so check the directory it lives in rather than what it points to)
+            target_to_check = target.parent if target.is_symlink() else target
+            is_safe, msg = cls.validate_path(target_to_check, base_target_dir)
             if not is_safe:
                 errors.append(f"Invalid target path {target}: {msg}")
             
@@ -0,0 +1,312 @@
+"""
+Single-pass directory tree walker for CulturaBuilder installation system
+Built on os.scandir so entry types and stat results come from the directory scan
+"""
+
+import fnmatch
+import os
+import threading
+from pathlib import Path
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+
+class WalkEntry:
+    """A file system entry found while walking a tree"""
+
+    FILE = "file"
+    DIR = "dir"
+    SYMLINK = "symlink"
+    OTHER = "other"
+
+    __slots__ = ("path", "rel_path", "kind", "depth", "_dir_entry", "_stat")
+
+    def __init__(self, path: Path, rel_path: str, kind: str, depth: int,
+                 dir_entry: Optional[os.DirEntry] = None):
+        """
+        Initialize walk entry
+
+        Args:
+            path: Absolute (root-joined) path of the entry
+            rel_path: POSIX-style path relative to the walk root
+            kind: One of FILE, DIR, SYMLINK, OTHER
+            depth: Nesting depth below the root (top-level entries are 0)
+            dir_entry: os.DirEntry the entry came from, used for cached stat
+        """
+        self.path = path
+        self.rel_path = rel_path
+        self.kind = kind
+        self.depth = depth
+        self._dir_entry = dir_entry
+        self._stat: Optional[os.stat_result] = None
+
+    @property
+    def name(self) -> str:
+        return self.path.name
+
+    @property
+    def is_file(self) -> bool:
+        return self.kind == self.FILE
+
+    @property
+    def is_dir(self) -> bool:
+        return self.kind == self.DIR
+
+    @property
+    def is_symlink(self) -> bool:
+        return self.kind == self.SYMLINK
+
+    def stat(self) -> os.stat_result:
+        """
+        Get lstat() result, cached after the first call
+
+        Returns:
+            stat result of the entry itself (links are not followed)
+        """
+        if self._stat is None:
+            if self._dir_entry is not None:
+                self._stat = self._dir_entry.stat(follow_symlinks=False)
+            else:
+                self._stat = os.lstat(self.path)
+        return self._stat
+
+    @property
+    def size(self) -> int:
+        """Size in bytes of the entry itself (0 for directories)"""
+        return 0 if self.kind == self.DIR else self.stat().st_size
+
+    def matches(self, pattern: str, recursive: bool = True) -> bool:
+        """
+        Check the entry against a glob pattern, like Path.rglob()/glob()
+
+        A pattern without a separator is matched against the entry name; one
+        with separators (e.g. "sub/*.md") against the trailing components of
+        the relative path, each component separately.
+
+        Args:
+            pattern: fnmatch-style pattern
+            recursive: False anchors the pattern at the walk root
+
+        Returns:
+            True if the entry matches
+        """
+        parts = pattern_parts(pattern)
+        if len(parts) == 1:
+            return (recursive or self.depth == 0) and fnmatch.fnmatch(self.name, parts[0])
+        rel_parts = self.rel_path.split("/")
+        if len(rel_parts) < len(parts) or (not recursive and len(rel_parts) != len(parts)):
+            return False
+        return all(fnmatch.fnmatch(name, part) for name, part in zip(rel_parts[-len(parts):], parts))
+
+    def __repr__(self) -> str:
+        return f"<WalkEntry({self.kind}: {self.rel_path})>"
+
+
+def pattern_parts(pattern: str) -> List[str]:
+    """Split a glob pattern into its path components"""
+    return [part for part in pattern.replace(os.sep, "/").split("/") if part] or ["*"]
+
+
+EntryFilter = Callable[[WalkEntry], bool]
+
+
+def walk_tree(root: Path,
+              exclude: Optional[EntryFilter] = None,
+              prune: Optional[EntryFilter] = None,
+              include_dirs: bool = True) -> Iterator[WalkEntry]:
+    """
+    Walk a directory tree top-down with one scandir() call per directory
+
+    Symbolic links are reported as SYMLINK entries and never followed.
+    Unreadable directories are skipped silently.
+
+    Args:
+        root: Directory to walk
+        exclude: Predicate; matching entries are not yielded, and excluded
+                 directories are not descended into
+        prune: Predicate; matching directories are yielded but not descended into
+        include_dirs: Whether directory entries are yielded
+
+    Yields:
+        WalkEntry for each entry below root
+    """
+    stack: List[Tuple[Path, str, int]] = [(root, "", 0)]
+    while stack:
+        directory, rel_dir, depth = stack.pop()
+        try:
+            with os.scandir(directory) as scanner:
+                dir_entries = sorted(scanner, key=lambda e: e.name)
+        except OSError:
+            continue
+
+        subdirs = []
+        for dir_entry in dir_entries:
+            rel_path = f"{rel_dir}{dir_entry.name}"
+            try:
+                if dir_entry.is_symlink():
+                    kind = WalkEntry.SYMLINK
+                elif dir_entry.is_dir(follow_symlinks=False):
+                    kind = WalkEntry.DIR
+                elif dir_entry.is_file(follow_symlinks=False):
+                    kind = WalkEntry.FILE
+                else:
+                    kind = WalkEntry.OTHER
+            except OSError:
+                continue
+
+            entry = WalkEntry(directory / dir_entry.name, rel_path, kind, depth, dir_entry)
+            if exclude is not None and exclude(entry):
+                continue
+
+            if kind == WalkEntry.DIR:
+                if include_dirs:
+                    yield entry
+                if prune is None or not prune(entry):
+                    subdirs.append((entry.path, f"{rel_path}/", depth + 1))
+            else:
+                yield entry
+
+        # Reversed so the stack pops subdirectories in name order
+        stack.extend(reversed(subdirs))
+
+
+class TreeSnapshot:
+    """
+    Immutable listing of a tree, captured once and shared by an operation
+
+    Snapshots taken through get() are cached per root until invalidate() is
+    called for a path inside (or above) that root. FileManager invalidates
+    on every change it makes; writes by anything else (settings files, tar
+    restores) are not seen, so an operation takes a fresh snapshot with
+    get(refresh=True) when it starts and reuses it from there.
+    """
+
+    _cache: Dict[str, "TreeSnapshot"] = {}
+    _cache_lock = threading.Lock()
+
+    def __init__(self, root: Path, entries: List[WalkEntry]):
+        """
+        Initialize snapshot
+
+        Args:
+            root: Directory the entries were collected from
+            entries: Entries in walk order
+        """
+        self.root = root
+        self.entries = entries
+        self._by_rel_path = {entry.rel_path: entry for entry in entries}
+
+    @classmethod
+    def capture(cls, root: Path, exclude: Optional[EntryFilter] = None,
+                prune: Optional[EntryFilter] = None) -> "TreeSnapshot":
+        """
+        Walk a tree and record every entry (stat results are fetched eagerly)
+
+        Args:
+            root: Directory to walk
+            exclude: Predicate for entries to leave out
+            prune: Predicate for directories not to descend into
+
+        Returns:
+            New snapshot (not cached)
+        """
+        entries = []
+        for entry in walk_tree(root, exclude=exclude, prune=prune):
+            try:
+                entry.stat()
+            except OSError:
+                continue  # Vanished between scan and stat
+            entry._dir_entry = None
+            entries.append(entry)
+        return cls(root, entries)
+
+    @classmethod
+    def get(cls, root: Path, refresh: bool = False) -> "TreeSnapshot":
+        """
+        Get the cached snapshot of a tree, capturing it on first use
+
+        Args:
+            root: Directory to snapshot
+            refresh: Capture again even if a snapshot is cached
+
+        Returns:
+            Shared snapshot of the full tree
+        """
+        key = os.path.abspath(root)
+        with cls._cache_lock:
+            snapshot = cls._cache.get(key)
+        if snapshot is None or refresh:
+            snapshot = cls.capture(root)
+            with cls._cache_lock:
+                cls._cache[key] = snapshot
+        return snapshot
+
+    @classmethod
+    def invalidate(cls, path: Optional[Path] = None) -> None:
+        """
+        Drop cached snapshots affected by a change
+
+        Args:
+            path: Changed path (None drops every snapshot)
+        """
+        with cls._cache_lock:
+            if path is None:
+                cls._cache.clear()
+                return
+            changed = os.path.abspath(path)
+            for key in list(cls._cache):
+                if changed == key or changed.startswith(key + os.sep) or key.startswith(changed + os.sep):
+                    del cls._cache[key]
+
+    def files(self, include_symlinks: bool = False) -> List[WalkEntry]:
+        """
+        Get file entries
+
+        Args:
+            include_symlinks: Also return symbolic links (e.g. link-mode installs)
+
+        Returns:
+            List of entries
+        """
+        kinds = (WalkEntry.FILE, WalkEntry.SYMLINK) if include_symlinks else (WalkEntry.FILE,)
+        return [entry for entry in self.entries if entry.kind in kinds]
+
+    def directories(self) -> List[WalkEntry]:
+        """Get directory entries"""
+        return [entry for entry in self.entries if entry.kind == WalkEntry.DIR]
+
+    def total_size(self) -> int:
+        """Get total size in bytes of files and links (links count their own size)"""
+        return sum(entry.size for entry in self.entries
+                   if entry.kind in (WalkEntry.FILE, WalkEntry.SYMLINK))
+
+    def find(self, pattern: str = '*', recursive: bool = True) -> List[WalkEntry]:
+        """
+        Find entries matching a glob pattern (see WalkEntry.matches())
+
+        Args:
+            pattern: fnmatch-style pattern applied to entry names, or to
+                     relative paths if it contains a separator
+            recursive: False anchors the pattern at the snapshot root
+
+        Returns:
+            List of matching entries
+        """
+        return [entry for entry in self.entries if entry.matches(pattern, recursive)]
+
+    def lookup(self, rel_path: str) -> Optional[WalkEntry]:
+        """
+        Get the entry at a relative POSIX path
+
+        Args:
+            rel_path: Path relative to the snapshot root
+
+        Returns:
+            Entry or None if not present
+        """
+        return self._by_rel_path.get(rel_path)
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def __iter__(self) -> Iterator[WalkEntry]:
+        return iter(self.entries)